@@ -10,3 +10,40 @@ from dotenv import load_dotenv
 
 load_dotenv()
 BASE_URL = os.getenv("BASE_URL")
+DEFAULT_TIMEOUT = float(os.getenv("DEFAULT_TIMEOUT") or "10")
+CONNECT_TIMEOUT = float(os.getenv("CONNECT_TIMEOUT") or "5")
+ENDPOINT_TIMEOUTS = os.getenv("ENDPOINT_TIMEOUTS", "")
+TEST_DEADLINE_SECONDS = float(os.getenv("TEST_DEADLINE_SECONDS") or "120")
+DEADLINE_REPORT_RATIO = float(os.getenv("DEADLINE_REPORT_RATIO", "0.5"))
+POOL_CONNECTIONS = int(os.getenv("POOL_CONNECTIONS", "10"))
+POOL_MAXSIZE = int(os.getenv("POOL_MAXSIZE", "10"))
+LOG_BODY_MAX_LENGTH = int(os.getenv("LOG_BODY_MAX_LENGTH", "2000"))
+LOG_BODY_MAX_ITEMS = int(os.getenv("LOG_BODY_MAX_ITEMS", "20"))
+JSON_BACKEND = os.getenv("JSON_BACKEND", "json")
+TRAFFIC_LOG_PATH = os.getenv("TRAFFIC_LOG_PATH", "")
+TRAFFIC_LOG_MAX_BYTES = int(os.getenv("TRAFFIC_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+TRAFFIC_LOG_BACKUP_COUNT = int(os.getenv("TRAFFIC_LOG_BACKUP_COUNT", "5"))
+CASSETTE_MODE = os.getenv("CASSETTE_MODE", "off")
+CASSETTE_PATH = os.getenv("CASSETTE_PATH", "cassettes/books_api.json")
+USE_LOCAL_SERVER = os.getenv("USE_LOCAL_SERVER", "false").lower() in ("1", "true", "yes")
+LOCAL_SERVER_PERSIST = os.getenv("LOCAL_SERVER_PERSIST", "false").lower() in ("1", "true", "yes")
+READ_CACHE_ENABLED = os.getenv("READ_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+READ_CACHE_TTL_SECONDS = float(os.getenv("READ_CACHE_TTL_SECONDS", "5"))
+READ_CACHE_MAX_BYTES = int(os.getenv("READ_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+COMPRESSION = os.getenv("COMPRESSION", "off").lower() in ("1", "true", "yes", "on")
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", "65536"))
+PAYLOAD_SEED = int(os.getenv("PAYLOAD_SEED")) if os.getenv("PAYLOAD_SEED") else None
+ID_RANGE_SIZE = int(os.getenv("ID_RANGE_SIZE", "10000"))
+CLEANUP_MAX_WORKERS = int(os.getenv("CLEANUP_MAX_WORKERS", str(POOL_MAXSIZE)))
+BENCHMARK_BASELINE_PATH = os.getenv("BENCHMARK_BASELINE_PATH", "tests/benchmarks/baseline.json")
+BENCHMARK_TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "0.5"))
+BENCHMARK_MIN_SLACK_MS = float(os.getenv("BENCHMARK_MIN_SLACK_MS", "5.0"))
+BENCHMARK_IQR_FACTOR = float(os.getenv("BENCHMARK_IQR_FACTOR", "3"))
+BENCHMARK_ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", "50"))
+BENCHMARK_WARMUP_ROUNDS = int(os.getenv("BENCHMARK_WARMUP_ROUNDS", "5"))
+SLA_SAMPLES = int(os.getenv("SLA_SAMPLES", "20"))
+RETRY_COUNT = int(os.getenv("RETRY_COUNT", "2"))
+RETRY_BACKOFF_SECONDS = float(os.getenv("RETRY_BACKOFF_SECONDS", "0.2"))
+RETRY_MAX_BACKOFF_SECONDS = float(os.getenv("RETRY_MAX_BACKOFF_SECONDS", "2.0"))
+CIRCUIT_BREAKER_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "5"))
+CIRCUIT_BREAKER_RESET_SECONDS = float(os.getenv("CIRCUIT_BREAKER_RESET_SECONDS", "30"))
@@ -2,33 +2,22 @@
 Helpers and fixtures for creating and cleaning up authors test data.
 """
 
-import random
-import uuid
 import pytest
-from utils.request_handler import APIClient
-from config.config import BASE_URL
+from utils.request_handler import get_client
+from utils.async_request_handler import AsyncAPIClient
+from utils.payloads import generate_author_payload
+from utils.id_allocator import IdAllocator, IdRangePartition
 
-client = APIClient(BASE_URL)
+client = get_client()
+async_client = AsyncAPIClient()
 
 @pytest.fixture
 def generate_author_data():
     """Returns the standalone payload generator function for authors."""
     return generate_author_payload
 
-def generate_author_payload(author_id=None, overrides=None):
-    """Creates and returns a fake author payload."""
-    base_data = {
-        "id": author_id or int(uuid.uuid4().int % 100000),
-        "idBook": random.randint(1, 1000),
-        "firstName": f"First{uuid.uuid4().hex[:6]}",
-        "lastName": f"Last{uuid.uuid4().hex[:6]}"
-    }
-    if overrides:
-        base_data.update(overrides)
-    return base_data
-
 @pytest.fixture
-def create_and_cleanup_author():
+def create_and_cleanup_author(cleanup_tracker):
     """
     Creates an author and deletes it after the test.
     Returns a function that takes a payload and posts it.
@@ -41,21 +30,54 @@ def create_and_cleanup_author():
         if response.status_code == 200:
             created_id = response.json().get("id", author_payload.get("id"))
             created_author_ids.append(created_id)
+            cleanup_tracker.track(f"/Authors/{created_id}")
+        else:
+            resync_on_id_conflict(response, author_payload.get("id"))
         return response
 
     yield _create_author
 
-    # Cleanup after test finishes
-    for author_id in created_author_ids:
-        del_resp = client.delete(f"/Authors/{author_id}")
-        assert del_resp.status_code == 200, f"Failed to delete author {author_id}"
+    # Cleanup after test finishes; failed deletes are reported at the end of the session
+    cleanup_tracker.flush(f"/Authors/{author_id}" for author_id in created_author_ids)
 
-def next_available_author_id():
-    """Fetches authors and returns the next available author ID."""
+@pytest.fixture
+def async_create_and_cleanup_author(cleanup_tracker):
+    """
+    Async variant of create_and_cleanup_author for fanning out creations with asyncio.gather.
+    Returns a coroutine function that takes a payload and posts it; all created authors
+    are deleted after the test.
+    """
+    created_author_ids = []
+
+    async def _create_author(author_payload):
+        """Send POST request to create a author and store the ID for later cleanup."""
+        response = await async_client.post("/Authors", data=author_payload)
+        if response.status_code == 200:
+            created_id = response.json().get("id", author_payload.get("id"))
+            created_author_ids.append(created_id)
+            cleanup_tracker.track(f"/Authors/{created_id}")
+        else:
+            resync_on_id_conflict(response, author_payload.get("id"))
+        return response
+
+    yield _create_author
+
+    # Cleanup after test finishes; failed deletes are reported at the end of the session
+    cleanup_tracker.flush(f"/Authors/{author_id}" for author_id in created_author_ids)
+
+def fetch_existing_author_ids():
+    """Fetch the IDs of all existing authors."""
     response = client.get("/Authors")
     assert response.status_code == 200, f"Failed to fetch authors. Got {response.status_code}"
-    authors = response.json()
-    if not authors:
-        return 1
-    max_id = max(author.get("id", 0) for author in authors if isinstance(author, dict))
-    return max_id + 1
+    return [author.get("id", 0) for author in response.json() if isinstance(author, dict)]
+
+author_id_allocator = IdAllocator(IdRangePartition("authors"), fetch_existing_author_ids)
+
+def next_available_author_id():
+    """Reserve the next available author ID; authors are fetched only once per session."""
+    return author_id_allocator.next_id()
+
+def resync_on_id_conflict(response, author_id):
+    """Fetch the existing author IDs again if the API rejected a reserved ID as already in use."""
+    if response.status_code == 400 and "id" in response.json().get("errors", {}):
+        author_id_allocator.resync(conflicting_id=author_id)
@@ -3,13 +3,12 @@ Tests for DELETE /authors and /authors/{id}, covering existing, non-existent, an
 """
 
 import pytest
-from config.config import BASE_URL
 from tests.authors.conftest import next_available_author_id
 from schemas.bad_request_schema import bad_request_schema
 from utils.schema_validator import replace_placeholder, validate_single_object
-from utils.request_handler import APIClient
+from utils.request_handler import get_client
 
-client = APIClient(BASE_URL)
+client = get_client()
 BASE_PATH = "/Authors"
 
 @pytest.mark.xfail(strict=True, reason="Known bug where we get 200 OK when getting an author that has been deleted")
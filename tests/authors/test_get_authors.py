@@ -4,16 +4,17 @@ Includes handling intermittent failures and schema validation.
 """
 
 import pytest
-from config.config import BASE_URL
 from tests.authors.conftest import next_available_author_id
 from schemas.bad_request_schema import bad_request_schema
 from schemas.authors_schema import authors_object_schema
+from utils.lazy_param import LazyParam
 from utils.schema_validator import replace_placeholder, validate_single_object, validate_multiple_objects
-from utils.request_handler import APIClient
+from utils.request_handler import get_client
 
-client = APIClient(BASE_URL)
+client = get_client()
 BASE_PATH = "/Authors"
 
+@pytest.mark.sla(p95_ms=500)
 def test_get_all_authors():
     """
     Test retrieving all authors.
@@ -22,8 +23,23 @@ def test_get_all_authors():
     response = client.get(BASE_PATH)
     assert response.status_code == 200, \
     f"Expected 200 status code but got {response.status_code}"
-    validate_multiple_objects(response.json(), authors_object_schema)
+    validate_multiple_objects(response.json(), authors_object_schema, mode="array", precheck=True)
 
+def test_get_all_authors_streamed():
+    """
+    Test streaming all authors validates each author as it is parsed
+    and reads the whole list.
+    """
+    with client.stream_list(BASE_PATH, schema=authors_object_schema) as streamed:
+        assert streamed.status_code == 200, \
+        f"Expected 200 status code but got {streamed.status_code}"
+        authors = list(streamed)
+    assert streamed.complete, "Streamed list was not read to the end"
+    assert authors, "Expected at least one author in the streamed list"
+    assert streamed.items_read == len(authors), \
+    f"Expected {len(authors)} authors to be counted as read but got {streamed.items_read}"
+
+@pytest.mark.sla(p95_ms=300, samples=20)
 @pytest.mark.parametrize("author_id, expected_status", [(1, 200), (200, 200)])
 def test_get_single_author_parametrized(author_id, expected_status):
     """
@@ -39,7 +55,7 @@ def test_get_single_author_parametrized(author_id, expected_status):
                    reason="Intermittent failure due to unknown reasons ... it feels like we " \
                    "are querying a different DB sometimes, " \
                    "further investigation needed")
-@pytest.mark.parametrize("author_id", [0, next_available_author_id(), -1])
+@pytest.mark.parametrize("author_id", [0, LazyParam(next_available_author_id, "next_available_id"), -1])
 def test_get_single_non_existent_author_parametrized(author_id):
     """
     Test retrieving non-existent authors.
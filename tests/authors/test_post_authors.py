@@ -3,16 +3,16 @@ Tests for POST /authors with valid, invalid, and unavailable IDs.
 Includes tests for data validation and unsupported content types.
 """
 
+import asyncio
 import pytest
-from tests.authors.conftest import next_available_author_id
-from config.config import BASE_URL
+from tests.authors.conftest import next_available_author_id, author_id_allocator
 from schemas.authors_schema import authors_object_schema
 from schemas.bad_request_schema import bad_request_schema
 from schemas.unsupported_media_type_schema import unsupported_media_type_schema
 from utils.schema_validator import replace_placeholder, validate_single_object
-from utils.request_handler import APIClient
+from utils.request_handler import get_client
 
-client = APIClient(BASE_URL)
+client = get_client()
 
 def test_post_available_author_id(generate_author_data, create_and_cleanup_author):
     """
@@ -29,6 +29,23 @@ def test_post_available_author_id(generate_author_data, create_and_cleanup_autho
     f"Expected 200 status code for author creation but got {response.status_code}"
     validate_single_object(response.json(), authors_object_schema)
 
+def test_post_multiple_authors_concurrently(generate_author_data, async_create_and_cleanup_author):
+    """
+    Test creating several authors concurrently.
+    Checks response status, returned IDs, and validates response schemas.
+    """
+    author_payloads = [generate_author_data(author_id=author_id) for author_id in author_id_allocator.reserve(5)]
+
+    async def _create_authors():
+        return await asyncio.gather(*(async_create_and_cleanup_author(payload) for payload in author_payloads))
+
+    for author_payload, response in zip(author_payloads, asyncio.run(_create_authors())):
+        assert response.status_code == 200, \
+        f"Expected 200 status code for author creation but got {response.status_code}"
+        assert response.json()['id'] == author_payload['id'], \
+        f"Expected author ID to be {author_payload['id']} but got {response.json()['id']}"
+        validate_single_object(response.json(), authors_object_schema)
+
 @pytest.mark.xfail(strict=True,
                    reason="Known bug where we get 200 OK when trying to create an author " \
                    "with an unavailable/already used id")
@@ -36,7 +53,7 @@ def test_post_unavailable_author_id(generate_author_data, create_and_cleanup_aut
     """
     Test creating an author with an ID that is already in use.
     """
-    unavailable_author_id = next_available_author_id() - 1
+    unavailable_author_id = author_id_allocator.existing_id()
     author_payload = generate_author_data(author_id=unavailable_author_id)
     response = create_and_cleanup_author(author_payload)
     assert response.status_code == 400, \
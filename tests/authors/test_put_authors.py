@@ -6,14 +6,13 @@ Includes data validation and content-type handling.
 import random
 import pytest
 from tests.authors.conftest import next_available_author_id
-from config.config import BASE_URL
 from schemas.authors_schema import authors_object_schema
 from schemas.bad_request_schema import bad_request_schema
 from schemas.unsupported_media_type_schema import unsupported_media_type_schema
 from utils.schema_validator import replace_placeholder, validate_single_object
-from utils.request_handler import APIClient
+from utils.request_handler import get_client
 
-client = APIClient(BASE_URL)
+client = get_client()
 BASE_PATH = "/Authors"
 
 @pytest.mark.xfail(strict=False,
@@ -21,7 +20,7 @@ BASE_PATH = "/Authors"
                    "reason sometimes the state is persisted and " \
                    "sometimes it is not, further investigation needed")
 @pytest.mark.parametrize("property_to_update, new_value", [
-    ("idBook", random.randint(1, 200)),
+    pytest.param("idBook", random.randint(1, 200), id="idBook-random"),
     ("firstName", "UpdatedFirst"),
     ("lastName", "UpdatedLast")
 ])
@@ -0,0 +1,47 @@
+"""
+Fixtures for measuring endpoint latencies and comparing them with the stored baseline.
+"""
+
+from urllib.parse import urlsplit
+import pytest
+from config import config as api_config
+from utils.benchmark import BenchmarkBaseline, measure
+
+@pytest.fixture(name="benchmark_baseline", scope="session")
+def benchmark_baseline_fixture(pytestconfig):
+    """
+    Return the baseline of the target the benchmarks run against: "local" for the local stand-in
+    server, the host of BASE_URL otherwise. With --benchmark-update-baseline, the results
+    are stored as the new baseline at the end of the session.
+    """
+    target = "local" if pytestconfig.getoption("--local-server") else urlsplit(api_config.BASE_URL).netloc
+    baseline = BenchmarkBaseline(api_config.BENCHMARK_BASELINE_PATH, target,
+                                 tolerance=pytestconfig.getoption("--benchmark-tolerance"))
+    yield baseline
+    if pytestconfig.getoption("--benchmark-update-baseline"):
+        baseline.save()
+
+@pytest.fixture
+def benchmark(benchmark_baseline, pytestconfig, record_property):
+    """
+    Return a function that measures a request and fails the test if it regressed from the baseline.
+    The function takes the benchmark's name and a function sending the request.
+    """
+    def _benchmark(name, send):
+        """Measure the request, record its statistics and compare them with the baseline."""
+        try:
+            stats = measure(send)
+        except ValueError as error:
+            pytest.skip(str(error))
+        for metric, value in stats.items():
+            record_property(metric, value)
+        regressions = benchmark_baseline.compare(name, stats)
+        if pytestconfig.getoption("--benchmark-update-baseline"):
+            return stats
+        assert not regressions, "; ".join(regressions)
+        if not benchmark_baseline.has_baseline(name):
+            pytest.skip(f"No {benchmark_baseline.target} baseline for {name}; "
+                        "store one with --benchmark-update-baseline")
+        return stats
+
+    return _benchmark
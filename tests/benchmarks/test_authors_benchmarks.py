@@ -0,0 +1,39 @@
+"""
+Benchmarks of the Authors endpoints: latency statistics compared with the stored baseline.
+"""
+
+import pytest
+from tests.authors.conftest import author_id_allocator
+from utils.payloads import generate_author_payload
+from utils.request_handler import get_client
+
+pytestmark = pytest.mark.benchmark
+
+BASE_PATH = "/Authors"
+client = get_client()
+
+def test_benchmark_get_authors(benchmark):
+    """Benchmark listing all authors."""
+    benchmark(f"GET {BASE_PATH}", lambda: client.send("GET", BASE_PATH, cache=False))
+
+def test_benchmark_get_single_author(benchmark):
+    """Benchmark fetching an existing author by ID."""
+    author_id = author_id_allocator.existing_id()
+    benchmark(f"GET {BASE_PATH}/{{id}}", lambda: client.send("GET", f"{BASE_PATH}/{author_id}", cache=False))
+
+def test_benchmark_post_author(benchmark, cleanup_tracker):
+    """Benchmark creating authors; the created authors are deleted after the test."""
+    created_paths = []
+
+    def _create_author():
+        """Create a author with the next available ID and track it for cleanup."""
+        author_id = author_id_allocator.next_id()
+        response = client.send("POST", BASE_PATH, json=generate_author_payload(author_id))
+        created_paths.append(f"{BASE_PATH}/{author_id}")
+        cleanup_tracker.track(created_paths[-1])
+        return response
+
+    try:
+        benchmark(f"POST {BASE_PATH}", _create_author)
+    finally:
+        cleanup_tracker.flush(created_paths)
@@ -0,0 +1,39 @@
+"""
+Benchmarks of the Books endpoints: latency statistics compared with the stored baseline.
+"""
+
+import pytest
+from tests.books.conftest import book_id_allocator
+from utils.payloads import generate_book_payload
+from utils.request_handler import get_client
+
+pytestmark = pytest.mark.benchmark
+
+BASE_PATH = "/Books"
+client = get_client()
+
+def test_benchmark_get_books(benchmark):
+    """Benchmark listing all books."""
+    benchmark(f"GET {BASE_PATH}", lambda: client.send("GET", BASE_PATH, cache=False))
+
+def test_benchmark_get_single_book(benchmark):
+    """Benchmark fetching an existing book by ID."""
+    book_id = book_id_allocator.existing_id()
+    benchmark(f"GET {BASE_PATH}/{{id}}", lambda: client.send("GET", f"{BASE_PATH}/{book_id}", cache=False))
+
+def test_benchmark_post_book(benchmark, cleanup_tracker):
+    """Benchmark creating books; the created books are deleted after the test."""
+    created_paths = []
+
+    def _create_book():
+        """Create a book with the next available ID and track it for cleanup."""
+        book_id = book_id_allocator.next_id()
+        response = client.send("POST", BASE_PATH, json=generate_book_payload(book_id))
+        created_paths.append(f"{BASE_PATH}/{book_id}")
+        cleanup_tracker.track(created_paths[-1])
+        return response
+
+    try:
+        benchmark(f"POST {BASE_PATH}", _create_book)
+    finally:
+        cleanup_tracker.flush(created_paths)
@@ -2,38 +2,24 @@
 Helpers and fixtures for creating and cleaning up books test data.
 """
 
-import random
-import uuid
-from datetime import datetime
 import pytest
-from utils.request_handler import APIClient
-from config.config import BASE_URL
+from utils.request_handler import get_client
+from utils.async_request_handler import AsyncAPIClient
+from utils.payloads import generate_book_payload
+from utils.id_allocator import IdAllocator, IdRangePartition
 
-client = APIClient(BASE_URL)
+client = get_client()
+async_client = AsyncAPIClient()
 
 @pytest.fixture
 def generate_book_data():
     """Return a function to generate book payloads for tests."""
     return generate_book_payload
 
-def generate_book_payload(book_id=None, overrides=None):
-    """Generate book data payload with optional ID and overrides."""
-    base_data = {
-        "id": book_id or int(uuid.uuid4().int % 100000),
-        "title": f"Book Title {uuid.uuid4().hex[:6]}",
-        "description": f"Description {uuid.uuid4().hex[:10]}",
-        "pageCount": random.randint(50, 1000),
-        "excerpt": f"Excerpt text {uuid.uuid4().hex[:8]}",
-        "publishDate": datetime.now().isoformat() + "Z",
-    }
-    if overrides:
-        base_data.update(overrides)
-    return base_data
-
 @pytest.fixture
-def create_and_cleanup_book():
+def create_and_cleanup_book(cleanup_tracker):
     """
-    Fixture to create a book before a test and delete it after.
+    Fixture to create a book before a test and delete it after, concurrently with the other books it created.
     Returns the response from the creation call.
     """
     created_book_ids = []
@@ -44,21 +30,54 @@ def create_and_cleanup_book():
         if response.status_code == 200:
             created_id = response.json().get("id", book_payload.get("id"))
             created_book_ids.append(created_id)
+            cleanup_tracker.track(f"/Books/{created_id}")
+        else:
+            resync_on_id_conflict(response, book_payload.get("id"))
         return response
 
     yield _create_book
 
-    # Cleanup after test finishes
-    for book_id in created_book_ids:
-        del_resp = client.delete(f"/Books/{book_id}")
-        assert del_resp.status_code == 200, f"Failed to delete book {book_id}"
+    # Cleanup after test finishes; failed deletes are reported at the end of the session
+    cleanup_tracker.flush(f"/Books/{book_id}" for book_id in created_book_ids)
 
-def next_available_book_id():
-    """Get the next available book ID by fetching existing books."""
+@pytest.fixture
+def async_create_and_cleanup_book(cleanup_tracker):
+    """
+    Async variant of create_and_cleanup_book for fanning out creations with asyncio.gather.
+    Returns a coroutine function that takes a payload and posts it; all created books
+    are deleted after the test.
+    """
+    created_book_ids = []
+
+    async def _create_book(book_payload):
+        """Send POST request to create a book and store the ID for later cleanup."""
+        response = await async_client.post("/Books", data=book_payload)
+        if response.status_code == 200:
+            created_id = response.json().get("id", book_payload.get("id"))
+            created_book_ids.append(created_id)
+            cleanup_tracker.track(f"/Books/{created_id}")
+        else:
+            resync_on_id_conflict(response, book_payload.get("id"))
+        return response
+
+    yield _create_book
+
+    # Cleanup after test finishes; failed deletes are reported at the end of the session
+    cleanup_tracker.flush(f"/Books/{book_id}" for book_id in created_book_ids)
+
+def fetch_existing_book_ids():
+    """Fetch the IDs of all existing books."""
     response = client.get("/Books")
     assert response.status_code == 200, f"Failed to fetch books. Got {response.status_code}"
-    books = response.json()
-    if not books:
-        return 1
-    max_id = max(book.get("id", 0) for book in books if isinstance(book, dict))
-    return max_id + 1
+    return [book.get("id", 0) for book in response.json() if isinstance(book, dict)]
+
+book_id_allocator = IdAllocator(IdRangePartition("books"), fetch_existing_book_ids)
+
+def next_available_book_id():
+    """Reserve the next available book ID; books are fetched only once per session."""
+    return book_id_allocator.next_id()
+
+def resync_on_id_conflict(response, book_id):
+    """Fetch the existing book IDs again if the API rejected a reserved ID as already in use."""
+    if response.status_code == 400 and "id" in response.json().get("errors", {}):
+        book_id_allocator.resync(conflicting_id=book_id)
@@ -0,0 +1,36 @@
+"""
+Tests for recording books tests to a cassette and replaying one of them on its own, offline.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+RECORDED_TESTS = "tests/books/test_put_books.py"
+REPLAYED_TEST = "tests/books/test_put_books.py::test_put_book_invalid_content_type"
+
+def _run_pytest(node_id, **env):
+    """
+    Run tests in a separate pytest process with the given environment variables, outside
+    of the pytest-xdist worker this test may run in.
+    """
+    parent_env = {name: value for name, value in os.environ.items() if not name.startswith("PYTEST_XDIST_")}
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", node_id, "-q", "-p", "no:cacheprovider", "-o", "addopts="],
+        cwd=ROOT_DIR, env={**parent_env, **env}, capture_output=True, text=True, timeout=120, check=False)
+
+def test_replay_recorded_book_creation(tmp_path):
+    """
+    Test a test recorded against the local server after others passes when replayed alone, with fresh
+    random payloads, although the IDs reserved before it during recording are not reserved on replay.
+    """
+    cassette_path = str(tmp_path / "cassette.json")
+    recorded = _run_pytest(RECORDED_TESTS, CASSETTE_MODE="record", CASSETTE_PATH=cassette_path,
+                           USE_LOCAL_SERVER="true", PAYLOAD_SEED="")
+    assert recorded.returncode == 0, f"Recording run failed:\n{recorded.stdout}{recorded.stderr}"
+
+    replayed = _run_pytest(REPLAYED_TEST, CASSETTE_MODE="replay", CASSETTE_PATH=cassette_path,
+                           USE_LOCAL_SERVER="false", BASE_URL="http://127.0.0.1:9", PAYLOAD_SEED="")
+    assert replayed.returncode == 0, f"Replay run failed:\n{replayed.stdout}{replayed.stderr}"
+    assert "1 passed" in replayed.stdout, f"Expected the replayed test to pass but got:\n{replayed.stdout}"
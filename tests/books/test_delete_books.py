@@ -4,12 +4,11 @@ Tests for DELETE /books and /books/{id}, covering existing, non-existent, and in
 
 import pytest
 from tests.books.conftest import next_available_book_id
-from config.config import BASE_URL
 from schemas.bad_request_schema import bad_request_schema
 from utils.schema_validator import replace_placeholder, validate_single_object
-from utils.request_handler import APIClient
+from utils.request_handler import get_client
 
-client = APIClient(BASE_URL)
+client = get_client()
 BASE_PATH = "/Books"
 
 @pytest.mark.xfail(strict=True, reason="Known bug where we get 200 OK when getting a book that has been deleted")
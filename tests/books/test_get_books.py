@@ -5,22 +5,38 @@ Includes handling intermittent failures and schema validation.
 
 import pytest
 from tests.books.conftest import next_available_book_id
-from config.config import BASE_URL
 from schemas.books_schema import books_object_schema
 from schemas.bad_request_schema import bad_request_schema
+from utils.lazy_param import LazyParam
 from utils.schema_validator import replace_placeholder, validate_single_object, validate_multiple_objects
-from utils.request_handler import APIClient
+from utils.request_handler import get_client
 
-client = APIClient(BASE_URL)
+client = get_client()
 BASE_PATH = "/Books"
 
+@pytest.mark.sla(p95_ms=500)
 def test_get_all_books():
     """Test fetching all books returns status 200 and validates response schema."""
     response = client.get(BASE_PATH)
     assert response.status_code == 200, \
     f"Expected 200 status code but got {response.status_code}"
-    validate_multiple_objects(response.json(), books_object_schema)
+    validate_multiple_objects(response.json(), books_object_schema, mode="array", precheck=True)
 
+def test_get_all_books_streamed():
+    """
+    Test streaming all books validates each book as it is parsed
+    and reads the whole list.
+    """
+    with client.stream_list(BASE_PATH, schema=books_object_schema) as streamed:
+        assert streamed.status_code == 200, \
+        f"Expected 200 status code but got {streamed.status_code}"
+        books = list(streamed)
+    assert streamed.complete, "Streamed list was not read to the end"
+    assert books, "Expected at least one book in the streamed list"
+    assert streamed.items_read == len(books), \
+    f"Expected {len(books)} books to be counted as read but got {streamed.items_read}"
+
+@pytest.mark.sla(p95_ms=300, samples=20)
 @pytest.mark.parametrize("book_id, expected_status", [(1, 200), (200, 200)])
 def test_get_single_book_parametrized(book_id, expected_status):
     """
@@ -32,7 +48,7 @@ def test_get_single_book_parametrized(book_id, expected_status):
     f"Expected {expected_status} status code for book_id={book_id} but got {response.status_code}"
     validate_single_object(response.json(), books_object_schema)
 
-@pytest.mark.parametrize("book_id", [0, next_available_book_id(), -1])
+@pytest.mark.parametrize("book_id", [0, LazyParam(next_available_book_id, "next_available_id"), -1])
 def test_get_single_non_existent_book_parametrized(book_id):
     """
     Test fetching non-existent books are not found.
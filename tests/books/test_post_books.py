@@ -3,16 +3,16 @@ Tests for POST /books with valid, invalid, and unavailable IDs.
 Includes tests for data validation and unsupported content types.
 """
 
+import asyncio
 import pytest
-from tests.books.conftest import next_available_book_id
-from config.config import BASE_URL
+from tests.books.conftest import next_available_book_id, book_id_allocator
 from schemas.books_schema import books_object_schema
 from schemas.bad_request_schema import bad_request_schema
 from schemas.unsupported_media_type_schema import unsupported_media_type_schema
 from utils.schema_validator import replace_placeholder, validate_single_object
-from utils.request_handler import APIClient
+from utils.request_handler import get_client
 
-client = APIClient(BASE_URL)
+client = get_client()
 
 def test_post_available_book_id(generate_book_data, create_and_cleanup_book):
     """Test creating a book with an available ID succeeds with status 200 and validates response schema."""
@@ -25,12 +25,26 @@ def test_post_available_book_id(generate_book_data, create_and_cleanup_book):
     f"Expected 200 status code for book creation but got {response.status_code}"
     validate_single_object(response.json(), books_object_schema)
 
+def test_post_multiple_books_concurrently(generate_book_data, async_create_and_cleanup_book):
+    """Test creating several books concurrently succeeds for each of them and validates response schemas."""
+    book_payloads = [generate_book_data(book_id=book_id) for book_id in book_id_allocator.reserve(5)]
+
+    async def _create_books():
+        return await asyncio.gather(*(async_create_and_cleanup_book(payload) for payload in book_payloads))
+
+    for book_payload, response in zip(book_payloads, asyncio.run(_create_books())):
+        assert response.status_code == 200, \
+        f"Expected 200 status code for book creation but got {response.status_code}"
+        assert response.json()['id'] == book_payload['id'], \
+        f"Expected book ID to be {book_payload['id']} but got {response.json()['id']}"
+        validate_single_object(response.json(), books_object_schema)
+
 @pytest.mark.xfail(strict=True,
                    reason="Known bug where we get 200 OK when trying to create a book " \
                    "with an unavailable/already used id")
 def test_post_unavailable_book_id(generate_book_data, create_and_cleanup_book):
     """Test creating a book with an unavailable/used ID returns 400 status code (expected failure)."""
-    unavailable_book_id = next_available_book_id() - 1
+    unavailable_book_id = book_id_allocator.existing_id()
     book_payload = generate_book_data(book_id=unavailable_book_id)
     response = create_and_cleanup_book(book_payload)
     assert response.status_code == 400, \
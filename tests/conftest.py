@@ -0,0 +1,325 @@
+"""
+Session-wide hooks and fixtures shared by the Books and Authors test suites.
+"""
+
+import html
+import pytest
+from pytest_html import extras as html_extras
+from config import config as api_config
+from utils.cleanup import CleanupTracker
+from utils.id_allocator import remove_shared_state_dir, seed_id_allocators, worker_paths
+from utils.lazy_param import LazyParam, resolve_lazy_params
+from utils.local_server import LocalBookstoreServer
+from utils.logger import default_api_logger
+from utils.payloads import seed_payloads
+from utils.request_handler import default_cassette, default_client_registry, get_client
+from utils.sla import check_sla, sample_latencies, sla_budgets
+from utils.stats import RequestTiming, TimingRecorder, default_timing_recorder
+from utils.timeouts import Deadline, deadline_scope
+
+connection_stats_key = pytest.StashKey[dict]()
+cache_stats_key = pytest.StashKey[dict]()
+local_server_key = pytest.StashKey[LocalBookstoreServer]()
+cleanup_leftovers_key = pytest.StashKey[dict]()
+deadline_key = pytest.StashKey[Deadline]()
+test_run_uid_key = pytest.StashKey[str]()
+session_timings = TimingRecorder()
+deadline_usage = {}
+
+def pytest_addoption(parser):
+    """Register the options running the suite against the local stand-in server and running the benchmarks."""
+    parser.addoption("--local-server", action="store_true", default=api_config.USE_LOCAL_SERVER,
+                     help="Run against an in-process stand-in of the Books/Authors API instead of BASE_URL.")
+    parser.addoption("--local-server-persist", action="store_true", default=api_config.LOCAL_SERVER_PERSIST,
+                     help="Make the local stand-in server persist POST/PUT/DELETE like a real CRUD backend.")
+    parser.addoption("--benchmark", action="store_true", default=False,
+                     help="Run the endpoint performance benchmarks (tests/benchmarks), skipped otherwise.")
+    parser.addoption("--benchmark-update-baseline", action="store_true", default=False,
+                     help="Store the benchmark results as the new baseline instead of failing on regressions.")
+    parser.addoption("--no-sla", action="store_true", default=False,
+                     help="Do not check the response-time budgets of tests marked with @pytest.mark.sla.")
+    parser.addoption("--benchmark-tolerance", type=float, default=api_config.BENCHMARK_TOLERANCE,
+                     help="Relative slowdown allowed before a benchmark fails, e.g. 0.5 for 50%%.")
+    parser.addoption("--test-deadline", type=float, default=api_config.TEST_DEADLINE_SECONDS,
+                     help="Seconds each test's requests may take in total, 0 for no deadline. "
+                          "@pytest.mark.deadline(seconds) overrides it for a test.")
+
+def pytest_configure(config):
+    """
+    Start the local stand-in server before collection when requested and point BASE_URL at it.
+    The shared API clients look BASE_URL up on every request, so they follow the redirect.
+    Under pytest-xdist, only the controller starts the server and the workers share it.
+    """
+    if not config.getoption("--local-server"):
+        return
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        api_config.BASE_URL = workerinput["local_server_url"]
+        return
+    server = LocalBookstoreServer(persist_writes=config.getoption("--local-server-persist")).start()
+    config.stash[local_server_key] = server
+    api_config.BASE_URL = server.base_url
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    Point a pytest-xdist worker at the controller's local stand-in server, and remember the
+    run's UID to remove the ID allocators' shared state directory at the end of the session.
+    """
+    node.config.stash[test_run_uid_key] = node.workerinput["testrunuid"]
+    server = node.config.stash.get(local_server_key, None)
+    if server is not None:
+        node.workerinput["local_server_url"] = server.base_url
+
+def pytest_unconfigure(config):
+    """Stop the local stand-in server, if one was started."""
+    server = config.stash.get(local_server_key, None)
+    if server is not None:
+        server.stop()
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks unless --benchmark is given."""
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks run with --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
+
+@pytest.fixture(scope="session")
+def local_server(pytestconfig):
+    """Return the running local stand-in server, skipping tests that need it when it is not in use."""
+    server = pytestconfig.stash.get(local_server_key, None)
+    if server is None and hasattr(pytestconfig, "workerinput") and pytestconfig.getoption("--local-server"):
+        pytest.skip("The local stand-in server runs in the pytest-xdist controller")
+    if server is None:
+        pytest.skip("Requires the local stand-in server (--local-server or USE_LOCAL_SERVER=1)")
+    return server
+
+@pytest.fixture(scope="session")
+def cleanup_tracker(pytestconfig):
+    """
+    Return the session's tracker of created entities. Entities still tracked at the end
+    of the session are deleted then, and those that could not be deleted are reported.
+    """
+    tracker = CleanupTracker(get_client())
+    yield tracker
+    pytestconfig.stash[cleanup_leftovers_key] = tracker.close()
+
+def pytest_make_parametrize_id(config, val, argname):  # pylint: disable=unused-argument
+    """Use the name of a lazy parameter as its test ID, as its value is only known at run time."""
+    return val.name if isinstance(val, LazyParam) else None
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_setup(item):
+    """
+    Resolve the lazy parameters of a test once its fixtures are set up, and record
+    the values in the test report.
+    """
+    funcargs = getattr(item, "funcargs", None)
+    if not funcargs:
+        return
+    resolved = resolve_lazy_params(funcargs)
+    if resolved:
+        item.user_properties.extend(resolved.items())
+        item.add_report_section("setup", "lazy parameters",
+                                "\n".join(f"{argname}={value!r}" for argname, value in resolved.items()))
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_protocol(item, nextitem):  # pylint: disable=unused-argument
+    """
+    Run each test, fixtures included, under its deadline: every request it sends gets at most
+    the time left, and fails with DeadlineExceededError once the budget has run out.
+
+    With PAYLOAD_SEED or a cassette, the payload generators are reseeded from the test ID first,
+    so a test sends the same payloads whether it runs alone or after others. With a cassette,
+    so are the ID allocators, so the test also reserves the same entity IDs.
+    """
+    if api_config.PAYLOAD_SEED is not None or default_cassette is not None:
+        seed_payloads(f"{api_config.PAYLOAD_SEED}:{item.nodeid}")
+    if default_cassette is not None:
+        seed_id_allocators(item.nodeid)
+    marker = item.get_closest_marker("deadline")
+    budget = marker.args[0] if marker else item.config.getoption("--test-deadline")
+    if not budget:
+        return (yield)
+    deadline = item.stash[deadline_key] = Deadline(budget, name=item.nodeid)
+    with deadline_scope(deadline):
+        return (yield)
+
+def pytest_runtest_logstart(nodeid, location):  # pylint: disable=unused-argument
+    """Start collecting the timings of the requests sent by the test."""
+    default_timing_recorder.start_capture()
+
+def pytest_runtest_logfinish(nodeid, location):  # pylint: disable=unused-argument
+    """Stop collecting request timings once the test has finished."""
+    default_timing_recorder.stop_capture()
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Once a test marked with @pytest.mark.sla has passed, re-send each GET request it made
+    and fail it if a latency percentile is over its budget.
+    """
+    result = yield
+    marker = item.get_closest_marker("sla")
+    if marker is None or item.config.getoption("--no-sla"):
+        return result
+    try:
+        budgets, samples = sla_budgets(marker)
+    except ValueError as error:
+        pytest.fail(str(error), pytrace=False)
+    client = get_client()
+    if client.cassette is not None and client.cassette.replaying:
+        return result
+    endpoints = list(dict.fromkeys(timing.endpoint for timing in default_timing_recorder.captured()
+                                   if timing.method == "GET"))
+    if not endpoints:
+        pytest.fail("@pytest.mark.sla is set on a test that sent no GET request", pytrace=False)
+    with deadline_scope(None):
+        breaches, breakdown = check_sla(sample_latencies(client, endpoints, samples), budgets)
+    item.add_report_section("call", "sla", breakdown)
+    if breaches:
+        pytest.fail("Response-time SLA breached: " + "; ".join(breaches) + "\n" + breakdown, pytrace=False)
+    return result
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Attach the timings of the requests sent during each test phase to its report, as
+    report.request_timings (sent to the controller under pytest-xdist) and as an HTML table,
+    and the share of its deadline the test consumed to its teardown report, as report.deadline_usage.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    deadline = item.stash.get(deadline_key, None)
+    if deadline is not None and call.when == "teardown":
+        report.deadline_usage = {"budget": deadline.budget, "elapsed": deadline.elapsed()}
+    timings = default_timing_recorder.take_captured()
+    if timings:
+        report.request_timings = [timing._asdict() for timing in timings]
+        report.extras = getattr(report, "extras", []) + [html_extras.html(_request_timings_table(timings))]
+
+def pytest_runtest_logreport(report):
+    """Add the request timings of a test phase to the session's per-endpoint timings, and its deadline usage."""
+    for timing in getattr(report, "request_timings", ()):
+        session_timings.record(RequestTiming(**timing))
+    usage = getattr(report, "deadline_usage", None)
+    if usage is not None:
+        deadline_usage[report.nodeid] = usage
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):  # pylint: disable=unused-argument
+    """Add the session's per-endpoint request timings to the pytest-html report summary."""
+    rows = session_timings.summary()
+    if rows:
+        postfix.append(_html_table(
+            "Request timings per endpoint",
+            ["Endpoint", "Requests", "Reused", "Mean ms", "p50 ms", "p90 ms", "p99 ms", "Max ms", "TTFB p50 ms",
+             "Wire KB", "Body KB"],
+            [[row["endpoint"], row["requests"], row["reused"]]
+             + [f"{row[column]:.1f}" for column in ("mean_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms", "ttfb_p50_ms")]
+             + [f"{row[column] / 1024:.1f}" for column in ("wire_bytes", "body_bytes")]
+             for row in rows]))
+
+def _request_timings_table(timings):
+    """Render the timings and transfer sizes of a test's requests as an HTML table."""
+    return _html_table(
+        f"Requests: {_transfer_summary(sum(t.wire_bytes for t in timings), sum(t.body_bytes for t in timings))}",
+        ["Method", "Endpoint", "Status", "Elapsed ms", "TTFB ms", "Connection", "Wire bytes", "Body bytes"],
+        [[timing.method, timing.endpoint, timing.status, f"{timing.elapsed * 1000:.1f}",
+          f"{timing.ttfb * 1000:.1f}", "reused" if timing.reused else "new", timing.wire_bytes, timing.body_bytes]
+         for timing in timings])
+
+def _transfer_summary(wire_bytes, body_bytes):
+    """Describe how many response bytes went over the network and how much compression saved."""
+    saved = f", {1 - wire_bytes / body_bytes:.0%} saved by compression" if wire_bytes < body_bytes else ""
+    return f"{wire_bytes / 1024:.1f} KB received for {body_bytes / 1024:.1f} KB of response bodies{saved}"
+
+def _html_table(caption, headers, rows):
+    """Render an HTML table with escaped cells."""
+    head = "".join(f"<th>{html.escape(str(header))}</th>" for header in headers)
+    body = "".join("<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>" for row in rows)
+    return f"<table><caption>{html.escape(caption)}</caption><tr>{head}</tr>{body}</table>"
+
+def pytest_sessionfinish(session, exitstatus):  # pylint: disable=unused-argument
+    """
+    Close the shared API clients and flush the traffic log once the session has finished.
+    Under pytest-xdist, each worker sends its connection reuse and read cache counters and the
+    entities it could not delete to the controller, which adds its own counters to those of the workers,
+    merges the cassettes the workers recorded and removes the directory they shared ID ranges through.
+    """
+    connection_stats = _add_counters(session.config.stash.get(connection_stats_key, {}),
+                                     default_client_registry.connection_stats())
+    cache_stats = _add_counters(session.config.stash.get(cache_stats_key, {}), default_client_registry.cache_stats())
+    session.config.stash[connection_stats_key] = connection_stats
+    session.config.stash[cache_stats_key] = cache_stats
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["connection_stats"] = connection_stats
+        workeroutput["cache_stats"] = cache_stats
+        workeroutput["cleanup_leftovers"] = session.config.stash.get(cleanup_leftovers_key, {})
+    if session.config.pluginmanager.has_plugin("dsession") and default_cassette is not None \
+            and not default_cassette.replaying:
+        default_cassette.merge(worker_paths(default_cassette.path))
+    if test_run_uid_key in session.config.stash:
+        remove_shared_state_dir(session.config.stash[test_run_uid_key])
+    default_client_registry.close_all()
+    default_api_logger.close()
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):  # pylint: disable=unused-argument
+    """
+    Collect the connection reuse and read cache counters and the cleanup leftovers of a
+    pytest-xdist worker into the controller's.
+    """
+    workeroutput = getattr(node, "workeroutput", {})
+    for key, name in ((connection_stats_key, "connection_stats"), (cache_stats_key, "cache_stats")):
+        node.config.stash[key] = _add_counters(node.config.stash.get(key, {}), workeroutput.get(name, {}))
+    leftovers = workeroutput.get("cleanup_leftovers", {})
+    if leftovers:
+        node.config.stash.setdefault(cleanup_leftovers_key, {}).update(leftovers)
+
+def _add_counters(totals, stats):
+    """Return the per-base-URL counters of totals with those of stats added to them."""
+    merged = {base_url: dict(counters) for base_url, counters in totals.items()}
+    for base_url, counters in stats.items():
+        for name, value in counters.items():
+            merged.setdefault(base_url, {})[name] = merged.get(base_url, {}).get(name, 0) + value
+    return merged
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):  # pylint: disable=unused-argument
+    """
+    Report how many requests reused a keep-alive connection for each shared API client and
+    what its read cache saved, the response bytes transferred, the tests that consumed most of their deadline, and the
+    entities the cleanup could not delete.
+    """
+    for base_url, stats in config.stash.get(connection_stats_key, {}).items():
+        if not stats["requests"]:
+            continue
+        terminalreporter.write_line(
+            f"{base_url}: {stats['requests']} requests over {stats['new_connections']} connections "
+            f"({stats['reused_connections']} reused)"
+        )
+    rows = session_timings.summary()
+    if rows:
+        terminalreporter.write_line(_transfer_summary(sum(row["wire_bytes"] for row in rows),
+                                                      sum(row["body_bytes"] for row in rows)))
+    for base_url, stats in config.stash.get(cache_stats_key, {}).items():
+        terminalreporter.write_line(
+            f"{base_url}: read cache {stats['hits']} hits, {stats['revalidated']} revalidated, "
+            f"{stats['misses']} misses, {stats['bytes_saved']} bytes saved, {stats['evictions']} evictions, "
+            f"{stats['invalidations']} invalidations"
+        )
+    heavy = sorted(((usage["elapsed"] / usage["budget"], nodeid, usage) for nodeid, usage in deadline_usage.items()
+                    if usage["elapsed"] >= usage["budget"] * api_config.DEADLINE_REPORT_RATIO), reverse=True)
+    if heavy:
+        terminalreporter.write_sep("=", f"{len(heavy)} tests used over {api_config.DEADLINE_REPORT_RATIO:.0%} "
+                                        "of their deadline", yellow=True)
+        for ratio, nodeid, usage in heavy:
+            terminalreporter.write_line(f"{nodeid}: {usage['elapsed']:.2f}s of {usage['budget']:g}s ({ratio:.0%})")
+    leftovers = config.stash.get(cleanup_leftovers_key, {})
+    if leftovers:
+        terminalreporter.write_sep("=", f"{len(leftovers)} created entities could not be deleted", yellow=True)
+        for path, reason in sorted(leftovers.items()):
+            terminalreporter.write_line(f"{path}: {reason}")
@@ -0,0 +1,119 @@
+"""
+API Response Module
+
+Defines APIResponse, a wrapper around requests.Response that decodes the JSON body
+once and shares it between the logger and the tests, using a configurable JSON backend.
+"""
+
+import json
+import requests
+from config.config import JSON_BACKEND
+
+def _orjson_loads():
+    """
+    Return orjson's loads function.
+
+    Raises:
+        ImportError: If orjson is not installed.
+    """
+    import orjson  # pylint: disable=import-outside-toplevel
+    return orjson.loads  # pylint: disable=no-member
+
+def get_json_loads(backend=JSON_BACKEND):
+    """
+    Return the loads function of a JSON backend.
+
+    Args:
+        backend (str, optional): "json" for the standard library, "orjson" to require orjson,
+            or "auto" to use orjson when it is installed and the standard library otherwise.
+
+    Returns:
+        callable: Function decoding a bytes or str document.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If "orjson" is requested but not installed.
+    """
+    if backend == "json":
+        return json.loads
+    if backend == "orjson":
+        return _orjson_loads()
+    if backend == "auto":
+        try:
+            return _orjson_loads()
+        except ImportError:
+            return json.loads
+    raise ValueError(f"Unknown JSON backend '{backend}', expected 'json', 'orjson' or 'auto'")
+
+_UNSET = object()
+
+class APIResponse:
+    """
+    Wraps a requests.Response and memoizes its parsed JSON body.
+
+    The first json() call decodes the body; every later call, from the logger or from
+    the tests, returns the same object. Parsed bodies are shared and must not be mutated.
+    All other attributes (status_code, headers, content, text, ...) are delegated to
+    the wrapped response.
+
+    Attributes:
+        response (requests.Response): The wrapped response.
+        timing (RequestTiming | None): Timing of the request, None if it was not sent over the network.
+    """
+
+    def __init__(self, response, loads=None, timing=None):
+        """
+        Initialize the wrapper.
+
+        Args:
+            response (requests.Response): The response to wrap.
+            loads (callable, optional): JSON decoding function. Defaults to the configured backend.
+            timing (RequestTiming, optional): Timing of the request.
+        """
+        self.response = response
+        self.timing = timing
+        self._loads = loads or default_json_loads
+        self._json = _UNSET
+
+    def json(self, **kwargs):
+        """
+        Return the parsed JSON body, decoding it on first access.
+
+        Args:
+            **kwargs: Decoder arguments; when given, the body is decoded by requests
+                with these arguments and not memoized.
+
+        Returns:
+            The parsed JSON body.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON.
+        """
+        if kwargs:
+            return self.response.json(**kwargs)
+        if self._json is _UNSET:
+            try:
+                self._json = self._loads(self.response.content)
+            except json.JSONDecodeError as error:
+                raise requests.exceptions.JSONDecodeError(error.msg, error.doc, error.pos) from error
+        return self._json
+
+    def __getattr__(self, name):
+        """
+        Delegate attribute access to the wrapped response.
+        """
+        return getattr(self.response, name)
+
+    def __bool__(self):
+        """
+        Return True if the status code is below 400, like requests.Response.
+        """
+        return bool(self.response)
+
+    def __repr__(self):
+        """
+        Return the representation of the wrapped response.
+        """
+        return repr(self.response)
+
+default_json_loads = get_json_loads()
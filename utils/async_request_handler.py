@@ -0,0 +1,129 @@
+"""
+Async API Client Module
+
+Defines AsyncAPIClient, an asyncio counterpart of APIClient that lets tests fan out
+requests with asyncio.gather while keeping the same logging of requests and responses.
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from config.config import POOL_MAXSIZE
+from utils.logger import default_api_logger
+from utils.request_handler import get_client
+
+class AsyncAPIClient:
+    """
+    Asyncio API client with the same GET/POST/PUT/DELETE surface as APIClient.
+
+    Requests are sent through an underlying APIClient on a bounded thread pool, so
+    awaiting several calls at once (e.g. with asyncio.gather) overlaps their round-trips
+    while sharing one session and its connection pool.
+    """
+    def __init__(self, base_url=None, api_logger=default_api_logger, max_workers=POOL_MAXSIZE, client=None):
+        """
+        Initialize the async client.
+
+        Args:
+            base_url (str, optional): The base URL prepended to every endpoint.
+                Defaults to the configured BASE_URL.
+            api_logger (APILogger, optional): Logger used for requests and responses.
+            max_workers (int, optional): Maximum number of requests in flight at once.
+                Defaults to the configured connection pool size.
+            client (APIClient, optional): Client to send requests through.
+                Defaults to the process-wide shared client for base_url.
+        """
+        self._api_logger = api_logger
+        self._client = client or get_client(base_url)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="async-api-client")
+
+    @property
+    def base_url(self):
+        """
+        str: The base URL prepended to every endpoint.
+        """
+        return self._client.base_url
+
+    async def _send(self, method, endpoint, **kwargs):
+        """
+        Run a blocking send of the underlying client on the thread pool and await it.
+
+        The send runs in a copy of the caller's context, so the caller's deadline applies to it.
+
+        Args:
+            method (str): The HTTP method to use.
+            endpoint (str): The API endpoint to call (appended to base_url).
+            **kwargs: Additional arguments passed to APIClient.send.
+
+        Returns:
+            APIResponse: The response object.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor,
+                                          partial(context.run, self._client.send, method, endpoint, **kwargs))
+
+    @default_api_logger.log_async_request_response("GET")
+    async def get(self, endpoint, **kwargs):
+        """
+        Sends a GET request to the specified endpoint.
+
+        Args:
+            endpoint (str): The API endpoint to call (appended to base_url).
+            **kwargs: Additional arguments passed to requests.Session.get (e.g., params, headers).
+
+        Returns:
+            APIResponse: The response object.
+        """
+        return await self._send("GET", endpoint, **kwargs)
+
+    @default_api_logger.log_async_request_response("POST")
+    async def post(self, endpoint, data=None, **kwargs):
+        """
+        Sends a POST request with JSON payload to the specified endpoint.
+
+        Args:
+            endpoint (str): The API endpoint to call (appended to base_url).
+            data (dict, optional): The JSON-serializable payload to send. Defaults to None.
+            **kwargs: Additional arguments passed to requests.Session.post (e.g., headers).
+
+        Returns:
+            APIResponse: The response object.
+        """
+        return await self._send("POST", endpoint, json=data, **kwargs)
+
+    @default_api_logger.log_async_request_response("PUT")
+    async def put(self, endpoint, data=None, **kwargs):
+        """
+        Sends a PUT request with JSON payload to the specified endpoint.
+
+        Args:
+            endpoint (str): The API endpoint to call (appended to base_url).
+            data (dict, optional): The JSON-serializable payload to send. Defaults to None.
+            **kwargs: Additional arguments passed to requests.Session.put (e.g., headers).
+
+        Returns:
+            APIResponse: The response object.
+        """
+        return await self._send("PUT", endpoint, json=data, **kwargs)
+
+    @default_api_logger.log_async_request_response("DELETE")
+    async def delete(self, endpoint, **kwargs):
+        """
+        Sends a DELETE request to the specified endpoint.
+
+        Args:
+            endpoint (str): The API endpoint to call (appended to base_url).
+            **kwargs: Additional arguments passed to requests.Session.delete (e.g., headers).
+
+        Returns:
+            APIResponse: The response object.
+        """
+        return await self._send("DELETE", endpoint, **kwargs)
+
+    def close(self):
+        """
+        Wait for in-flight requests to finish and release the thread pool.
+        """
+        self._executor.shutdown(wait=True)
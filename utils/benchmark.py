@@ -0,0 +1,123 @@
+"""
+Benchmark Module
+
+Measures endpoint latencies over repeated requests and compares their statistics with
+a baseline stored in the repository, to catch performance regressions.
+"""
+
+import json
+import os
+from config.config import (BENCHMARK_IQR_FACTOR, BENCHMARK_MIN_SLACK_MS, BENCHMARK_ROUNDS, BENCHMARK_TOLERANCE,
+                           BENCHMARK_WARMUP_ROUNDS)
+from utils.stats import sample_statistics
+
+def measure(send, rounds=BENCHMARK_ROUNDS, warmup_rounds=BENCHMARK_WARMUP_ROUNDS):
+    """
+    Send a request repeatedly and compute statistics of its latency.
+
+    Args:
+        send (callable): Function without arguments sending the request and returning the APIResponse.
+        rounds (int, optional): Number of measured requests.
+        warmup_rounds (int, optional): Number of requests sent first and not measured.
+
+    Returns:
+        dict: Statistics of the latencies, as returned by sample_statistics.
+
+    Raises:
+        AssertionError: If a request fails.
+        ValueError: If a response has no timing, e.g. because it was replayed from a cassette.
+    """
+    samples = []
+    for round_index in range(warmup_rounds + rounds):
+        response = send()
+        assert response.status_code < 400, f"Benchmark request failed with {response.status_code}"
+        if response.timing is None:
+            raise ValueError("Benchmarks need responses received over the network")
+        if round_index >= warmup_rounds:
+            samples.append(response.timing.elapsed)
+    return sample_statistics(samples)
+
+class BenchmarkBaseline:
+    """
+    Baseline statistics of the benchmarks of one target (e.g. the local stand-in server).
+
+    A result regresses when its median exceeds the baseline's by more than the tolerance plus
+    a noise slack of BENCHMARK_IQR_FACTOR interquartile ranges (the wider of the baseline's and
+    the result's), at least BENCHMARK_MIN_SLACK_MS. The median is stable over a few dozen
+    requests where the 95th percentile is not, so p95 and the other statistics are only reported.
+
+    Attributes:
+        path (str): Path of the baseline JSON file, holding the baselines of every target.
+        target (str): Name of the target the benchmarks run against.
+        tolerance (float): Allowed relative slowdown, e.g. 0.5 for 50%.
+        results (dict): Statistics of the benchmarks run, by name.
+    """
+
+    def __init__(self, path, target, tolerance=BENCHMARK_TOLERANCE):
+        """
+        Args:
+            path (str): Path of the baseline JSON file.
+            target (str): Name of the target the benchmarks run against.
+            tolerance (float, optional): Allowed relative slowdown.
+        """
+        self.path = path
+        self.target = target
+        self.tolerance = tolerance
+        self.results = {}
+        self._baselines = self._load().get(target, {})
+
+    def compare(self, name, stats):
+        """
+        Record the statistics of a benchmark and compare them with its baseline.
+
+        Args:
+            name (str): Name of the benchmark, e.g. "GET /Books/{id}".
+            stats (dict): Statistics of the benchmark, as returned by measure.
+
+        Returns:
+            list: A description of the regression; empty if there is none or no baseline.
+        """
+        self.results[name] = stats
+        baseline = self._baselines.get(name)
+        if baseline is None:
+            return []
+        slack = max(BENCHMARK_IQR_FACTOR * max(baseline["iqr_ms"], stats["iqr_ms"]), BENCHMARK_MIN_SLACK_MS)
+        allowed = baseline["median_ms"] * (1 + self.tolerance) + slack
+        if stats["median_ms"] <= allowed:
+            return []
+        return [f"{name} median_ms is {stats['median_ms']:.2f} ms, above the allowed {allowed:.2f} ms "
+                f"(baseline {baseline['median_ms']:.2f} ms + {self.tolerance:.0%} + {slack:.2f} ms noise slack)"]
+
+    def has_baseline(self, name):
+        """
+        Return True if a baseline is stored for a benchmark.
+
+        Args:
+            name (str): Name of the benchmark.
+        """
+        return name in self._baselines
+
+    def save(self):
+        """
+        Store the recorded results as the target's baseline, keeping other benchmarks and targets.
+        """
+        baselines = self._load()
+        target_baselines = baselines.setdefault(self.target, {})
+        for name, stats in self.results.items():
+            target_baselines[name] = {metric: round(value, 3) for metric, value in stats.items()}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as baseline_file:
+            json.dump(baselines, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write("\n")
+
+    def _load(self):
+        """
+        Read the baseline file.
+
+        Returns:
+            dict: Baselines by target and benchmark name, empty if the file does not exist.
+        """
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, encoding="utf-8") as baseline_file:
+            return json.load(baseline_file)
@@ -0,0 +1,212 @@
+"""
+Cassette Module
+
+Records request/response pairs to an on-disk cassette file and replays them
+without network access, so tests can iterate quickly and run offline.
+"""
+
+import json
+import os
+import threading
+import requests
+from requests.structures import CaseInsensitiveDict
+from utils.id_allocator import worker_path
+
+CASSETTE_MODES = ("off", "record", "replay")
+_KEY_BODY_FIELDS = ("id",)
+_DROPPED_HEADERS = ("content-encoding", "transfer-encoding", "content-length")
+
+class CassetteMissError(LookupError):
+    """
+    Raised in replay mode when no interaction was recorded for a request.
+    """
+
+class Cassette:
+    """
+    On-disk store of request/response interactions for record and replay runs.
+
+    Interactions are keyed by method, path (relative to the client's base URL) and, for
+    JSON object bodies, the entity ID only: the other fields of generated payloads are
+    random, so a replayed write matches its recording whatever payload it sends. Requests
+    repeated with the same key are replayed in the order they were recorded, the last
+    recorded response being served once they run out.
+
+    Attributes:
+        path (str): Path of the cassette file.
+        mode (str): "record" to store live responses, "replay" to serve stored ones.
+    """
+
+    def __init__(self, path, mode):
+        """
+        Initialize the cassette, loading its interactions in replay mode.
+
+        Args:
+            path (str): Path of the cassette file.
+            mode (str): "record" or "replay". Recording overwrites an existing file.
+
+        Raises:
+            ValueError: If mode is not "record" or "replay".
+            FileNotFoundError: If the cassette file does not exist in replay mode.
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode '{mode}', expected 'record' or 'replay'")
+        self.path = path
+        self.mode = mode
+        self._interactions = []
+        self._index = {}
+        self._replay_positions = {}
+        self._lock = threading.Lock()
+        if mode == "replay":
+            with open(path, encoding="utf-8") as cassette_file:
+                for interaction in json.load(cassette_file)["interactions"]:
+                    self._add(interaction)
+
+    @property
+    def replaying(self):
+        """
+        bool: True if responses are served from the cassette instead of the network.
+        """
+        return self.mode == "replay"
+
+    @staticmethod
+    def key(method, path, body):
+        """
+        Build the lookup key of a request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path and query, relative to the base URL.
+            body (bytes | str | None): The request body.
+
+        Returns:
+            str: Key combining the method, path and normalized body, reduced to its "id" field
+            if it is a JSON object.
+        """
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        if body:
+            try:
+                body = json.loads(body)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if isinstance(body, dict):
+                    body = {name: body[name] for name in _KEY_BODY_FIELDS if name in body}
+                body = json.dumps(body, sort_keys=True, separators=(",", ":")) if body != {} else ""
+        return f"{method.upper()} {path} {body}" if body else f"{method.upper()} {path}"
+
+    def record(self, path, response):
+        """
+        Store a live response for the request that produced it.
+
+        Args:
+            path (str): The request path and query, relative to the base URL.
+            response (requests.Response): The live response.
+        """
+        request = response.request
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in _DROPPED_HEADERS}
+        interaction = {
+            "key": self.key(request.method, path, request.body),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": headers,
+            "body": response.text,
+        }
+        with self._lock:
+            self._add(interaction)
+
+    def replay(self, path, request):
+        """
+        Build the stored response for a request.
+
+        Args:
+            path (str): The request path and query, relative to the base URL.
+            request (requests.PreparedRequest): The request that would have been sent.
+
+        Returns:
+            requests.Response: The recorded response.
+
+        Raises:
+            CassetteMissError: If no interaction was recorded for the request.
+        """
+        key = self.key(request.method, path, request.body)
+        with self._lock:
+            interactions = self._index.get(key)
+            if not interactions:
+                raise CassetteMissError(f"No recorded interaction for '{key}' in cassette {self.path}")
+            position = self._replay_positions.get(key, 0)
+            self._replay_positions[key] = position + 1
+            interaction = interactions[min(position, len(interactions) - 1)]
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.reason = interaction["reason"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response._content = interaction["body"].encode("utf-8")  # pylint: disable=protected-access
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def save(self):
+        """
+        Write the recorded interactions to the cassette file. Does nothing in replay mode.
+        """
+        if self.replaying:
+            return
+        with self._lock:
+            interactions = list(self._interactions)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as cassette_file:
+            json.dump({"interactions": interactions}, cassette_file, indent=1)
+
+    def merge(self, paths):
+        """
+        Add the interactions recorded in other cassette files, e.g. by pytest-xdist workers,
+        save the result and delete the merged files.
+
+        Args:
+            paths (list): Paths of the cassette files, merged in order.
+        """
+        for path in paths:
+            with open(path, encoding="utf-8") as cassette_file:
+                interactions = json.load(cassette_file)["interactions"]
+            with self._lock:
+                for interaction in interactions:
+                    self._add(interaction)
+        self.save()
+        for path in paths:
+            os.remove(path)
+
+    def _add(self, interaction):
+        """
+        Append an interaction and index it by key.
+
+        Args:
+            interaction (dict): The interaction to add.
+        """
+        self._interactions.append(interaction)
+        self._index.setdefault(interaction["key"], []).append(interaction)
+
+def cassette_from_config(path, mode):
+    """
+    Create the cassette selected by configuration.
+
+    Under pytest-xdist, each worker records to its own file (see worker_path), which the
+    controller merges into path once the workers have finished.
+
+    Args:
+        path (str): Path of the cassette file.
+        mode (str): "off", "record" or "replay".
+
+    Returns:
+        Cassette | None: The cassette, or None when mode is "off".
+
+    Raises:
+        ValueError: If mode is unknown.
+    """
+    if mode not in CASSETTE_MODES:
+        raise ValueError(f"Unknown cassette mode '{mode}', expected one of {CASSETTE_MODES}")
+    if mode == "off":
+        return None
+    return Cassette(worker_path(path) if mode == "record" else path, mode)
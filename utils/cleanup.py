@@ -0,0 +1,97 @@
+"""
+Cleanup Module
+
+Defines CleanupTracker, which deletes the entities created by tests concurrently
+and keeps track of what could not be deleted.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from config.config import CLEANUP_MAX_WORKERS
+
+DELETED_STATUS_CODES = (200, 204, 404)
+
+class CleanupTracker:
+    """
+    Tracks the entities created during a session and deletes them concurrently.
+
+    Entities are tracked by their path (e.g. "/Books/42"). Deleting a batch sends all its
+    DELETE requests at once on a bounded thread pool, so it takes about one round-trip.
+    Transient failures are retried by the client's retry policy; entities that still cannot
+    be deleted are kept as leftovers instead of raising.
+
+    Attributes:
+        client (APIClient): Client sending the DELETE requests.
+        leftovers (dict): Reason each entity could not be deleted, by path.
+    """
+
+    def __init__(self, client, max_workers=CLEANUP_MAX_WORKERS):
+        """
+        Args:
+            client (APIClient): Client sending the DELETE requests.
+            max_workers (int, optional): Maximum number of DELETE requests in flight at once.
+        """
+        self.client = client
+        self.leftovers = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cleanup")
+
+    def track(self, path):
+        """
+        Register a created entity for deletion.
+
+        Args:
+            path (str): The entity's endpoint, e.g. "/Books/42".
+        """
+        with self._lock:
+            self._pending.add(path)
+
+    def flush(self, paths=None):
+        """
+        Delete tracked entities concurrently.
+
+        Args:
+            paths (iterable, optional): The entities to delete. Defaults to every tracked entity.
+
+        Returns:
+            dict: Reason each entity of the batch could not be deleted, by path.
+        """
+        with self._lock:
+            batch = list(self._pending) if paths is None else [path for path in paths if path in self._pending]
+            self._pending.difference_update(batch)
+        failures = {}
+        for path, reason in zip(batch, self._executor.map(self._delete, batch)):
+            if reason is not None:
+                failures[path] = reason
+        with self._lock:
+            self.leftovers.update(failures)
+        return failures
+
+    def close(self):
+        """
+        Delete every entity still tracked and shut the thread pool down.
+
+        Returns:
+            dict: Reason each entity of the session could not be deleted, by path.
+        """
+        self.flush()
+        self._executor.shutdown()
+        return dict(self.leftovers)
+
+    def _delete(self, path):
+        """
+        Delete one entity.
+
+        Args:
+            path (str): The entity's endpoint.
+
+        Returns:
+            str | None: Why the entity could not be deleted, None if it was deleted.
+        """
+        try:
+            response = self.client.delete(path)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as error:
+            return f"{type(error).__name__}: {error}"
+        return None if response.status_code in DELETED_STATUS_CODES else f"HTTP {response.status_code}"
@@ -0,0 +1,299 @@
+"""
+Consistency Prober Module
+
+Sends many concurrent GET requests to a collection endpoint and compares the responses
+without keeping them: each response is streamed and reduced to a fingerprint of digests
+per item and field, identical fingerprints are grouped into variants, and the
+variants are diffed against the most common one to report which IDs and fields differ
+and in how many responses.
+
+Usage:
+    python -m utils.consistency /Books --probes 1000 --concurrency 16
+    python -m utils.consistency /Authors --ignore-fields idBook --json reports/consistency.json
+    python -m utils.consistency /Books --local-server
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from config.config import POOL_MAXSIZE
+from utils.local_server import LocalBookstoreServer
+from utils.request_handler import get_client
+from utils.resilience import RetryPolicy
+
+MISSING = "<missing>"
+EXTRA = "<extra>"
+
+def _value_digest(value):
+    """
+    Return the digest of the canonical JSON encoding of a value, distinguishing values of
+    different JSON types (1, 1.0, true).
+
+    Args:
+        value: The JSON value.
+
+    Returns:
+        bytes: The 8-byte digest.
+    """
+    return hashlib.blake2b(json.dumps(value, sort_keys=True).encode(), digest_size=8).digest()
+
+def fingerprint_item(item, ignore_fields=()):
+    """
+    Return the per-field fingerprint of an item.
+
+    Args:
+        item: A JSON item of the collection; items that are not objects are fingerprinted as a whole.
+        ignore_fields (iterable, optional): Fields left out, e.g. timestamps generated per request.
+
+    Returns:
+        tuple: Sorted (field, digest) pairs, equal for equal items.
+    """
+    if not isinstance(item, dict):
+        return (("", _value_digest(item)),)
+    return tuple((name, _value_digest(value)) for name, value in sorted(item.items()) if name not in ignore_fields)
+
+class _Variant:
+    """
+    One distinct response: the fingerprint of each of its items, in order, and how many probes received it.
+    """
+
+    def __init__(self, items):
+        """
+        Args:
+            items (dict): Field fingerprint of each item, by ID, in response order.
+        """
+        self.items = items
+        self.count = 0
+
+class ConsistencyProber:  # pylint: disable=too-many-instance-attributes
+    """
+    Probes a collection endpoint with concurrent GET requests and diffs the responses.
+
+    Only one fingerprint per distinct response is kept, so memory depends on the number
+    of variants and the size of the collection, not on the number of probes.
+
+    Attributes:
+        client (APIClient): Client sending the requests.
+        path (str): The collection's endpoint, e.g. "/Books".
+        probes (int): Number of GET requests to send.
+        concurrency (int): Number of requests in flight at once.
+        id_field (str): Field identifying an item; items without it are identified by position.
+        ignore_fields (frozenset): Fields left out of the comparison.
+    """
+
+    def __init__(self, client, path, probes=100, concurrency=8, *,  # pylint: disable=too-many-arguments
+                 id_field="id", ignore_fields=()):
+        """
+        Args:
+            client (APIClient): Client sending the requests.
+            path (str): The collection's endpoint, e.g. "/Books".
+            probes (int, optional): Number of GET requests to send.
+            concurrency (int, optional): Number of requests in flight at once.
+            id_field (str, optional): Field identifying an item.
+            ignore_fields (iterable, optional): Fields left out of the comparison.
+        """
+        self.client = client
+        self.path = path
+        self.probes = probes
+        self.concurrency = concurrency
+        self.id_field = id_field
+        self.ignore_fields = frozenset(ignore_fields)
+        self._variants = {}
+        self._failures = Counter()
+        self._lock = threading.Lock()
+
+    def run(self):
+        """
+        Send the probes and compare their responses.
+
+        Returns:
+            dict: The report, see ConsistencyProber.report.
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="consistency") as executor:
+            for _ in executor.map(lambda _: self._probe(), range(self.probes)):
+                pass
+        return self.report()
+
+    def _probe(self):
+        """
+        Send one GET request and add its fingerprint to the variants.
+        """
+        try:
+            with self.client.stream_list(self.path) as streamed:
+                if streamed.status_code != 200:
+                    self._fail(f"HTTP {streamed.status_code}")
+                    return
+                items = {}
+                for index, item in enumerate(streamed):
+                    item_id = item.get(self.id_field, f"#{index}") if isinstance(item, dict) else f"#{index}"
+                    if item_id in items:
+                        item_id = f"{item_id} (duplicate at #{index})"
+                    items[item_id] = fingerprint_item(item, self.ignore_fields)
+        except (requests.exceptions.RequestException, ValueError) as error:
+            self._fail(type(error).__name__)
+            return
+        key = tuple(items.items())
+        with self._lock:
+            variant = self._variants.get(key)
+            if variant is None:
+                variant = self._variants[key] = _Variant(items)
+            variant.count += 1
+
+    def _fail(self, reason):
+        """
+        Count a probe that did not return a list.
+
+        Args:
+            reason (str): Why, e.g. "HTTP 503" or the exception's name.
+        """
+        with self._lock:
+            self._failures[reason] += 1
+
+    def report(self):
+        """
+        Diff the variants received so far against the most common one.
+
+        Returns:
+            dict: Number of probes, failures by reason, the size of each variant, how many
+            responses listed the items in another order, and for each ID that differed, the
+            number of responses in which each of its fields differed ("<missing>" if the item
+            was absent from the response, "<extra>" if it was absent from the most common variant).
+        """
+        with self._lock:
+            variants = sorted(self._variants.values(), key=lambda variant: variant.count, reverse=True)
+            failures = dict(self._failures)
+        differences = {}
+        reordered = 0
+        baseline = variants[0].items if variants else {}
+        for variant in variants[1:]:
+            for item_id, fields in baseline.items():
+                other = variant.items.get(item_id)
+                if other is None:
+                    _add(differences, item_id, [MISSING], variant.count)
+                elif other != fields:
+                    _add(differences, item_id, _changed_fields(fields, other), variant.count)
+            for item_id in variant.items.keys() - baseline.keys():
+                _add(differences, item_id, [EXTRA], variant.count)
+            common = [item_id for item_id in variant.items if item_id in baseline]
+            if common != [item_id for item_id in baseline if item_id in variant.items]:
+                reordered += variant.count
+        return {
+            "path": self.path,
+            "probes": sum(variant.count for variant in variants) + sum(failures.values()),
+            "failures": failures,
+            "consistent": len(variants) <= 1,
+            "variants": [{"responses": variant.count, "items": len(variant.items)} for variant in variants],
+            "reordered": reordered,
+            "differences": {str(item_id): fields for item_id, fields in
+                            sorted(differences.items(), key=lambda entry: -max(entry[1].values()))},
+        }
+
+def _changed_fields(fields, other):
+    """
+    Return the names of the fields that differ between two item fingerprints.
+
+    Args:
+        fields (tuple): (field, digest) pairs of one item.
+        other (tuple): (field, digest) pairs of the other item.
+
+    Returns:
+        list: The field names, sorted.
+    """
+    fields, other = dict(fields), dict(other)
+    return sorted(name for name in fields.keys() | other.keys() if fields.get(name) != other.get(name))
+
+def _add(differences, item_id, fields, count):
+    """
+    Count the responses in which fields of an item differed.
+
+    Args:
+        differences (dict): Counts by field, by ID, updated in place.
+        item_id: The item's ID.
+        fields (list): The fields that differed.
+        count (int): Number of responses.
+    """
+    counts = differences.setdefault(item_id, {})
+    for name in fields:
+        counts[name] = counts.get(name, 0) + count
+
+def format_report(report, limit=20):
+    """
+    Format a consistency report for the terminal.
+
+    Args:
+        report (dict): Report as returned by ConsistencyProber.run.
+        limit (int, optional): Maximum number of differing IDs listed.
+
+    Returns:
+        str: The formatted report.
+    """
+    ok = report["probes"] - sum(report["failures"].values())
+    lines = [f"{report['path']}: {report['probes']} probes, {ok} lists in {len(report['variants'])} variants "
+             f"({', '.join(str(variant['responses']) for variant in report['variants']) or 'none'})"]
+    for reason, count in sorted(report["failures"].items()):
+        lines.append(f"  failed: {reason} x{count}")
+    if report["reordered"]:
+        lines.append(f"  items in another order in {report['reordered']} responses")
+    differences = list(report["differences"].items())
+    for item_id, fields in differences[:limit]:
+        lines.append(f"  id {item_id}: " + ", ".join(f"{name} in {count}" for name, count in sorted(fields.items())))
+    if len(differences) > limit:
+        lines.append(f"  ... and {len(differences) - limit} more IDs")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """
+    Run the consistency prober from the command line.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status, 1 if the responses differed or a probe failed.
+    """
+    parser = argparse.ArgumentParser(prog="python -m utils.consistency",
+                                     description=__doc__.split("Usage:", maxsplit=1)[0].strip())
+    parser.add_argument("path", choices=("/Books", "/Authors"), help="Collection endpoint to probe.")
+    parser.add_argument("--base-url", help="API base URL. Defaults to BASE_URL.")
+    parser.add_argument("--local-server", action="store_true", help="Run against the in-process stand-in server.")
+    parser.add_argument("--probes", type=int, default=100, help="Number of GET requests to send.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of requests in flight at once.")
+    parser.add_argument("--id-field", default="id", help="Field identifying an item.")
+    parser.add_argument("--ignore-fields", default="", help="Comma-separated fields left out of the comparison.")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum number of differing IDs printed.")
+    parser.add_argument("--json", dest="json_path", help="Also write the report to this JSON file.")
+    parser.add_argument("--verbose", action="store_true", help="Log every request and response.")
+    args = parser.parse_args(argv)
+    if not args.verbose:
+        logging.getLogger("books_api").setLevel(logging.WARNING)
+
+    server = LocalBookstoreServer().start() if args.local_server else None
+    try:
+        base_url = server.base_url if server else args.base_url
+        client = get_client(base_url, pool_maxsize=max(args.concurrency, POOL_MAXSIZE), read_cache=None,
+                            retry_policy=RetryPolicy(retries=0), circuit_breaker=None)
+        ignore_fields = [name.strip() for name in args.ignore_fields.split(",") if name.strip()]
+        prober = ConsistencyProber(client, args.path, probes=args.probes, concurrency=args.concurrency,
+                                   id_field=args.id_field, ignore_fields=ignore_fields)
+        report = prober.run()
+        client.close()
+    finally:
+        if server:
+            server.stop()
+
+    print(format_report(report, args.limit))
+    if args.json_path:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json_path)), exist_ok=True)
+        with open(args.json_path, "w", encoding="utf-8") as json_file:
+            json.dump(report, json_file, indent=2)
+    return 0 if report["consistent"] and not report["failures"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,380 @@
+"""
+ID Allocator Module
+
+Allocates entity IDs for tests creating books or authors: IDs are reserved in memory
+from one snapshot of the existing IDs, and partitioned between parallel pytest-xdist
+workers so that different processes never pick the same ID. For cassette runs, the IDs of
+each test can instead be drawn from a block derived from a seed, such as the test ID.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from config.config import ID_RANGE_SIZE
+
+LOCK_TIMEOUT_SECONDS = 30
+SEEDED_BLOCK_SIZE = 1000
+SEEDED_BLOCK_COUNT = 100000
+
+def worker_index():
+    """
+    Return the index of the current pytest-xdist worker.
+
+    Returns:
+        int: N for worker "gwN", 0 when not running under pytest-xdist.
+    """
+    match = re.fullmatch(r"gw(\d+)", os.environ.get("PYTEST_XDIST_WORKER", ""))
+    return int(match.group(1)) if match else 0
+
+def worker_count():
+    """
+    Return the number of pytest-xdist workers in the run.
+
+    Returns:
+        int: The worker count, 1 when not running under pytest-xdist.
+    """
+    return int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+def worker_path(path):
+    """
+    Return the path of a file written by the current pytest-xdist worker, so that parallel
+    workers do not overwrite each other's files.
+
+    Args:
+        path (str): Path of the file, e.g. "reports/traffic.jsonl".
+
+    Returns:
+        str: The path with the worker ID before its extension, e.g. "reports/traffic.gw0.jsonl",
+        unchanged when not running under pytest-xdist.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker:
+        return path
+    root, extension = os.path.splitext(path)
+    return f"{root}.{worker}{extension}"
+
+def worker_paths(path):
+    """
+    Return the files written by the pytest-xdist workers in place of a file.
+
+    Args:
+        path (str): Path of the file, as given to worker_path.
+
+    Returns:
+        list: The existing per-worker files, sorted by worker.
+    """
+    root, extension = os.path.splitext(path)
+    pattern = re.compile(re.escape(root) + r"\.gw(\d+)" + re.escape(extension))
+    matches = (pattern.fullmatch(candidate) for candidate in glob.glob(f"{glob.escape(root)}.gw*{extension}"))
+    return [match.group(0) for match in sorted(filter(None, matches), key=lambda match: int(match.group(1)))]
+
+def shared_state_dir(run_id=None):
+    """
+    Return a directory shared by all workers of a test run.
+
+    Args:
+        run_id (str, optional): The pytest-xdist test run UID. Defaults to that of the current run.
+
+    Returns:
+        str: Directory path, unique to the run (per process outside pytest-xdist).
+    """
+    run_id = run_id or os.environ.get("PYTEST_XDIST_TESTRUNUID") or f"pid-{os.getpid()}"
+    return os.path.join(tempfile.gettempdir(), "books-api-ids", run_id)
+
+def remove_shared_state_dir(run_id):
+    """
+    Remove the directory shared by the workers of a test run, once they have all finished.
+
+    Args:
+        run_id (str): The pytest-xdist test run UID.
+    """
+    shutil.rmtree(shared_state_dir(run_id), ignore_errors=True)
+
+class FileLock:
+    """
+    Inter-process lock based on exclusively creating a lock file.
+    """
+
+    def __init__(self, path, timeout=LOCK_TIMEOUT_SECONDS):
+        """
+        Args:
+            path (str): Path of the lock file.
+            timeout (float, optional): Seconds to wait for the lock before giving up.
+        """
+        self.path = path
+        self.timeout = timeout
+
+    def __enter__(self):
+        """
+        Acquire the lock, waiting for other processes to release it.
+
+        Raises:
+            TimeoutError: If the lock is not acquired within the timeout.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return self
+            except FileExistsError as error:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for lock {self.path}; "
+                                       "delete it if a previous run crashed") from error
+                time.sleep(0.01)
+
+    def __exit__(self, *exc_info):
+        """
+        Release the lock.
+        """
+        os.remove(self.path)
+
+class IdRangePartition:
+    """
+    Gives each pytest-xdist worker a disjoint range of IDs for one resource.
+
+    The first worker to need an ID computes a base ID above every existing one and
+    stores it in a file shared by the run, under a file lock; every worker then uses
+    [base + index * range_size, base + (index + 1) * range_size) for its worker index.
+
+    Attributes:
+        name (str): Name of the resource, used for the shared state file.
+        range_size (int): Number of IDs in each worker's range.
+    """
+
+    def __init__(self, name, range_size=ID_RANGE_SIZE, state_dir=None):
+        """
+        Args:
+            name (str): Name of the resource, used for the shared state file.
+            range_size (int, optional): Number of IDs in each worker's range.
+            state_dir (str, optional): Directory shared by the workers of the run.
+        """
+        self.name = name
+        self.range_size = range_size
+        self._state_dir = state_dir
+        self._range = None
+
+    def id_range(self, existing_ids):
+        """
+        Return this worker's ID range, agreeing the base ID with the other workers on first use.
+
+        Args:
+            existing_ids (iterable): IDs currently in use, used if the base is not agreed yet.
+
+        Returns:
+            range: The IDs this worker may assign.
+        """
+        if self._range is None:
+            base = self._agree_base(existing_ids)
+            start = base + worker_index() * self.range_size
+            self._range = range(start, start + self.range_size)
+        return self._range
+
+    def next_id(self, existing_ids):
+        """
+        Return the next ID of this worker's range that is above every existing ID in it.
+
+        Args:
+            existing_ids (iterable): IDs currently in use.
+
+        Returns:
+            int: The next available ID of this worker.
+
+        Raises:
+            RuntimeError: If the worker's range is exhausted.
+        """
+        existing_ids = list(existing_ids)
+        id_range = self.id_range(existing_ids)
+        taken = [entity_id for entity_id in existing_ids if entity_id in id_range]
+        next_id = max(taken) + 1 if taken else id_range.start
+        if next_id not in id_range:
+            raise RuntimeError(f"{self.name} ID range {id_range.start}-{id_range.stop - 1} of worker "
+                               f"{worker_index()} is exhausted, increase ID_RANGE_SIZE")
+        return next_id
+
+    def _agree_base(self, existing_ids):
+        """
+        Read the base ID shared by the run, or store one above the existing IDs.
+
+        Args:
+            existing_ids (list): IDs currently in use.
+
+        Returns:
+            int: The base ID of the first worker's range.
+        """
+        proposed_base = max(existing_ids, default=0) + 1
+        if worker_count() == 1:
+            return proposed_base
+        state_dir = self._state_dir or shared_state_dir()
+        os.makedirs(state_dir, exist_ok=True)
+        state_path = os.path.join(state_dir, f"{self.name}.json")
+        with FileLock(f"{state_path}.lock"):
+            if os.path.exists(state_path):
+                with open(state_path, encoding="utf-8") as state_file:
+                    return json.load(state_file)["base"]
+            with open(state_path, "w", encoding="utf-8") as state_file:
+                json.dump({"base": proposed_base}, state_file)
+            return proposed_base
+
+class IdAllocator:
+    """
+    Hands out reserved IDs for one resource from a single snapshot of the existing IDs.
+
+    The existing IDs are fetched once, on first use; later IDs are reserved in memory,
+    in increasing order and within this worker's IdRangePartition range, so tests do not
+    each download the whole collection. Once reseeded, IDs are reserved from a block above
+    the existing IDs derived from the seed instead, so they do not depend on the worker or
+    on the IDs reserved before. Safe to use from several threads.
+
+    Attributes:
+        partition (IdRangePartition): The ID range partition of the resource.
+    """
+
+    def __init__(self, partition, fetch_existing_ids):
+        """
+        Args:
+            partition (IdRangePartition): The ID range partition of the resource.
+            fetch_existing_ids (callable): Function without arguments returning the IDs in use.
+        """
+        self.partition = partition
+        self._fetch_existing_ids = fetch_existing_ids
+        self._lock = threading.Lock()
+        self._next_id = None
+        self._highest_existing_id = None
+        self._reserved_ids = set()
+        self._seed = None
+        self._seed_base = None
+        self._seeded_range = None
+        _allocators.add(self)
+
+    def next_id(self):
+        """
+        Reserve the next available ID.
+
+        Returns:
+            int: An ID not used by any existing entity nor reserved before.
+
+        Raises:
+            RuntimeError: If the worker's ID range is exhausted.
+        """
+        return self.reserve(1).start
+
+    def reserve(self, count):
+        """
+        Reserve consecutive available IDs.
+
+        Args:
+            count (int): Number of IDs to reserve.
+
+        Returns:
+            range: The reserved IDs.
+
+        Raises:
+            RuntimeError: If the worker's ID range, or the seed's block once reseeded, is exhausted.
+        """
+        with self._lock:
+            if self._next_id is None:
+                self._sync()
+            if self._seed is not None and self._seeded_range is None:
+                self._seeded_range = self._seeded_block()
+                self._next_id = self._seeded_range.start
+            reserved = range(self._next_id, self._next_id + count)
+            if self._seeded_range is not None and reserved.stop > self._seeded_range.stop:
+                raise RuntimeError(f"{self.partition.name} ID block {self._seeded_range.start}-"
+                                   f"{self._seeded_range.stop - 1} of seed {self._seed!r} is exhausted")
+            id_range = self._seeded_range or self.partition.id_range(())
+            if reserved.stop > id_range.stop:
+                raise RuntimeError(f"{self.partition.name} ID range {id_range.start}-{id_range.stop - 1} of worker "
+                                   f"{worker_index()} is exhausted, increase ID_RANGE_SIZE")
+            self._next_id = reserved.stop
+            self._reserved_ids.update(reserved)
+            return reserved
+
+    def reseed(self, seed):
+        """
+        Reserve the next IDs from the block of SEEDED_BLOCK_SIZE IDs derived from a seed, e.g. per
+        test in cassette runs, so that a test gets the same IDs whichever tests run before it
+        and whichever worker runs it.
+
+        Args:
+            seed (int | str | None): The seed, None to reserve from this worker's range again.
+        """
+        with self._lock:
+            self._seed = seed
+            self._seeded_range = None
+            if seed is None:
+                self._next_id = None
+
+    def existing_id(self):
+        """
+        Return the highest ID that existed when the IDs were last fetched.
+
+        Returns:
+            int: An ID in use, 0 if there was none.
+        """
+        with self._lock:
+            if self._highest_existing_id is None:
+                self._sync()
+            return self._highest_existing_id
+
+    def resync(self, conflicting_id=None):
+        """
+        Fetch the existing IDs again and continue reserving above them.
+
+        Args:
+            conflicting_id (int, optional): ID rejected by the API as already in use. When given,
+                the IDs are only fetched again if it is one this allocator reserved.
+
+        Returns:
+            bool: True if the existing IDs were fetched again.
+        """
+        with self._lock:
+            if conflicting_id is not None and conflicting_id not in self._reserved_ids:
+                return False
+            self._sync()
+            return True
+
+    def _sync(self):
+        """
+        Fetch the existing IDs and move the next ID above them. Must be called with the lock held.
+        """
+        existing_ids = list(self._fetch_existing_ids())
+        if self._highest_existing_id is None:
+            self._seed_base = max(existing_ids, default=0) + 1
+        self._highest_existing_id = max(existing_ids, default=0)
+        if self._seeded_range is not None:
+            taken = [entity_id for entity_id in existing_ids if entity_id in self._seeded_range]
+            self._next_id = max([self._next_id, *(entity_id + 1 for entity_id in taken)])
+            return
+        next_id = self.partition.next_id(existing_ids)
+        self._next_id = next_id if self._next_id is None else max(self._next_id, next_id)
+
+    def _seeded_block(self):
+        """
+        Return the block of IDs derived from the seed, above the IDs that existed on first use.
+
+        Returns:
+            range: The block's IDs.
+        """
+        digest = hashlib.blake2b(str(self._seed).encode("utf-8"), digest_size=8).digest()
+        start = self._seed_base + int.from_bytes(digest, "big") % SEEDED_BLOCK_COUNT * SEEDED_BLOCK_SIZE
+        return range(start, start + SEEDED_BLOCK_SIZE)
+
+_allocators = weakref.WeakSet()
+
+def seed_id_allocators(seed):
+    """
+    Reseed every IdAllocator, e.g. per test in cassette runs so that each test reserves the
+    same IDs whether it runs alone or after others.
+
+    Args:
+        seed (int | str | None): The new seed, None to reserve from the workers' ranges again.
+    """
+    for allocator in list(_allocators):
+        allocator.reseed(seed)
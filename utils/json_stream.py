@@ -0,0 +1,255 @@
+"""
+JSON Stream Module
+
+Defines iter_json_array, an incremental parser yielding the items of a JSON array as its
+bytes arrive, and StreamedList, a streamed list response whose items are parsed and
+schema-validated one at a time.
+"""
+
+import codecs
+import json
+import re
+from config.config import STREAM_CHUNK_SIZE
+from utils.schema_validator import validate_items
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = ",] \t\n\r"
+
+def iter_json_array(chunks):
+    """
+    Parse a JSON array incrementally, yielding each item as soon as it is complete.
+
+    Only the item being parsed and the unparsed rest of the current chunk are kept in
+    memory, whatever the size of the array.
+
+    Args:
+        chunks (iterable): Bytes chunks of a UTF-8 JSON document whose top level is an array.
+
+    Yields:
+        The parsed items, in order.
+
+    Raises:
+        json.JSONDecodeError: If the document is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    reader = _ChunkReader(chunks)
+    position = reader.skip_whitespace(0)
+    if reader.char(position) != "[":
+        raise json.JSONDecodeError("Expecting '['", reader.buffer, position)
+    position = reader.skip_whitespace(position + 1)
+    if reader.char(position) == "]":
+        reader.expect_end(position + 1)
+        return
+    while True:
+        try:
+            item, end = decoder.raw_decode(reader.buffer, position)
+        except json.JSONDecodeError:
+            if not reader.fill():
+                raise
+            continue
+        # A number not followed by a delimiter may continue in the next chunk ("-1.5e" + "3").
+        truncated = end == len(reader.buffer) or (isinstance(item, (int, float)) and not isinstance(item, bool)
+                                                  and reader.buffer[end] not in _DELIMITERS)
+        if truncated and reader.fill():
+            continue
+        yield item
+        position = reader.discard(reader.skip_whitespace(end))
+        separator = reader.char(position)
+        if separator == "]":
+            reader.expect_end(position + 1)
+            return
+        if separator != ",":
+            raise json.JSONDecodeError("Expecting ',' or ']'", reader.buffer, position)
+        position = reader.skip_whitespace(position + 1)
+
+class _ChunkReader:
+    """
+    Text buffer of a chunked UTF-8 document, refilled on demand.
+
+    Attributes:
+        buffer (str): The decoded text not discarded yet.
+    """
+
+    def __init__(self, chunks):
+        """
+        Args:
+            chunks (iterable): Bytes chunks of the document.
+        """
+        self.buffer = ""
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._exhausted = False
+
+    def fill(self):
+        """
+        Append the next chunk to the buffer.
+
+        Returns:
+            bool: False if the document was already read in full.
+        """
+        if self._exhausted:
+            return False
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buffer += text
+                return True
+        self.buffer += self._decoder.decode(b"", final=True)
+        self._exhausted = True
+        return False
+
+    def discard(self, position):
+        """
+        Drop the parsed text before a position.
+
+        Args:
+            position (int): Position in the buffer.
+
+        Returns:
+            int: The same position in the trimmed buffer.
+        """
+        self.buffer = self.buffer[position:]
+        return 0
+
+    def skip_whitespace(self, position):
+        """
+        Return the position of the first character at or after position that is not whitespace,
+        reading more chunks if needed.
+
+        Args:
+            position (int): Position in the buffer.
+
+        Returns:
+            int: The position, len(buffer) if the document ends with whitespace.
+        """
+        position = _WHITESPACE.match(self.buffer, position).end()
+        while position == len(self.buffer) and self.fill():
+            position = _WHITESPACE.match(self.buffer, position).end()
+        return position
+
+    def char(self, position):
+        """
+        Return the character at a position.
+
+        Args:
+            position (int): Position in the buffer, from skip_whitespace.
+
+        Returns:
+            str: The character.
+
+        Raises:
+            json.JSONDecodeError: If the document ends before the position.
+        """
+        if position >= len(self.buffer):
+            raise json.JSONDecodeError("Unexpected end of the JSON array", self.buffer, position)
+        return self.buffer[position]
+
+    def expect_end(self, position):
+        """
+        Check only whitespace follows a position.
+
+        Args:
+            position (int): Position in the buffer.
+
+        Raises:
+            json.JSONDecodeError: If anything else follows.
+        """
+        position = self.skip_whitespace(position)
+        if position != len(self.buffer):
+            raise json.JSONDecodeError("Extra data after the JSON array", self.buffer, position)
+
+class StreamedList:  # pylint: disable=too-many-instance-attributes
+    """
+    List response read incrementally from a streamed HTTP response.
+
+    Iterating yields the items as they are parsed, each validated against the schema if one
+    is given, so a bad record fails the iteration before the rest of the body is downloaded.
+    Closing the list (or leaving its with block, or exhausting it) releases the connection.
+    Any other attribute (status_code, headers, ...) is delegated to the wrapped response.
+
+    Attributes:
+        response (requests.Response): The streamed response, whose body is not read in full.
+        schema (dict | None): JSON schema each item is validated against.
+        items_read (int): Number of items parsed so far.
+        bytes_read (int): Number of body bytes received so far.
+        complete (bool): Whether the whole array was read.
+    """
+
+    def __init__(self, response, schema=None, chunk_size=STREAM_CHUNK_SIZE, on_close=None):
+        """
+        Args:
+            response (requests.Response): The response, sent with stream=True or replayed.
+            schema (dict, optional): JSON schema each item is validated against.
+            chunk_size (int, optional): Bytes read from the connection at a time.
+            on_close (callable, optional): Called with the StreamedList once it is closed.
+        """
+        self.response = response
+        self.schema = schema
+        self.chunk_size = chunk_size
+        self.items_read = 0
+        self.bytes_read = 0
+        self.complete = False
+        self._on_close = on_close
+        self._closed = False
+
+    def __iter__(self):
+        """
+        Yield the items of the list as they are parsed.
+
+        Raises:
+            json.JSONDecodeError: If the body is not a well-formed JSON array.
+            jsonschema.exceptions.ValidationError: If an item does not conform to the schema,
+                pointing at its index.
+        """
+        items = iter_json_array(self._chunks())
+        if self.schema is not None:
+            items = validate_items(items, self.schema)
+        try:
+            for item in items:
+                self.items_read += 1
+                yield item
+            self.complete = True
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Release the connection without reading the rest of the body.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.response.close()
+        if self._on_close is not None:
+            self._on_close(self)
+
+    def _chunks(self):
+        """
+        Yield the body in chunks, counting the bytes received.
+        """
+        if self.response.raw is None:
+            content = self.response.content
+            chunks = (content[start:start + self.chunk_size] for start in range(0, len(content), self.chunk_size))
+        else:
+            chunks = self.response.iter_content(self.chunk_size)
+        for chunk in chunks:
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def __enter__(self):
+        """
+        Return the list, closed when the with block is left.
+        """
+        return self
+
+    def __exit__(self, *exc_info):
+        """
+        Close the list.
+        """
+        self.close()
+
+    def __getattr__(self, name):
+        """
+        Delegate attribute access to the wrapped response.
+        """
+        return getattr(self.response, name)
@@ -0,0 +1,58 @@
+"""
+Lazy Parameter Module
+
+Defines LazyParam, a parametrize value computed when the test runs instead of when it
+is collected, so collecting the suite does not send requests to the API.
+"""
+
+class LazyParam:
+    """
+    Placeholder for a parametrized value that is resolved at run time.
+
+    The test ID is the placeholder's name, which is known at collection time and the same
+    in every pytest-xdist worker; the resolved value is recorded in the test report.
+
+    Attributes:
+        factory (callable): Function without arguments returning the value.
+        name (str): Name of the value, used as its test ID.
+    """
+
+    def __init__(self, factory, name=None):
+        """
+        Args:
+            factory (callable): Function without arguments returning the value.
+            name (str, optional): Name used as the test ID. Defaults to the factory's name.
+        """
+        self.factory = factory
+        self.name = name or factory.__name__
+
+    def resolve(self):
+        """
+        Compute the value.
+
+        Returns:
+            The value returned by the factory.
+        """
+        return self.factory()
+
+    def __repr__(self):
+        """
+        Return the representation of the placeholder.
+        """
+        return f"LazyParam({self.name})"
+
+def resolve_lazy_params(funcargs):
+    """
+    Replace the lazy parameters of a test's arguments with their values, in place.
+
+    Args:
+        funcargs (dict): The test's arguments, by name.
+
+    Returns:
+        dict: The resolved values, by argument name.
+    """
+    resolved = {}
+    for argname, value in funcargs.items():
+        if isinstance(value, LazyParam):
+            resolved[argname] = funcargs[argname] = value.resolve()
+    return resolved
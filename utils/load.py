@@ -0,0 +1,477 @@
+"""
+Load Generator Module
+
+Drives a configurable mix of GET/POST/PUT/DELETE requests against /Books and /Authors
+with the shared APIClient and the payload generators of the functional tests, and reports
+throughput and latency percentiles per endpoint.
+
+Usage:
+    python -m utils.load --duration 30 --concurrency 8
+    python -m utils.load --rps 50 --mix "GET /Books/{id}=8,POST /Books=1,DELETE /Books/{id}=1"
+    python -m utils.load --local-server --local-server-persist --json reports/load.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from functools import partial
+import requests
+from config.config import POOL_MAXSIZE
+from utils.cleanup import CleanupTracker
+from utils.id_allocator import IdAllocator, IdRangePartition
+from utils.local_server import LocalBookstoreServer
+from utils.payloads import PayloadGenerator
+from utils.request_handler import get_client
+from utils.resilience import RetryPolicy
+from utils.stats import LatencyHistogram
+
+DEFAULT_MIX = ("GET /Books=2,GET /Books/{id}=4,POST /Books=1,PUT /Books/{id}=1,DELETE /Books/{id}=1,"
+               "GET /Authors=2,GET /Authors/{id}=4,POST /Authors=1,PUT /Authors/{id}=1,DELETE /Authors/{id}=1")
+PERCENTILES = (50, 90, 99)
+
+class _Resource:
+    """
+    The requests of the load mix for one collection, e.g. /Books.
+
+    IDs of new entities are reserved with an IdAllocator; DELETE removes the entities
+    created by the run's POSTs first, and those left at the end are cleaned up.
+    """
+
+    def __init__(self, client, path, generate_payload):
+        """
+        Args:
+            client (APIClient): Client sending the requests.
+            path (str): The collection's endpoint, e.g. "/Books".
+            generate_payload (callable): Payload generator taking the entity ID.
+        """
+        self.client = client
+        self.path = path
+        self.generate_payload = generate_payload
+        self.existing_ids = []
+        self.created_ids = deque()
+        self.id_allocator = IdAllocator(IdRangePartition(f"load-{path.strip('/').lower()}"), self._fetch_ids)
+
+    def _fetch_ids(self):
+        """
+        Fetch the IDs of the collection's entities.
+
+        Returns:
+            list: The existing IDs.
+
+        Raises:
+            RuntimeError: If the collection cannot be fetched.
+        """
+        response = self.client.get(self.path)
+        if response.status_code != 200:
+            raise RuntimeError(f"Failed to fetch {self.path}. Got {response.status_code}")
+        self.existing_ids = [entity.get("id", 0) for entity in response.json() if isinstance(entity, dict)]
+        return self.existing_ids
+
+    def existing_id(self, rng):
+        """
+        Return a random ID of an entity that existed at the start of the run.
+        """
+        return rng.choice(self.existing_ids) if self.existing_ids else self.id_allocator.existing_id()
+
+    def list(self, rng):  # pylint: disable=unused-argument
+        """Prepare GET for the whole collection."""
+        return partial(self.client.get, self.path)
+
+    def read(self, rng):
+        """Prepare GET for one existing entity."""
+        return partial(self.client.get, f"{self.path}/{self.existing_id(rng)}")
+
+    def create(self, rng):  # pylint: disable=unused-argument
+        """Prepare POST for a new entity, remembered for DELETE once created."""
+        entity_id = self.id_allocator.next_id()
+        payload = self.generate_payload(entity_id)
+
+        def _create():
+            """Send the POST and remember the entity if it was created."""
+            response = self.client.post(self.path, data=payload)
+            if response.status_code == 200:
+                self.created_ids.append(entity_id)
+            return response
+        return _create
+
+    def update(self, rng):
+        """Prepare PUT for one existing entity."""
+        entity_id = self.existing_id(rng)
+        return partial(self.client.put, f"{self.path}/{entity_id}", data=self.generate_payload(entity_id))
+
+    def delete(self, rng):  # pylint: disable=unused-argument
+        """
+        Prepare DELETE for an entity created by the run. When there is none, one is
+        created first; that POST is not part of the measured request.
+        """
+        try:
+            entity_id = self.created_ids.popleft()
+        except IndexError:
+            entity_id = self.id_allocator.next_id()
+            self.client.post(self.path, data=self.generate_payload(entity_id))
+        return partial(self.client.delete, f"{self.path}/{entity_id}")
+
+class LoadProfile:
+    """
+    How hard and for how long a load run drives the API.
+
+    With a fixed concurrency only, each worker sends its next request as soon as the
+    previous one completes. With a target rate, requests are scheduled at regular
+    intervals and their latency is measured from the scheduled time, so a slow server
+    shows up as higher latencies instead of fewer samples (no coordinated omission).
+
+    Attributes:
+        concurrency (int): Number of worker threads.
+        rps (float | None): Target requests per second, None to send as fast as possible.
+        duration (float): Duration of the run in seconds.
+        seed (int | None): Seed of the endpoint and ID choices and of the payloads, for reproducible mixes.
+    """
+
+    def __init__(self, concurrency=8, rps=None, duration=10.0, seed=None):
+        """
+        Args:
+            concurrency (int, optional): Number of worker threads.
+            rps (float, optional): Target requests per second. Defaults to as fast as possible.
+            duration (float, optional): Duration of the run in seconds.
+            seed (int, optional): Seed of the endpoint and ID choices and of the payloads.
+        """
+        self.concurrency = concurrency
+        self.rps = rps
+        self.duration = duration
+        self.seed = seed
+
+    def worker_rng(self, index):
+        """
+        Return the source of random choices of a worker.
+
+        Args:
+            index (int): The worker's index.
+
+        Returns:
+            random.Random: Generator seeded from the profile's seed, if any.
+        """
+        return random.Random(None if self.seed is None else self.seed + index)
+
+class _Schedule:
+    """
+    Hands out the start times of a run's requests, following a LoadProfile.
+    """
+
+    def __init__(self, profile, started):
+        """
+        Args:
+            profile (LoadProfile): The load profile.
+            started (float): perf_counter() time the run started at.
+        """
+        self._interval = 1 / profile.rps if profile.rps else None
+        self._deadline = started + profile.duration
+        self._next_send = started
+        self._lock = threading.Lock()
+
+    def next_start(self):
+        """
+        Wait for the next request's turn.
+
+        Returns:
+            float | None: The time the request is measured from, None once the run is over.
+        """
+        if self._interval is None:
+            now = time.perf_counter()
+            return now if now < self._deadline else None
+        with self._lock:
+            scheduled = self._next_send
+            self._next_send += self._interval
+        if scheduled >= self._deadline:
+            return None
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        return scheduled
+
+class EndpointStats:
+    """
+    Latencies, errors and outcomes of the requests sent to one endpoint.
+
+    Only successful requests are recorded in the histogram, so that fast error responses
+    and slow timeouts do not skew the latency percentiles.
+
+    Attributes:
+        histogram (LatencyHistogram): Latencies of the successful requests.
+        requests (int): Number of requests, successful or not.
+        errors (int): Number of requests that failed or got a status code of 400 or above.
+        outcomes (Counter): Number of requests per status code, e.g. "200", or per error, e.g. "ConnectTimeout".
+    """
+
+    def __init__(self):
+        """
+        Initialize empty stats.
+        """
+        self.histogram = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+        self.outcomes = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, seconds, outcome):
+        """
+        Record one request.
+
+        Args:
+            seconds (float): The request's latency.
+            outcome (int | str): The response's status code, or the name of the error the request failed with.
+        """
+        failed = not isinstance(outcome, int) or outcome >= 400
+        if not failed:
+            self.histogram.record(seconds)
+        with self._lock:
+            self.requests += 1
+            self.errors += failed
+            self.outcomes[str(outcome)] += 1
+
+    def merge(self, other):
+        """
+        Add the requests recorded by other stats to these ones.
+
+        Args:
+            other (EndpointStats): The stats to add.
+        """
+        self.histogram.merge(other.histogram)
+        with self._lock:
+            self.requests += other.requests
+            self.errors += other.errors
+            self.outcomes.update(other.outcomes)
+
+    def summary(self, elapsed):
+        """
+        Summarize the stats.
+
+        Args:
+            elapsed (float): Duration of the run in seconds.
+
+        Returns:
+            dict: Request and error counts, throughput, latency percentiles of the successful
+                requests in milliseconds, and the number of requests per outcome.
+        """
+        histogram = self.histogram
+        summary = {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rps": self.requests / elapsed if elapsed else 0.0,
+        }
+        for percent in PERCENTILES:
+            summary[f"p{percent}_ms"] = histogram.percentile(percent) * 1000
+        summary["max_ms"] = histogram.max * 1000
+        summary["outcomes"] = dict(sorted(self.outcomes.items()))
+        return summary
+
+def parse_mix(mix):
+    """
+    Parse a request mix.
+
+    Args:
+        mix (str): Comma-separated "METHOD /Endpoint=weight" entries, e.g.
+            "GET /Books/{id}=8,POST /Books=1". Weights default to 1.
+
+    Returns:
+        dict: Weight of each endpoint, keyed by "METHOD /Endpoint".
+
+    Raises:
+        ValueError: If an entry is not a supported endpoint or its weight is not positive.
+    """
+    weights = {}
+    for entry in filter(None, (entry.strip() for entry in mix.split(","))):
+        endpoint, _, weight = entry.partition("=")
+        endpoint = " ".join(endpoint.split())
+        method, _, path = endpoint.partition(" ")
+        endpoint = f"{method.upper()} {path}"
+        if endpoint not in LoadGenerator.ENDPOINTS:
+            raise ValueError(f"Unsupported endpoint '{endpoint}', expected one of {sorted(LoadGenerator.ENDPOINTS)}")
+        weights[endpoint] = float(weight) if weight else 1.0
+        if weights[endpoint] <= 0:
+            raise ValueError(f"Weight of '{endpoint}' must be positive")
+    if not weights:
+        raise ValueError("The request mix is empty")
+    return weights
+
+class LoadGenerator:
+    """
+    Sends a weighted mix of requests following a LoadProfile and collects per-endpoint stats.
+
+    Attributes:
+        weights (dict): Weight of each endpoint, keyed by "METHOD /Endpoint".
+        profile (LoadProfile): Concurrency, rate and duration of the run.
+        stats (dict): EndpointStats keyed by "METHOD /Endpoint".
+    """
+
+    ENDPOINTS = {
+        f"{method} {path}{suffix}": (path, action)
+        for path in ("/Books", "/Authors")
+        for method, suffix, action in (("GET", "", "list"), ("GET", "/{id}", "read"), ("POST", "", "create"),
+                                       ("PUT", "/{id}", "update"), ("DELETE", "/{id}", "delete"))
+    }
+
+    def __init__(self, client, weights, profile=None):
+        """
+        Args:
+            client (APIClient): Client sending the requests.
+            weights (dict): Weight of each endpoint, as returned by parse_mix.
+            profile (LoadProfile, optional): Concurrency, rate and duration of the run.
+        """
+        self.weights = weights
+        self.profile = profile or LoadProfile()
+        self.stats = {endpoint: EndpointStats() for endpoint in weights}
+        self._resources = {
+            "/Books": _Resource(client, "/Books", PayloadGenerator("books", seed=self.profile.seed).payload),
+            "/Authors": _Resource(client, "/Authors", PayloadGenerator("authors", seed=self.profile.seed).payload),
+        }
+
+    def run(self):
+        """
+        Send the mix for the profile's duration, then delete the entities left by the run.
+
+        Returns:
+            dict: Per-endpoint summaries keyed by "METHOD /Endpoint", plus "total".
+        """
+        for resource in self._resources.values():
+            resource.id_allocator.existing_id()
+        started = time.perf_counter()
+        schedule = _Schedule(self.profile, started)
+        workers = [threading.Thread(target=self._work, args=(schedule, self.profile.worker_rng(index)),
+                                    name=f"load-{index}")
+                   for index in range(self.profile.concurrency)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+        self._cleanup()
+        total = EndpointStats()
+        for stats in self.stats.values():
+            total.merge(stats)
+        summaries = {endpoint: stats.summary(elapsed) for endpoint, stats in self.stats.items()}
+        summaries["total"] = total.summary(elapsed)
+        return summaries
+
+    def _work(self, schedule, rng):
+        """
+        Send requests until the end of the run.
+
+        Args:
+            schedule (_Schedule): The run's schedule.
+            rng (random.Random): The worker's source of endpoint and ID choices.
+        """
+        endpoints = list(self.weights)
+        weights = list(self.weights.values())
+        while True:
+            endpoint = rng.choices(endpoints, weights)[0]
+            path, action = self.ENDPOINTS[endpoint]
+            send, outcome = None, None
+            try:
+                send = getattr(self._resources[path], action)(rng)
+            except (requests.exceptions.RequestException, RuntimeError) as error:
+                outcome = type(error).__name__
+            started = schedule.next_start()
+            if started is None:
+                return
+            if send is not None:
+                try:
+                    outcome = send().status_code
+                except requests.exceptions.RequestException as error:
+                    outcome = type(error).__name__
+            self.stats[endpoint].record(time.perf_counter() - started, outcome)
+
+    def _cleanup(self):
+        """
+        Delete the entities created by the run and not deleted by it.
+        """
+        tracker = None
+        for resource in self._resources.values():
+            tracker = tracker or CleanupTracker(resource.client)
+            for entity_id in resource.created_ids:
+                tracker.track(f"{resource.path}/{entity_id}")
+        for path, reason in tracker.close().items():
+            print(f"Could not delete {path}: {reason}", file=sys.stderr)
+
+def format_summaries(summaries):
+    """
+    Format per-endpoint summaries as a table, followed by the outcomes of the endpoints with errors.
+
+    Args:
+        summaries (dict): Summaries as returned by LoadGenerator.run.
+
+    Returns:
+        str: The table.
+    """
+    columns = ["requests", "errors", "rps"] + [f"p{percent}_ms" for percent in PERCENTILES] + ["max_ms"]
+    width = max(len(endpoint) for endpoint in summaries)
+    lines = [f"{'endpoint':<{width}}" + "".join(f"{column:>10}" for column in columns)]
+    for endpoint, summary in summaries.items():
+        cells = "".join(f"{summary[column]:>10}" if isinstance(summary[column], int) else f"{summary[column]:>10.1f}"
+                        for column in columns)
+        lines.append(f"{endpoint:<{width}}{cells}")
+    for endpoint, summary in summaries.items():
+        if summary["errors"] and endpoint != "total":
+            outcomes = ", ".join(f"{outcome} x{count}" for outcome, count in summary["outcomes"].items())
+            lines.append(f"{endpoint}: {outcomes}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """
+    Run the load generator from the command line.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status, 1 if any request failed.
+    """
+    parser = argparse.ArgumentParser(prog="python -m utils.load",
+                                     description=__doc__.split("Usage:", maxsplit=1)[0].strip())
+    parser.add_argument("--base-url", help="API base URL. Defaults to BASE_URL.")
+    parser.add_argument("--local-server", action="store_true", help="Run against the in-process stand-in server.")
+    parser.add_argument("--local-server-persist", action="store_true",
+                        help="Make the local stand-in server persist POST/PUT/DELETE.")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help="Weighted endpoints, e.g. 'GET /Books/{id}=8,POST /Books=1'.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of concurrent workers.")
+    parser.add_argument("--rps", type=float, help="Target requests per second. Defaults to as fast as possible.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Duration of the run in seconds.")
+    parser.add_argument("--seed", type=int, help="Seed of the endpoint and ID choices and of the payloads.")
+    parser.add_argument("--json", dest="json_path", help="Also write the summaries to this JSON file.")
+    parser.add_argument("--verbose", action="store_true", help="Log every request and response.")
+    args = parser.parse_args(argv)
+    try:
+        weights = parse_mix(args.mix)
+    except ValueError as error:
+        parser.error(str(error))
+    if not args.verbose:
+        logging.getLogger("books_api").setLevel(logging.WARNING)
+
+    server = LocalBookstoreServer(persist_writes=args.local_server_persist).start() if args.local_server else None
+    try:
+        base_url = server.base_url if server else args.base_url
+        client = get_client(base_url, pool_maxsize=max(args.concurrency, POOL_MAXSIZE), read_cache=None,
+                            retry_policy=RetryPolicy(retries=0), circuit_breaker=None)
+        profile = LoadProfile(concurrency=args.concurrency, rps=args.rps, duration=args.duration, seed=args.seed)
+        generator = LoadGenerator(client, weights, profile)
+        summaries = generator.run()
+        client.close()
+    finally:
+        if server:
+            server.stop()
+
+    print(format_summaries(summaries))
+    if args.json_path:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json_path)), exist_ok=True)
+        with open(args.json_path, "w", encoding="utf-8") as json_file:
+            json.dump(summaries, json_file, indent=2)
+    return 1 if summaries["total"]["errors"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,458 @@
+"""
+Local Server Module
+
+In-process stand-in for the FakeRestAPI Books and Authors endpoints, so the tests can
+run without the remote service and have a local target for throughput and parallel runs.
+"""
+
+import gzip
+import json
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+API_PREFIX = "/api/v1"
+SEED_BOOKS = 200
+SEED_AUTHORS = 400
+INT32_MIN, INT32_MAX = -2**31, 2**31 - 1
+JSON_CONTENT_TYPES = ("application/json", "text/json")
+GZIP_MIN_BYTES = 1024
+
+# Field name, .NET type reported in conversion errors, default when the field is missing.
+RESOURCE_FIELDS = {
+    "Books": (
+        ("id", "System.Int32", 0),
+        ("title", "System.String", None),
+        ("description", "System.String", None),
+        ("pageCount", "System.Int32", 0),
+        ("excerpt", "System.String", None),
+        ("publishDate", "System.DateTime", "0001-01-01T00:00:00"),
+    ),
+    "Authors": (
+        ("id", "System.Int32", 0),
+        ("idBook", "System.Int32", 0),
+        ("firstName", "System.String", None),
+        ("lastName", "System.String", None),
+    ),
+}
+
+def _seed_books():
+    """
+    Build the initial Books catalog.
+
+    Returns:
+        list: Book records with IDs 1..SEED_BOOKS.
+    """
+    now = datetime.now(timezone.utc)
+    return [{
+        "id": book_id,
+        "title": f"Book {book_id}",
+        "description": f"Description of book {book_id}",
+        "pageCount": book_id * 100,
+        "excerpt": f"Excerpt of book {book_id}",
+        "publishDate": (now - timedelta(days=book_id)).isoformat(),
+    } for book_id in range(1, SEED_BOOKS + 1)]
+
+def _seed_authors():
+    """
+    Build the initial Authors catalog.
+
+    Returns:
+        list: Author records with IDs 1..SEED_AUTHORS, spread over the seeded books.
+    """
+    return [{
+        "id": author_id,
+        "idBook": (author_id - 1) % SEED_BOOKS + 1,
+        "firstName": f"First Name {author_id}",
+        "lastName": f"Last Name {author_id}",
+    } for author_id in range(1, SEED_AUTHORS + 1)]
+
+def _trace_id():
+    """
+    Return a W3C trace id like the ones ASP.NET puts in problem details.
+    """
+    return f"00-{uuid.uuid4().hex}-{uuid.uuid4().hex[:16]}-00"
+
+def _converts(type_name, value):
+    """
+    Check whether a JSON value converts to the .NET type of a field.
+
+    Args:
+        type_name (str): "System.Int32", "System.String" or "System.DateTime".
+        value: The decoded JSON value.
+
+    Returns:
+        bool: True if the value converts.
+    """
+    if type_name == "System.Int32":
+        return isinstance(value, int) and not isinstance(value, bool) and INT32_MIN <= value <= INT32_MAX
+    if type_name == "System.String":
+        return value is None or isinstance(value, str)
+    if not isinstance(value, str):
+        return False
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+def _parse_id(raw_id):
+    """
+    Parse a route ID the way ASP.NET binds an int parameter.
+
+    Args:
+        raw_id (str): The decoded route segment.
+
+    Returns:
+        int | None: The ID, or None if it is not a valid 32-bit integer.
+    """
+    digits = raw_id[1:] if raw_id.startswith("-") else raw_id
+    if not digits.isascii() or not digits.isdigit():
+        return None
+    value = int(raw_id)
+    return value if INT32_MIN <= value <= INT32_MAX else None
+
+class _ResourceStore:
+    """
+    Thread-safe in-memory store of one resource's records, indexed by ID.
+    The serialized listing is cached until the next write.
+    """
+
+    def __init__(self, records):
+        """
+        Args:
+            records (list): Initial records.
+        """
+        self._records = {record["id"]: record for record in records}
+        self._listing = None
+        self._lock = threading.Lock()
+
+    def listing(self):
+        """
+        Return all records, ordered by ID, serialized as a JSON array.
+        """
+        with self._lock:
+            if self._listing is None:
+                self._listing = json.dumps([self._records[key] for key in sorted(self._records)]).encode("utf-8")
+            return self._listing
+
+    def get(self, record_id):
+        """
+        Return the record with the given ID, or None.
+        """
+        with self._lock:
+            return self._records.get(record_id)
+
+    def insert(self, record):
+        """
+        Store a new record.
+
+        Returns:
+            bool: False if a record with the same ID already exists.
+        """
+        with self._lock:
+            if record["id"] in self._records:
+                return False
+            self._records[record["id"]] = record
+            self._listing = None
+            return True
+
+    def replace(self, record_id, record):
+        """
+        Replace an existing record.
+
+        Returns:
+            bool: False if no record has the given ID.
+        """
+        with self._lock:
+            if record_id not in self._records:
+                return False
+            self._records[record_id] = record
+            self._listing = None
+            return True
+
+    def delete(self, record_id):
+        """
+        Delete a record.
+
+        Returns:
+            bool: False if no record has the given ID.
+        """
+        with self._lock:
+            if self._records.pop(record_id, None) is None:
+                return False
+            self._listing = None
+            return True
+
+class _BookstoreHTTPServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server holding a reference to the LocalBookstoreServer it serves.
+    """
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address, bookstore):
+        """
+        Args:
+            address (tuple): Host and port to bind.
+            bookstore (LocalBookstoreServer): The stand-in whose stores are served.
+        """
+        self.bookstore = bookstore
+        super().__init__(address, _BookstoreRequestHandler)
+
+class _BookstoreRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves /api/v1/Books and /api/v1/Authors with FakeRestAPI's response shapes,
+    including 400 problem details with an errors object and 415 responses.
+    """
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY every keep-alive
+    # response waits for the client's delayed ACK (~40 ms).
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Handle GET requests."""
+        self._dispatch("GET")
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Handle POST requests."""
+        self._dispatch("POST")
+
+    def do_PUT(self):  # pylint: disable=invalid-name
+        """Handle PUT requests."""
+        self._dispatch("PUT")
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        """Handle DELETE requests."""
+        self._dispatch("DELETE")
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep the test output quiet; requests are already logged by APILogger."""
+
+    def _dispatch(self, method):
+        """
+        Route a request to its resource handler.
+
+        Args:
+            method (str): The HTTP method.
+        """
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = urlsplit(self.path).path
+        segments = path[len(API_PREFIX):].strip("/").split("/") if path.startswith(API_PREFIX + "/") else []
+        resource = next((name for name in RESOURCE_FIELDS if segments and segments[0].lower() == name.lower()), None)
+        if resource is None or len(segments) > 2 or (len(segments) == 1 and method in ("PUT", "DELETE")):
+            self._send_problem(404, "Not Found", "https://tools.ietf.org/html/rfc7231#section-6.5.4")
+            return
+        raw_id = unquote(segments[1]) if len(segments) == 2 else None
+        if method in ("POST", "PUT") and not self._has_json_content_type():
+            self._send_problem(415, "Unsupported Media Type", "https://tools.ietf.org/html/rfc7231#section-6.5.13")
+            return
+        errors = {}
+        record_id = None
+        if raw_id is not None:
+            record_id = _parse_id(raw_id)
+            if record_id is None:
+                errors["id"] = [f"The value '{raw_id}' is not valid."]
+        record = self._bind_body(resource, body, errors) if method in ("POST", "PUT") else None
+        if errors:
+            self._send_problem(400, "One or more validation errors occurred.",
+                               "https://tools.ietf.org/html/rfc7231#section-6.5.1", errors=errors)
+            return
+        handler = getattr(self, f"_{method.lower()}")
+        handler(self.server.bookstore.stores[resource], record_id, record)
+
+    def _get(self, store, record_id, _record):
+        """Return the listing, or a single record or 404."""
+        if record_id is None:
+            self._send_body(200, store.listing())
+            return
+        record = store.get(record_id)
+        if record is None:
+            self._send_problem(404, "Not Found", "https://tools.ietf.org/html/rfc7231#section-6.5.4")
+        else:
+            self._send_json(200, record)
+
+    def _post(self, store, _record_id, record):
+        """Create a record, echoing it back like FakeRestAPI."""
+        if self.server.bookstore.persist_writes and not store.insert(record):
+            self._send_problem(400, "One or more validation errors occurred.",
+                               "https://tools.ietf.org/html/rfc7231#section-6.5.1",
+                               errors={"id": [f"An entity with id {record['id']} already exists."]})
+            return
+        self._send_json(200, record)
+
+    def _put(self, store, record_id, record):
+        """Update a record, echoing it back like FakeRestAPI."""
+        if self.server.bookstore.persist_writes and not store.replace(record_id, record):
+            self._send_problem(404, "Not Found", "https://tools.ietf.org/html/rfc7231#section-6.5.4")
+            return
+        self._send_json(200, record)
+
+    def _delete(self, store, record_id, _record):
+        """Delete a record, answering 200 with an empty body like FakeRestAPI."""
+        if self.server.bookstore.persist_writes and not store.delete(record_id):
+            self._send_problem(404, "Not Found", "https://tools.ietf.org/html/rfc7231#section-6.5.4")
+            return
+        self._send_body(200, b"")
+
+    def _accepts_gzip(self):
+        """
+        Check the request's Accept-Encoding allows gzip.
+        """
+        for coding in (self.headers.get("Accept-Encoding") or "").lower().split(","):
+            name, _, params = coding.partition(";")
+            if name.strip() in ("gzip", "*") and params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                return True
+        return False
+
+    def _has_json_content_type(self):
+        """
+        Check the request declares a JSON body.
+        """
+        content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        return content_type in JSON_CONTENT_TYPES or content_type.endswith("+json")
+
+    @staticmethod
+    def _bind_body(resource, body, errors):
+        """
+        Bind a JSON body to a resource record like System.Text.Json model binding.
+
+        Missing fields take their default value and the first value that does not convert
+        to its field's type is reported under its JSON path.
+
+        Args:
+            resource (str): "Books" or "Authors".
+            body (bytes): The raw request body.
+            errors (dict): Validation errors, updated in place.
+
+        Returns:
+            dict: The bound record.
+        """
+        fields = RESOURCE_FIELDS[resource]
+        record = {name: default for name, _, default in fields}
+        if not body:
+            errors[""] = ["A non-empty request body is required."]
+            return record
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            errors["$"] = ["The request body is not valid JSON. Path: $ | LineNumber: 0 | BytePositionInLine: 0."]
+            return record
+        if not isinstance(payload, dict):
+            errors["$"] = [f"The JSON value could not be converted to {resource}. Path: $ | LineNumber: 0 | "
+                           "BytePositionInLine: 1."]
+            return record
+        field_types = {name.lower(): (name, type_name) for name, type_name, _ in fields}
+        for key, value in payload.items():
+            if key.lower() not in field_types:
+                continue
+            name, type_name = field_types[key.lower()]
+            if not _converts(type_name, value):
+                position = body.find(json.dumps(key).encode("utf-8"))
+                errors[f"$.{key}"] = [f"The JSON value could not be converted to {type_name}. Path: $.{key} | "
+                                      f"LineNumber: 0 | BytePositionInLine: {max(position, 0)}."]
+                break
+            record[name] = value
+        return record
+
+    def _send_problem(self, status, title, problem_type, errors=None):
+        """
+        Send an RFC 7807 problem details response.
+        """
+        problem = {"type": problem_type, "title": title, "status": status, "traceId": _trace_id()}
+        if errors is not None:
+            problem["errors"] = errors
+        self._send_body(status, json.dumps(problem).encode("utf-8"), "application/problem+json; charset=utf-8")
+
+    def _send_json(self, status, body):
+        """
+        Send a JSON response.
+        """
+        self._send_body(status, json.dumps(body).encode("utf-8"))
+
+    def _send_body(self, status, data, content_type="application/json; charset=utf-8; v=1.0"):
+        """
+        Send a response with an explicit Content-Length so connections can be kept alive,
+        gzip-compressing bodies of GZIP_MIN_BYTES or more when the client accepts it.
+        """
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", content_type)
+            self.send_header("Vary", "Accept-Encoding")
+        if len(data) >= GZIP_MIN_BYTES and self._accepts_gzip():
+            data = gzip.compress(data, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+class LocalBookstoreServer:
+    """
+    Threaded local HTTP server emulating FakeRestAPI's /Books and /Authors endpoints.
+
+    By default writes are answered like the remote service, which echoes POST and PUT
+    payloads and accepts every DELETE without changing its catalog. With persist_writes
+    the in-memory stores behave as a real CRUD backend (duplicate IDs are rejected,
+    unknown IDs answer 404).
+
+    Attributes:
+        persist_writes (bool): Whether POST/PUT/DELETE change the stores.
+        stores (dict): Resource name to its in-memory store.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, persist_writes=False):
+        """
+        Initialize the server and seed its stores; it does not listen until started.
+
+        Args:
+            host (str, optional): Interface to bind.
+            port (int, optional): Port to bind; 0 picks a free one.
+            persist_writes (bool, optional): Whether POST/PUT/DELETE change the stores.
+        """
+        self.persist_writes = persist_writes
+        self.stores = {"Books": _ResourceStore(_seed_books()), "Authors": _ResourceStore(_seed_authors())}
+        self._httpd = _BookstoreHTTPServer((host, port), self)
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """
+        str: Base URL of the API, to use in place of the remote BASE_URL.
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self):
+        """
+        Start serving requests on a background thread.
+
+        Returns:
+            LocalBookstoreServer: The server itself.
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="local-bookstore-server",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving requests and release the socket.
+        """
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        """
+        Start the server when entering a with block.
+        """
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        """
+        Stop the server when leaving a with block.
+        """
+        self.stop()
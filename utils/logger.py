@@ -6,8 +6,147 @@ Logs HTTP requests and responses for API clients to aid debugging.
 
 import json
 import logging
+import os
+import queue
 import sys
+import time
+from datetime import datetime, timezone
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from config.config import (LOG_BODY_MAX_ITEMS, LOG_BODY_MAX_LENGTH, TRAFFIC_LOG_BACKUP_COUNT,
+                           TRAFFIC_LOG_MAX_BYTES, TRAFFIC_LOG_PATH)
+from utils.id_allocator import worker_path
+
+class _LazyBody:
+    """
+    Defers decoding and formatting of a request or response body until a log record
+    is actually emitted, truncating it so the cost does not grow with the payload size.
+    """
+
+    __slots__ = ("_load_body", "_max_length", "_max_items")
+
+    def __init__(self, load_body, max_length, max_items):
+        """
+        Args:
+            load_body (callable): Returns the body to format when called.
+            max_length (int): Maximum number of UTF-8 bytes logged, 0 for no limit.
+            max_items (int): Maximum number of list items logged, 0 for no limit.
+        """
+        self._load_body = load_body
+        self._max_length = max_length
+        self._max_items = max_items
+
+    def __str__(self):
+        """
+        Format the body as JSON, keeping at most max_items list items and max_length bytes.
+
+        List items are dropped before serializing, and the body is serialized piece by piece
+        until max_length bytes are reached, so a large body is never formatted in full.
+        """
+        body = self._load_body()
+        more_items = 0
+        if isinstance(body, list) and self._max_items and len(body) > self._max_items:
+            more_items = len(body) - self._max_items
+            body = body[:self._max_items]
+        if isinstance(body, bytes):
+            chunks = (body.decode("utf-8", errors="replace"),)
+        elif isinstance(body, str):
+            chunks = (body,)
+        else:
+            chunks = _BODY_ENCODER.iterencode(body)
+        text, truncated = _take_bytes(chunks, self._max_length)
+        if truncated:
+            text += f" ... (truncated to {self._max_length} bytes)"
+        if more_items:
+            text += f" ... ({more_items} more items)"
+        return text
+
+_BODY_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+def _take_bytes(chunks, limit):
+    """
+    Join text chunks up to a number of UTF-8 bytes, without consuming or encoding the chunks past it.
+
+    Args:
+        chunks (iterable): Text chunks.
+        limit (int): Maximum number of bytes, 0 for no limit.
+
+    Returns:
+        tuple: The text, and whether chunks were cut off.
+    """
+    taken = bytearray()
+    for chunk in chunks:
+        if limit:
+            # A character is at least one byte, so the characters past this slice are over the limit anyway.
+            chunk = chunk[:limit - len(taken) + 1]
+        taken += chunk.encode("utf-8", errors="replace")
+        if limit and len(taken) > limit:
+            return taken[:limit].decode("utf-8", errors="ignore"), True
+    return taken.decode("utf-8"), False
+
+class _JsonLineFormatter(logging.Formatter):
+    """
+    Formats the traffic fields attached to a log record as a single JSON line.
+    """
+
+    def format(self, record):
+        """
+        Return the record's traffic fields serialized as JSON.
+        """
+        return json.dumps(getattr(record, "traffic", {"message": record.getMessage()}), default=str)
+
+class TrafficLog:
+    """
+    Structured traffic log writing one JSON record per request/response to a rotating JSONL file.
+
+    Records are put on a queue by a QueueHandler and serialized and written by a
+    QueueListener thread, so logging never blocks the request path on file I/O.
+
+    Attributes:
+        path (str): Path of the JSONL file.
+        logger (logging.Logger): Logger whose records are queued for the file.
+    """
+
+    def __init__(self, path, max_bytes=TRAFFIC_LOG_MAX_BYTES, backup_count=TRAFFIC_LOG_BACKUP_COUNT):
+        """
+        Initialize the traffic log and start its background writer.
+
+        Args:
+            path (str): Path of the JSONL file; its directory is created if needed.
+            max_bytes (int, optional): Size at which the file is rotated.
+            backup_count (int, optional): Number of rotated files kept.
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        file_handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8",
+                                           delay=True)
+        file_handler.setFormatter(_JsonLineFormatter())
+        records = queue.SimpleQueue()
+        self._queue_handler = QueueHandler(records)
+        self._listener = QueueListener(records, file_handler)
+        self.logger = logging.getLogger(f"books_api.traffic.{id(self)}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(self._queue_handler)
+        self._listener.start()
+
+    def record(self, **fields):
+        """
+        Queue one traffic record for the background writer.
+
+        Args:
+            **fields: JSON-serializable fields of the record.
+        """
+        self.logger.info("traffic", extra={"traffic": fields})
+
+    def close(self):
+        """
+        Flush all queued records to the file and stop the background writer.
+        """
+        self.logger.removeHandler(self._queue_handler)
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
 
 class APILogger:
     """
@@ -17,19 +156,33 @@ class APILogger:
     the request details (method, URL, headers, payload) and the response details
     (status code and body).
 
+    Bodies are only decoded and formatted when the INFO level is enabled and a record
+    is emitted, and are truncated to keep the logging cost independent of payload size.
+
     Attributes:
         logger (logging.Logger): The underlying logger instance.
+        max_body_length (int): Maximum number of body bytes logged, 0 for no limit.
+        max_body_items (int): Maximum number of items logged for list bodies, 0 for no limit.
+        traffic_log (TrafficLog): Optional structured traffic log.
     """
 
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, max_body_length=LOG_BODY_MAX_LENGTH, max_body_items=LOG_BODY_MAX_ITEMS,
+                 traffic_log=None):
         """
         Initialize the APILogger with an optional custom logger.
 
         Args:
             logger (logging.Logger, optional): A pre-configured logger instance.
                 If not provided, a default logger named 'books_api' is created.
+            max_body_length (int, optional): Maximum number of body bytes logged, 0 for no limit.
+            max_body_items (int, optional): Maximum number of items logged for list bodies, 0 for no limit.
+            traffic_log (TrafficLog, optional): Structured log receiving one JSON record per
+                request/response, in addition to the human-readable log.
         """
         self.logger = logger or self._default_logger()
+        self.max_body_length = max_body_length
+        self.max_body_items = max_body_items
+        self.traffic_log = traffic_log
 
     def _default_logger(self):
         """
@@ -63,8 +216,6 @@ class APILogger:
         Returns:
             function: The wrapped function with logging enabled.
         """
-        logger = self.logger
-
         def decorator(func):
             """
             Decorator function that wraps an API client method to log the HTTP request and response.
@@ -90,18 +241,209 @@ class APILogger:
                 Returns:
                     Response: The response object returned by the original API client method.
                 """
-                url = f"{api_client_self.base_url}{endpoint}"
-                headers = kwargs.get("headers", {})
-                data = kwargs.get("data", None) or kwargs.get("json", None)
-                logger.info(f"Request: {method_name} {url} | Headers: {headers} | Payload: {data}")
-                response = func(api_client_self, endpoint, *args, **kwargs)
+                self._log_request(method_name, api_client_self.base_url, endpoint, kwargs)
+                started = time.perf_counter()
                 try:
-                    response_body = response.json() if response.content else None
-                except json.JSONDecodeError:
-                    response_body = response.text
-                logger.info(f"Response [{response.status_code}]: {response_body}")
+                    response = func(api_client_self, endpoint, *args, **kwargs)
+                except Exception as error:
+                    self._record_traffic(method_name, f"{api_client_self.base_url}{endpoint}", started, error)
+                    raise
+                self._log_response(response)
+                self._record_traffic(method_name, f"{api_client_self.base_url}{endpoint}", started, response)
                 return response
             return wrapper
         return decorator
 
-default_api_logger = APILogger()
+    def log_async_request_response(self, method_name):
+        """
+        Async-aware variant of log_request_response for coroutine API client methods.
+
+        The request is logged before the coroutine is awaited and the response once it
+        completes, so concurrent calls each log their own request/response pair.
+
+        Args:
+            method_name (str): The HTTP method name (e.g., 'GET', 'POST', 'PUT', 'DELETE')
+                used in the logged message.
+
+        Returns:
+            function: The wrapped coroutine function with logging enabled.
+        """
+        def decorator(func):
+            """
+            Decorator function that wraps an async API client method to log the HTTP request and response.
+
+            Args:
+                func (function): The coroutine API client method to wrap (e.g., get, post, put).
+
+            Returns:
+                function: The wrapped coroutine function that logs request and response details.
+            """
+            @wraps(func)
+            async def wrapper(api_client_self, endpoint, *args, **kwargs):
+                """
+                Wrapper coroutine that logs request details before awaiting the original method,
+                then logs response details afterward.
+
+                Args:
+                    api_client_self: The instance of the async API client making the request.
+                    endpoint (str): The API endpoint being called.
+                    *args: Additional positional arguments to pass to the original method.
+                    **kwargs: Additional keyword arguments to pass, may include headers, data, json, etc.
+
+                Returns:
+                    Response: The response object returned by the original API client method.
+                """
+                self._log_request(method_name, api_client_self.base_url, endpoint, kwargs)
+                started = time.perf_counter()
+                try:
+                    response = await func(api_client_self, endpoint, *args, **kwargs)
+                except Exception as error:
+                    self._record_traffic(method_name, f"{api_client_self.base_url}{endpoint}", started, error)
+                    raise
+                self._log_response(response)
+                self._record_traffic(method_name, f"{api_client_self.base_url}{endpoint}", started, response)
+                return response
+            return wrapper
+        return decorator
+
+    def _log_request(self, method_name, base_url, endpoint, kwargs):
+        """
+        Log the HTTP method, URL, headers and payload of an outgoing request.
+
+        Args:
+            method_name (str): The HTTP method name used in the logged message.
+            base_url (str): The base URL of the API client.
+            endpoint (str): The API endpoint being called.
+            kwargs (dict): Keyword arguments of the call, may include headers, data, json, etc.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        data = kwargs.get("data", None) or kwargs.get("json", None)
+        self.logger.info("Request: %s %s%s | Headers: %s | Payload: %s", method_name, base_url, endpoint,
+                         kwargs.get("headers", {}), self._lazy_body(lambda: data))
+
+    def _log_response(self, response):
+        """
+        Log the status code and body of a received response.
+
+        Args:
+            response (requests.Response): The response to log.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Response [%s]: %s", response.status_code,
+                         self._lazy_body(lambda: self._response_body(response)))
+
+    def log_streamed_list(self, url, streamed, started):
+        """
+        Log a streamed list response once it is closed, also recording it in the traffic log if one is configured.
+
+        Args:
+            url (str): The full URL called.
+            streamed (StreamedList): The closed streamed list.
+            started (float): time.perf_counter() value taken before the request was sent.
+        """
+        self.logger.info("Streamed GET %s | Response [%s]: %d items, %d bytes%s", url, streamed.status_code,
+                         streamed.items_read, streamed.bytes_read, "" if streamed.complete else " (stopped early)")
+        self._record_traffic("GET", url, started, streamed.response, response_bytes=streamed.bytes_read,
+                             items=streamed.items_read, complete=streamed.complete)
+
+    def log_retry(self, method_name, url, attempt, outcome, delay):
+        """
+        Log that a request is about to be retried.
+
+        Args:
+            method_name (str): The HTTP method name.
+            url (str): The full URL called.
+            attempt (int): Number of the retry, starting at 1.
+            outcome (requests.Response | Exception): The response, or the error raised, of the failed attempt.
+            delay (float): Seconds waited before the retry.
+        """
+        reason = repr(outcome) if isinstance(outcome, Exception) else f"HTTP {outcome.status_code}"
+        self.logger.warning("Retry %d of %s %s in %.2fs after %s", attempt, method_name, url, delay, reason)
+
+    def log_circuit_state(self, name, old_state, new_state, reason):
+        """
+        Log a state change of a circuit breaker, also recording it in the traffic log if one is configured.
+
+        Args:
+            name (str): Name of the circuit, e.g. the client's base URL.
+            old_state (str): The previous state.
+            new_state (str): The new state.
+            reason (str): Why the state changed.
+        """
+        self.logger.warning("Circuit breaker for %s: %s -> %s (%s)", name, old_state, new_state, reason)
+        if self.traffic_log is not None:
+            self.traffic_log.record(timestamp=datetime.now(timezone.utc).isoformat(), event="circuit_breaker",
+                                    circuit=name, old_state=old_state, new_state=new_state, reason=reason)
+
+    def _record_traffic(self, method_name, url, started, outcome, **extra):
+        """
+        Send a structured record of a request/response to the traffic log, if one is configured.
+
+        Args:
+            method_name (str): The HTTP method name.
+            url (str): The full URL called.
+            started (float): time.perf_counter() value taken before the request was sent.
+            outcome (requests.Response | Exception): The received response, or the error raised instead.
+            **extra: Additional fields of the record, response_bytes overriding the size of the
+                response's body (e.g. for a streamed response that was not read in full).
+        """
+        if self.traffic_log is None:
+            return
+        fields = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "test": os.environ.get("PYTEST_CURRENT_TEST", "").split(" (")[0] or None,
+            "method": method_name,
+            "url": url,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+        if isinstance(outcome, Exception):
+            fields["error"] = repr(outcome)
+        else:
+            request_body = outcome.request.body if outcome.request is not None else None
+            fields.update({
+                "status": outcome.status_code,
+                "elapsed_ms": round(outcome.elapsed.total_seconds() * 1000, 3),
+                "request_bytes": len(request_body) if request_body else 0,
+                "response_bytes": len(outcome.content or b"") if "response_bytes" not in extra else 0,
+            })
+        fields.update(extra)
+        self.traffic_log.record(**fields)
+
+    def close(self):
+        """
+        Flush and close the traffic log, if one is configured.
+        """
+        if self.traffic_log is not None:
+            self.traffic_log.close()
+
+    def _lazy_body(self, load_body):
+        """
+        Wrap a body loader so it is only decoded and formatted when the record is emitted.
+
+        Args:
+            load_body (callable): Returns the body to format when called.
+
+        Returns:
+            _LazyBody: Lazily formatted, truncated body.
+        """
+        return _LazyBody(load_body, self.max_body_length, self.max_body_items)
+
+    @staticmethod
+    def _response_body(response):
+        """
+        Decode the response body as JSON, falling back to text.
+
+        Args:
+            response (requests.Response): The response to decode.
+
+        Returns:
+            The decoded JSON body, the raw text, or None for an empty body.
+        """
+        try:
+            return response.json() if response.content else None
+        except json.JSONDecodeError:
+            return response.text
+
+default_api_logger = APILogger(traffic_log=TrafficLog(worker_path(TRAFFIC_LOG_PATH)) if TRAFFIC_LOG_PATH else None)
@@ -0,0 +1,295 @@
+"""
+Payloads Module
+
+Generates the book and author payloads used by the functional tests and the load generator.
+PayloadGenerator produces them in reproducible batches from a seeded RNG, with configurable
+field distributions, lazily or into a JSONL test-data file that load_payloads reads back.
+
+Usage:
+    python -m utils.payloads books 10000 --seed 42 --output data/books.jsonl
+    python -m utils.payloads authors 500 --seed 7 --null-ratio 0.1 --long-string-ratio 0.05
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from itertools import count as count_from, islice, repeat
+from config.config import PAYLOAD_SEED
+
+RESOURCES = ("books", "authors")
+DEFAULT_ID_RANGE = (1, 100000)
+DEFAULT_PUBLISH_DATES = (datetime(2000, 1, 1), datetime(2025, 1, 1))
+
+class PayloadDistribution:
+    """
+    Distributions the generated field values are drawn from.
+
+    Attributes:
+        page_count (tuple): Inclusive (min, max) range of pageCount.
+        id_book (tuple): Inclusive (min, max) range of idBook.
+        publish_dates (tuple): (start, end) datetimes publishDate is drawn from uniformly.
+        null_ratio (float): Share of string fields (title, description, excerpt, firstName,
+            lastName) that are null.
+        long_string_ratio (float): Share of the other string fields padded to long_string_length.
+        long_string_length (int): Length of the long strings.
+    """
+
+    def __init__(self, *, page_count=(50, 1000), id_book=(1, 1000),  # pylint: disable=too-many-arguments
+                 publish_dates=DEFAULT_PUBLISH_DATES, null_ratio=0.0, long_string_ratio=0.0, long_string_length=1000):
+        """
+        Args:
+            page_count (tuple, optional): Inclusive (min, max) range of pageCount.
+            id_book (tuple, optional): Inclusive (min, max) range of idBook.
+            publish_dates (tuple, optional): (start, end) datetimes of publishDate. The default
+                range is fixed so that payloads do not depend on the day they are generated.
+            null_ratio (float, optional): Share of string fields that are null.
+            long_string_ratio (float, optional): Share of string fields padded to long_string_length.
+            long_string_length (int, optional): Length of the long strings.
+
+        Raises:
+            ValueError: If a range is empty or a ratio is not between 0 and 1.
+        """
+        for name, (low, high) in (("page_count", page_count), ("id_book", id_book), ("publish_dates", publish_dates)):
+            if low > high:
+                raise ValueError(f"Empty {name} range {low}..{high}")
+        if not 0 <= null_ratio <= 1 or not 0 <= long_string_ratio <= 1:
+            raise ValueError("null_ratio and long_string_ratio must be between 0 and 1")
+        self.page_count = page_count
+        self.id_book = id_book
+        self.publish_dates = publish_dates
+        self.null_ratio = null_ratio
+        self.long_string_ratio = long_string_ratio
+        self.long_string_length = long_string_length
+
+class PayloadGenerator:
+    """
+    Generates book or author payloads from a seeded RNG.
+
+    The same seed and distribution always produce the same payloads, in any process.
+    Random parts of strings come from the RNG's bits instead of uuid4(), and dates are
+    offsets from the distribution's start, so generating thousands of payloads is cheap.
+
+    Attributes:
+        resource (str): "books" or "authors".
+        seed (int | str | None): Seed of the RNG, None for a random one.
+        distribution (PayloadDistribution): Distributions of the field values.
+    """
+
+    def __init__(self, resource, seed=None, distribution=None):
+        """
+        Args:
+            resource (str): "books" or "authors".
+            seed (int | str, optional): Seed of the RNG. Defaults to a random seed.
+            distribution (PayloadDistribution, optional): Distributions of the field values.
+
+        Raises:
+            ValueError: If the resource is unknown.
+        """
+        if resource not in RESOURCES:
+            raise ValueError(f"Unknown resource '{resource}', expected one of {RESOURCES}")
+        self.resource = resource
+        self.seed = seed
+        self.distribution = distribution or PayloadDistribution()
+        self._rng = random.Random(seed)
+        start, end = self.distribution.publish_dates
+        self._date_start = start
+        self._date_span = int((end - start).total_seconds() * 1_000_000)
+
+    def reseed(self, seed):
+        """
+        Restart the generator's RNG from a seed.
+
+        Args:
+            seed (int | str | None): The new seed, None for a random one.
+        """
+        self.seed = seed
+        self._rng.seed(seed)
+
+    def payload(self, entity_id=None, overrides=None):
+        """
+        Generate one payload.
+
+        Args:
+            entity_id (int, optional): The payload's ID. Defaults to a random ID.
+            overrides (dict, optional): Fields replacing the generated ones.
+
+        Returns:
+            dict: The payload.
+        """
+        rng = self._rng
+        entity_id = entity_id or rng.randint(*DEFAULT_ID_RANGE)
+        if self.resource == "books":
+            data = {
+                "id": entity_id,
+                "title": self._string("Book Title", 6),
+                "description": self._string("Description", 10),
+                "pageCount": rng.randint(*self.distribution.page_count),
+                "excerpt": self._string("Excerpt text", 8),
+                "publishDate": (self._date_start + timedelta(microseconds=rng.randint(0, self._date_span))).isoformat()
+                               + "Z",
+            }
+        else:
+            data = {
+                "id": entity_id,
+                "idBook": rng.randint(*self.distribution.id_book),
+                "firstName": self._string("First", 6, separator=""),
+                "lastName": self._string("Last", 6, separator=""),
+            }
+        if overrides:
+            data.update(overrides)
+        return data
+
+    def iter_payloads(self, count=None, ids=None):
+        """
+        Generate payloads lazily.
+
+        Args:
+            count (int, optional): Number of payloads. Defaults to one per ID, or no limit without IDs.
+            ids (iterable, optional): IDs of the payloads, e.g. a range reserved with IdAllocator.reserve.
+                Defaults to random IDs.
+
+        Returns:
+            iterator: The payloads, generated as they are consumed.
+        """
+        payloads = (self.payload(entity_id) for entity_id in (repeat(None) if ids is None else ids))
+        return payloads if count is None else islice(payloads, count)
+
+    def generate(self, count, ids=None):
+        """
+        Generate a batch of payloads.
+
+        Args:
+            count (int): Number of payloads.
+            ids (iterable, optional): IDs of the payloads. Defaults to random IDs.
+
+        Returns:
+            list: The payloads.
+        """
+        return list(self.iter_payloads(count, ids))
+
+    def write(self, path, count, ids=None):
+        """
+        Write payloads to a JSONL test-data file, one payload per line, without holding them in memory.
+
+        Args:
+            path (str): Path of the file, created with its directory if needed.
+            count (int): Number of payloads.
+            ids (iterable, optional): IDs of the payloads. Defaults to random IDs.
+
+        Returns:
+            int: Number of payloads written.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        written = 0
+        with open(path, "w", encoding="utf-8") as data_file:
+            for payload in self.iter_payloads(count, ids):
+                data_file.write(json.dumps(payload) + "\n")
+                written += 1
+        return written
+
+    def _string(self, prefix, hex_digits, separator=" "):
+        """
+        Generate a string field: a prefix and random hex digits, null or padded per the distribution.
+
+        Args:
+            prefix (str): Fixed start of the string.
+            hex_digits (int): Number of random hex digits appended.
+            separator (str, optional): Between the prefix and the digits.
+
+        Returns:
+            str | None: The string.
+        """
+        rng = self._rng
+        distribution = self.distribution
+        if distribution.null_ratio and rng.random() < distribution.null_ratio:
+            return None
+        text = f"{prefix}{separator}{rng.getrandbits(hex_digits * 4):0{hex_digits}x}"
+        if distribution.long_string_ratio and rng.random() < distribution.long_string_ratio:
+            text = text.ljust(distribution.long_string_length, "x")
+        return text
+
+def load_payloads(path):
+    """
+    Read payloads back from a JSONL test-data file, one at a time.
+
+    Args:
+        path (str): Path of the file written by PayloadGenerator.write.
+
+    Yields:
+        dict: The payloads, in file order.
+    """
+    with open(path, encoding="utf-8") as data_file:
+        for line in data_file:
+            if line.strip():
+                yield json.loads(line)
+
+_book_generator = PayloadGenerator("books", seed=PAYLOAD_SEED)
+_author_generator = PayloadGenerator("authors", seed=PAYLOAD_SEED)
+
+def seed_payloads(seed):
+    """
+    Reseed the generators behind generate_book_payload and generate_author_payload, e.g. per
+    test so that each test draws the same payloads whichever tests run before it.
+
+    Args:
+        seed (int | str | None): The new seed, None for a random one.
+    """
+    _book_generator.reseed(seed)
+    _author_generator.reseed(seed)
+
+def generate_book_payload(book_id=None, overrides=None):
+    """Generate book data payload with optional ID and overrides."""
+    return _book_generator.payload(book_id, overrides)
+
+def generate_author_payload(author_id=None, overrides=None):
+    """Creates and returns a fake author payload."""
+    return _author_generator.payload(author_id, overrides)
+
+def main(argv=None):
+    """
+    Generate a test-data file from the command line.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status.
+    """
+    parser = argparse.ArgumentParser(prog="python -m utils.payloads",
+                                     description=__doc__.split("Usage:", maxsplit=1)[0].strip())
+    parser.add_argument("resource", choices=RESOURCES, help="Kind of payloads.")
+    parser.add_argument("count", type=int, help="Number of payloads.")
+    parser.add_argument("--seed", type=int, help="Seed of the RNG, for reproducible data.")
+    parser.add_argument("--first-id", type=int, help="Number the payloads from this ID. Defaults to random IDs.")
+    parser.add_argument("--page-count", type=int, nargs=2, default=(50, 1000), metavar=("MIN", "MAX"),
+                        help="Range of pageCount.")
+    parser.add_argument("--id-book", type=int, nargs=2, default=(1, 1000), metavar=("MIN", "MAX"),
+                        help="Range of idBook.")
+    parser.add_argument("--publish-dates", type=datetime.fromisoformat, nargs=2, metavar=("START", "END"),
+                        help="Range of publishDate, as ISO dates. Defaults to 2000-01-01 2025-01-01.")
+    parser.add_argument("--null-ratio", type=float, default=0.0, help="Share of null string fields.")
+    parser.add_argument("--long-string-ratio", type=float, default=0.0, help="Share of long string fields.")
+    parser.add_argument("--long-string-length", type=int, default=1000, help="Length of the long strings.")
+    parser.add_argument("--output", help="JSONL file to write. Defaults to standard output.")
+    args = parser.parse_args(argv)
+    try:
+        distribution = PayloadDistribution(page_count=tuple(args.page_count), id_book=tuple(args.id_book),
+                                           publish_dates=tuple(args.publish_dates or DEFAULT_PUBLISH_DATES),
+                                           null_ratio=args.null_ratio, long_string_ratio=args.long_string_ratio,
+                                           long_string_length=args.long_string_length)
+    except ValueError as error:
+        parser.error(str(error))
+    generator = PayloadGenerator(args.resource, seed=args.seed, distribution=distribution)
+    ids = None if args.first_id is None else count_from(args.first_id)
+    if args.output:
+        print(f"Wrote {generator.write(args.output, args.count, ids)} {args.resource} to {args.output}")
+    else:
+        for payload in generator.iter_payloads(args.count, ids):
+            sys.stdout.write(json.dumps(payload) + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
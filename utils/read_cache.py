@@ -0,0 +1,199 @@
+"""
+Read Cache Module
+
+Defines ReadCache, an opt-in HTTP cache of the API client's GET responses. Responses
+with an ETag or Last-Modified header are revalidated with a conditional GET; others are
+served for a fixed time to live. The cache is bounded in bytes with LRU eviction, and
+writes to a resource invalidate the cached responses of that resource.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode, urlsplit
+from config.config import READ_CACHE_MAX_BYTES, READ_CACHE_TTL_SECONDS
+
+class _CacheEntry:
+    """
+    A cached response and what is needed to revalidate it.
+    """
+
+    def __init__(self, response):
+        """
+        Args:
+            response (requests.Response): The cached 200 response.
+        """
+        self.response = response
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.size = len(response.content)
+        self.stored_at = time.monotonic()
+
+    @property
+    def revalidates(self):
+        """
+        bool: Whether the response has a validator and is revalidated instead of expiring.
+        """
+        return bool(self.etag or self.last_modified)
+
+class ReadCache:
+    """
+    LRU cache of GET responses keyed by URL and query parameters. Safe to use from several threads.
+
+    Attributes:
+        ttl (float): Seconds a response without validators is served from the cache.
+        max_bytes (int): Total body size above which the least recently used responses are evicted.
+    """
+
+    def __init__(self, ttl=READ_CACHE_TTL_SECONDS, max_bytes=READ_CACHE_MAX_BYTES):
+        """
+        Args:
+            ttl (float, optional): Seconds a response without validators is served from the cache.
+            max_bytes (int, optional): Maximum total body size of the cached responses.
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(("hits", "revalidated", "misses", "bytes_saved", "evictions",
+                                        "invalidations"), 0)
+
+    @staticmethod
+    def key(url, params=None):
+        """
+        Return the cache key of a request.
+
+        Args:
+            url (str): The full URL.
+            params (dict, optional): The query parameters passed besides the URL.
+
+        Returns:
+            str: The URL with the parameters appended in a stable order.
+        """
+        if not params:
+            return url
+        separator = "&" if urlsplit(url).query else "?"
+        return f"{url}{separator}{urlencode(sorted(params.items()), doseq=True)}"
+
+    def fresh_response(self, key):
+        """
+        Return the cached response of a request if it can be served without contacting the server.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            requests.Response | None: The response, None if it is missing, expired or must be revalidated.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.revalidates or time.monotonic() - entry.stored_at > self.ttl:
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            self._counters["bytes_saved"] += entry.size
+            return entry.response
+
+    def conditional_headers(self, key):
+        """
+        Return the headers revalidating the cached response of a request.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            dict: If-None-Match and/or If-Modified-Since headers, empty if nothing can be revalidated.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        headers = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def update(self, key, response):
+        """
+        Store the response of a GET sent over the network and return the response to use.
+
+        Args:
+            key (str): The cache key.
+            response (requests.Response): The response received.
+
+        Returns:
+            requests.Response | None: The cached response if the server answered 304 Not Modified
+            to a revalidation, None if the entry was dropped before the 304 arrived, so that the
+            request must be sent again without conditional headers, the received response otherwise.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if response.status_code == 304 and entry is None:
+                return None
+            if response.status_code == 304:
+                entry.stored_at = time.monotonic()
+                self._entries.move_to_end(key)
+                self._counters["revalidated"] += 1
+                self._counters["bytes_saved"] += entry.size
+                return entry.response
+            self._counters["misses"] += 1
+            if entry is not None:
+                self._remove(key)
+            cacheable = response.status_code == 200 and "no-store" not in response.headers.get("Cache-Control", "")
+            if cacheable and len(response.content) <= self.max_bytes:
+                entry = self._entries[key] = _CacheEntry(response)
+                self._bytes += entry.size
+                while self._bytes > self.max_bytes:
+                    self._remove(next(iter(self._entries)))
+                    self._counters["evictions"] += 1
+            return response
+
+    def invalidate(self, url):
+        """
+        Drop the cached responses of the resource a write was sent to.
+
+        A write to "/Books/5" or "/Books" invalidates every cached response under "/Books",
+        since the listing and related lookups may have changed too.
+
+        Args:
+            url (str): The full URL the write was sent to.
+        """
+        parts = urlsplit(url)
+        base, _, rest = parts.path.rpartition("/")
+        resource = parts.path if not base or not rest.lstrip("-").isdigit() else base
+        prefix = f"{parts.scheme}://{parts.netloc}{resource}"
+        with self._lock:
+            stale = [key for key in self._entries if key == prefix or key.startswith((prefix + "/", prefix + "?"))]
+            for key in stale:
+                self._remove(key)
+            self._counters["invalidations"] += len(stale)
+
+    def clear(self):
+        """
+        Drop every cached response.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: Number of fresh hits, 304 revalidations, misses, evictions and invalidated
+            entries, body bytes not downloaded thanks to the cache, and the cached entries and bytes.
+        """
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries), "bytes": self._bytes}
+
+    def _remove(self, key):
+        """
+        Remove an entry. The caller holds the lock.
+
+        Args:
+            key (str): The cache key.
+        """
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
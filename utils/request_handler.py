@@ -2,39 +2,325 @@
 API Client Module
 
 Defines APIClient for making HTTP requests with automatic logging of
-requests and responses using a configurable logger.
+requests and responses using a configurable logger, and ClientRegistry for
+sharing one pooled client per base URL across the whole test process.
 """
 
+import threading
+import time
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from config import config
+from config.config import (CASSETTE_MODE, CASSETTE_PATH, COMPRESSION, POOL_CONNECTIONS, POOL_MAXSIZE,
+                           READ_CACHE_ENABLED, STREAM_CHUNK_SIZE)
+from utils.api_response import APIResponse
+from utils.cassette import cassette_from_config
+from utils.json_stream import StreamedList
 from utils.logger import default_api_logger
+from utils.read_cache import ReadCache
+from utils.resilience import CircuitBreaker, RetryPolicy
+from utils.stats import RequestTiming, default_timing_recorder
+from utils.timeouts import TimeoutPolicy, current_deadline
 
-class APIClient:
+class PooledHTTPAdapter(HTTPAdapter):
     """
-    Simple API client for sending HTTP requests with logging of requests and responses.
+    HTTPAdapter that counts how many requests were sent over new vs reused keep-alive connections.
     """
-    def __init__(self, base_url, api_logger=default_api_logger):
+    def __init__(self, *args, **kwargs):
         """
-        Sends a GET request to the specified endpoint.
+        Initialize the adapter and its connection reuse counters.
 
         Args:
-            endpoint (str): The API endpoint to call (appended to base_url).
-            **kwargs: Additional arguments passed to requests.Session.get (e.g., params, headers).
+            *args: Positional arguments passed to HTTPAdapter (e.g., pool_connections, pool_maxsize).
+            **kwargs: Keyword arguments passed to HTTPAdapter.
+        """
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.requests_sent = 0
+        self.new_connections = 0
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        """
+        Send the request and record whether its connection was newly opened or reused,
+        also setting response.reused_connection.
+        """
+        response = super().send(request, *args, **kwargs)
+        connection = getattr(response.raw, "connection", None)
+        response.reused_connection = connection is not None and getattr(connection, "seen_by_api_client", False)
+        with self._stats_lock:
+            self.requests_sent += 1
+            if connection is not None and not response.reused_connection:
+                setattr(connection, "seen_by_api_client", True)
+                self.new_connections += 1
+        return response
+
+    def connection_stats(self):
+        """
+        Return the keep-alive reuse counters of this adapter.
 
         Returns:
-            requests.Response: The response object.
+            dict: Number of requests sent, new connections opened and connections reused.
+        """
+        with self._stats_lock:
+            return {
+                "requests": self.requests_sent,
+                "new_connections": self.new_connections,
+                "reused_connections": self.requests_sent - self.new_connections,
+            }
+
+def _wire_bytes(response, body_bytes):
+    """
+    Return how many bytes of a response's body were received over the network.
+
+    Args:
+        response (requests.Response): The response, whose body has been read.
+        body_bytes (int): Size of the decompressed body, used if the raw size is unknown.
+
+    Returns:
+        int: The size of the body as transferred, compressed if the server compressed it.
+    """
+    tell = getattr(response.raw, "tell", None)
+    return tell() if callable(tell) else body_bytes
+
+default_cassette = cassette_from_config(CASSETTE_PATH, CASSETTE_MODE)
+_FROM_CONFIG = object()
+
+class APIClient:  # pylint: disable=too-many-instance-attributes
+    """
+    Simple API client for sending HTTP requests with logging of requests and responses.
+    """
+    def __init__(self, base_url=None, api_logger=default_api_logger,  # pylint: disable=too-many-arguments
+                 pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, cassette=default_cassette,
+                 *, timing_recorder=default_timing_recorder, retry_policy=None, circuit_breaker=_FROM_CONFIG,
+                 timeout_policy=None, read_cache=_FROM_CONFIG, compression=COMPRESSION):
+        """
+        Initialize the client with its own session and connection pool.
+
+        Args:
+            base_url (str, optional): The base URL prepended to every endpoint. Defaults to
+                config.BASE_URL, looked up on every request so a run can redirect it
+                (e.g. to the local stand-in server).
+            api_logger (APILogger, optional): Logger used for requests and responses.
+            pool_connections (int, optional): Number of per-host connection pools to cache.
+            pool_maxsize (int, optional): Maximum number of connections kept alive per host.
+            cassette (Cassette, optional): Cassette recording responses or replaying them without
+                network access. Defaults to the one selected by CASSETTE_MODE/CASSETTE_PATH.
+            timing_recorder (TimingRecorder, optional): Recorder of the timing of every request
+                sent over the network, None to not record timings.
+            retry_policy (RetryPolicy, optional): Retries of failed idempotent requests.
+                Defaults to a policy configured by RETRY_COUNT/RETRY_BACKOFF_SECONDS.
+            circuit_breaker (CircuitBreaker, optional): Breaker failing requests immediately once
+                the backend keeps failing, None to disable it. Defaults to a breaker of this client
+                configured by CIRCUIT_BREAKER_THRESHOLD/CIRCUIT_BREAKER_RESET_SECONDS, whose
+                state changes are logged with api_logger.
+            timeout_policy (TimeoutPolicy, optional): Connect/read timeouts of each request.
+                Defaults to the ones configured by CONNECT_TIMEOUT/DEFAULT_TIMEOUT/ENDPOINT_TIMEOUTS.
+            read_cache (ReadCache, optional): Cache of GET responses, None to disable it. Defaults to
+                a cache of this client if READ_CACHE_ENABLED is set, None otherwise.
+            compression (bool, optional): Send Accept-Encoding with every codec urllib3 can decode
+                (gzip and deflate, plus brotli/zstd when installed). Defaults to COMPRESSION.
         """
-        self.base_url = base_url
+        self._base_url = base_url
         self.session = requests.Session()
         self.session.headers.clear()
+        if compression:
+            self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self._adapter = PooledHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
         self._api_logger = api_logger
+        self.cassette = cassette
+        self.timing_recorder = timing_recorder
+        self.retry_policy = retry_policy or RetryPolicy()
+        if circuit_breaker is _FROM_CONFIG:
+            circuit_breaker = CircuitBreaker(on_state_change=lambda old_state, new_state, reason:
+                                             api_logger.log_circuit_state(self.base_url, old_state, new_state, reason))
+        self.circuit_breaker = circuit_breaker
+        self.timeout_policy = timeout_policy or TimeoutPolicy()
+        if read_cache is _FROM_CONFIG:
+            read_cache = ReadCache() if READ_CACHE_ENABLED else None
+        self.read_cache = read_cache
+
+    @property
+    def base_url(self):
+        """
+        str: The base URL prepended to every endpoint.
+        """
+        return self._base_url if self._base_url is not None else config.BASE_URL
+
+    def send(self, method, endpoint, **kwargs):
+        """
+        Sends an HTTP request to the specified endpoint without logging it.
+
+        The logged verb methods and AsyncAPIClient build on this method. Requests sent over
+        the network go through the circuit breaker, idempotent ones are retried according to
+        retry_policy, and the final attempt is timed, with its response bytes received over the
+        network and once decompressed, and recorded with timing_recorder and the cassette unless
+        capture=False. Each attempt gets the timeouts of timeout_policy, capped by the active
+        deadline if any.
+
+        With a read cache, GET responses are served from it or revalidated, and other methods
+        invalidate the cached responses of the resource they are sent to.
+
+        Args:
+            method (str): The HTTP method to use (e.g., 'GET', 'POST').
+            endpoint (str): The API endpoint to call (appended to base_url).
+            **kwargs: Additional arguments passed to requests.Session.request (e.g., json, headers,
+                timeout to override the configured timeouts), cache=False to bypass the read
+                cache for a GET that must see fresh data, and capture=False to keep the request
+                out of timing_recorder and the cassette, e.g. for measurement samples.
+
+        Returns:
+            APIResponse: The response object.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            DeadlineExceededError: If the active deadline ran out before the request was sent.
+            requests.exceptions.RequestException: If the request failed on its last attempt.
+        """
+        headers = kwargs.pop("headers", {})
+        use_cache = kwargs.pop("cache", True)
+        capture = kwargs.pop("capture", True)
+        url = f"{self.base_url}{endpoint}"
+        if self.cassette is not None and self.cassette.replaying:
+            request = self.session.prepare_request(requests.Request(
+                method, url, headers=headers, json=kwargs.get("json"), data=kwargs.get("data"),
+                params=kwargs.get("params")))
+            return APIResponse(self.cassette.replay(self._relative_path(request), request))
+        if self.read_cache is None:
+            return self._send_over_network(method, endpoint, headers, kwargs, capture=capture)
+        if method.upper() != "GET":
+            try:
+                return self._send_over_network(method, endpoint, headers, kwargs, capture=capture)
+            finally:
+                self.read_cache.invalidate(url)
+        if not use_cache:
+            return self._send_over_network(method, endpoint, headers, kwargs, capture=capture)
+        cache_key = ReadCache.key(url, kwargs.get("params"))
+        cached = self.read_cache.fresh_response(cache_key)
+        if cached is not None:
+            return APIResponse(cached)
+        conditional_headers = {**self.read_cache.conditional_headers(cache_key), **headers}
+        response = self._send_over_network(method, endpoint, conditional_headers, dict(kwargs), cache_key=cache_key,
+                                           capture=capture)
+        if response is None:
+            # The cached response was dropped while the server revalidated it: fetch the body again
+            response = self._send_over_network(method, endpoint, headers, kwargs, capture=capture)
+        return response
+
+    def _send_over_network(self, method, endpoint, headers, kwargs, *, cache_key=None,  # pylint: disable=too-many-arguments
+                           capture=True):
+        """
+        Send a request over the network, time it and record it in the cassette.
+
+        Args:
+            method (str): The HTTP method to use.
+            endpoint (str): The API endpoint to call (appended to base_url).
+            headers (dict): The request headers.
+            kwargs (dict): Additional arguments passed to requests.Session.request.
+            cache_key (str, optional): Read cache key to update with the response of a GET.
+            capture (bool, optional): Whether to record the timing with timing_recorder and the
+                response in the cassette.
+
+        Returns:
+            APIResponse | None: The response object, the cached one if the server answered 304 Not
+            Modified, or None if the cached one was dropped before the 304 arrived.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            DeadlineExceededError: If the active deadline ran out before the request was sent.
+            requests.exceptions.RequestException: If the request failed on its last attempt.
+        """
+        response, started = self._send_with_retries(method, endpoint, headers, kwargs)
+        body_bytes = len(response.content)
+        timing = RequestTiming(method.upper(), endpoint, response.status_code, time.perf_counter() - started,
+                               response.elapsed.total_seconds(), getattr(response, "reused_connection", False),
+                               _wire_bytes(response, body_bytes), body_bytes)
+        if capture and self.timing_recorder is not None:
+            self.timing_recorder.record(timing)
+        if cache_key is not None:
+            response = self.read_cache.update(cache_key, response)
+            if response is None:
+                return None
+        if capture and self.cassette is not None:
+            self.cassette.record(self._relative_path(response.request), response)
+        return APIResponse(response, timing=timing)
+
+    def _send_with_retries(self, method, endpoint, headers, kwargs):
+        """
+        Send a request through the circuit breaker, retrying it according to the retry policy.
+
+        Args:
+            method (str): The HTTP method to use.
+            endpoint (str): The API endpoint to call (appended to base_url).
+            headers (dict): The request headers.
+            kwargs (dict): Additional arguments passed to requests.Session.request.
+
+        Returns:
+            tuple: The final requests.Response, and the time.perf_counter() value its attempt started at.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            DeadlineExceededError: If the active deadline ran out before an attempt.
+            requests.exceptions.RequestException: If the request failed on its last attempt.
+        """
+        url = f"{self.base_url}{endpoint}"
+        timeout = kwargs.pop("timeout", None)
+        attempt = 0
+        while True:
+            attempt_timeout = self.timeout_policy.timeout_for(method, endpoint, timeout)
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request()
+            started = time.perf_counter()
+            try:
+                outcome = self.session.request(method, url, headers=headers, timeout=attempt_timeout, **kwargs)
+            except requests.exceptions.RequestException as error:
+                outcome = error
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record(outcome)
+            if not self.retry_policy.should_retry(method, attempt, outcome):
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome, started
+            if not isinstance(outcome, Exception):
+                outcome.close()
+            attempt += 1
+            delay = self.retry_policy.delay(attempt - 1)
+            deadline = current_deadline()
+            if deadline is not None:
+                delay = max(min(delay, deadline.remaining()), 0)
+            self._api_logger.log_retry(method.upper(), url, attempt, outcome, delay)
+            time.sleep(delay)
+
+    def _relative_path(self, request):
+        """
+        Return the path and query of a request relative to the base URL.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+
+        Returns:
+            str: The request path without the base URL's path prefix.
+        """
+        base_path = urlsplit(self.base_url).path.rstrip("/")
+        path = request.path_url
+        return path[len(base_path):] if base_path and path.startswith(base_path) else path
 
     @default_api_logger.log_request_response("GET")
     def get(self, endpoint, **kwargs):
         """
         Sends a GET request to the specified endpoint.
+
+        Args:
+            endpoint (str): The API endpoint to call (appended to base_url).
+            **kwargs: Additional arguments passed to requests.Session.get (e.g., params, headers).
+
+        Returns:
+            APIResponse: The response object.
         """
-        headers = kwargs.pop("headers", {})
-        return self.session.get(f"{self.base_url}{endpoint}", headers=headers, **kwargs)
+        return self.send("GET", endpoint, **kwargs)
 
     @default_api_logger.log_request_response("POST")
     def post(self, endpoint, data=None, **kwargs):
@@ -47,10 +333,9 @@ class APIClient:
             **kwargs: Additional arguments passed to requests.Session.post (e.g., headers).
 
         Returns:
-            requests.Response: The response object.
+            APIResponse: The response object.
         """
-        headers = kwargs.pop("headers", {})
-        return self.session.post(f"{self.base_url}{endpoint}", headers=headers, json=data, **kwargs)
+        return self.send("POST", endpoint, json=data, **kwargs)
 
     @default_api_logger.log_request_response("PUT")
     def put(self, endpoint, data=None, **kwargs):
@@ -63,10 +348,9 @@ class APIClient:
             **kwargs: Additional arguments passed to requests.Session.put (e.g., headers).
 
         Returns:
-            requests.Response: The response object.
+            APIResponse: The response object.
         """
-        headers = kwargs.pop("headers", {})
-        return self.session.put(f"{self.base_url}{endpoint}", headers=headers, json=data, **kwargs)
+        return self.send("PUT", endpoint, json=data, **kwargs)
 
     @default_api_logger.log_request_response("DELETE")
     def delete(self, endpoint, **kwargs):
@@ -78,7 +362,146 @@ class APIClient:
             **kwargs: Additional arguments passed to requests.Session.delete (e.g., headers).
 
         Returns:
-            requests.Response: The response object.
+            APIResponse: The response object.
+        """
+        return self.send("DELETE", endpoint, **kwargs)
+
+    def stream_list(self, endpoint, schema=None, chunk_size=STREAM_CHUNK_SIZE, **kwargs):
+        """
+        Sends a GET request to a list endpoint and reads its JSON array incrementally.
+
+        The body is downloaded as the returned list is iterated, one chunk at a time, and each
+        item is validated against schema as soon as it is parsed, so memory stays bounded by
+        one item and the first bad record fails the iteration without downloading the rest.
+        The request is logged, timed and recorded once the list is closed. Streamed requests
+        bypass the read cache and are not recorded in the cassette, but can be replayed from it.
+
+        Args:
+            endpoint (str): The API endpoint to call (appended to base_url).
+            schema (dict, optional): JSON schema each item is validated against.
+            chunk_size (int, optional): Bytes read from the connection at a time.
+            **kwargs: Additional arguments passed to requests.Session.get (e.g., params, headers).
+
+        Returns:
+            StreamedList: The list, to iterate (or close) in a with block to release the connection.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            DeadlineExceededError: If the active deadline ran out before the request was sent.
+            requests.exceptions.RequestException: If the request failed on its last attempt.
         """
         headers = kwargs.pop("headers", {})
-        return self.session.delete(f"{self.base_url}{endpoint}", headers=headers, **kwargs)
+        kwargs.pop("cache", None)
+        url = f"{self.base_url}{endpoint}"
+        if self.cassette is not None and self.cassette.replaying:
+            request = self.session.prepare_request(requests.Request("GET", url, headers=headers,
+                                                                    params=kwargs.get("params")))
+            return StreamedList(self.cassette.replay(self._relative_path(request), request), schema, chunk_size)
+        response, started = self._send_with_retries("GET", endpoint, headers, {**kwargs, "stream": True})
+
+        def on_close(streamed):
+            """Time, record and log the streamed request once the list is closed."""
+            timing = RequestTiming("GET", endpoint, response.status_code, time.perf_counter() - started,
+                                   response.elapsed.total_seconds(), getattr(response, "reused_connection", False),
+                                   _wire_bytes(response, streamed.bytes_read), streamed.bytes_read)
+            if self.timing_recorder is not None:
+                self.timing_recorder.record(timing)
+            self._api_logger.log_streamed_list(url, streamed, started)
+
+        return StreamedList(response, schema, chunk_size, on_close=on_close)
+
+    def connection_stats(self):
+        """
+        Return the keep-alive reuse counters of the client's connection pool.
+
+        Returns:
+            dict: Number of requests sent, new connections opened and connections reused.
+        """
+        return self._adapter.connection_stats()
+
+    def close(self):
+        """
+        Close the session and all pooled connections, saving recorded cassette interactions.
+        """
+        self.session.close()
+        if self.cassette is not None:
+            self.cassette.save()
+
+class ClientRegistry:
+    """
+    Hands out one shared, pooled APIClient per base URL for the whole process,
+    so test modules reuse keep-alive connections instead of opening their own.
+    """
+    def __init__(self):
+        """
+        Initialize an empty registry.
+        """
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_url=None, **client_kwargs):
+        """
+        Return the client for base_url, creating it on first use.
+
+        Args:
+            base_url (str, optional): The base URL of the client. Defaults to the
+                configured BASE_URL, followed on every request.
+            **client_kwargs: Arguments passed to APIClient when the client is created
+                (e.g., pool_connections, pool_maxsize).
+
+        Returns:
+            APIClient: The shared client for base_url.
+        """
+        with self._lock:
+            client = self._clients.get(base_url)
+            if client is None:
+                client = APIClient(base_url, **client_kwargs)
+                self._clients[base_url] = client
+            return client
+
+    def cache_stats(self):
+        """
+        Return the read cache counters of every registered client that has a read cache.
+
+        Returns:
+            dict: Cache stats keyed by base URL.
+        """
+        with self._lock:
+            return {client.base_url: client.read_cache.stats() for client in self._clients.values()
+                    if client.read_cache is not None}
+
+    def connection_stats(self):
+        """
+        Return the keep-alive reuse counters of every registered client.
+
+        Returns:
+            dict: Connection stats keyed by base URL.
+        """
+        with self._lock:
+            return {client.base_url: client.connection_stats() for client in self._clients.values()}
+
+    def close_all(self):
+        """
+        Close every registered client and empty the registry.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+default_client_registry = ClientRegistry()
+
+def get_client(base_url=None, **client_kwargs):
+    """
+    Return the process-wide shared client for base_url from the default registry.
+
+    Args:
+        base_url (str, optional): The base URL of the client. Defaults to the
+            configured BASE_URL, followed on every request.
+        **client_kwargs: Arguments passed to APIClient when the client is created.
+
+    Returns:
+        APIClient: The shared client for base_url.
+    """
+    return default_client_registry.get(base_url, **client_kwargs)
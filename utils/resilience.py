@@ -0,0 +1,180 @@
+"""
+Resilience Module
+
+Defines RetryPolicy, which retries idempotent requests with jittered exponential backoff,
+and CircuitBreaker, which fails requests immediately once a backend keeps failing.
+"""
+
+import random
+import threading
+import time
+import requests
+from config.config import (CIRCUIT_BREAKER_RESET_SECONDS, CIRCUIT_BREAKER_THRESHOLD, RETRY_BACKOFF_SECONDS,
+                           RETRY_COUNT, RETRY_MAX_BACKOFF_SECONDS)
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+RETRY_STATUS_CODES = (502, 503, 504)
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """
+    Raised instead of sending a request while the circuit breaker is open.
+    """
+
+def is_failure(outcome):
+    """
+    Return True if a request outcome counts as a backend failure: a connection error,
+    a timeout or a 5xx response.
+
+    Args:
+        outcome (requests.Response | Exception): The response, or the error raised instead.
+    """
+    if isinstance(outcome, Exception):
+        return isinstance(outcome, TRANSIENT_ERRORS)
+    return outcome.status_code >= 500
+
+class RetryPolicy:
+    """
+    Retries idempotent requests that failed with a connection error, a timeout or a
+    502/503/504 response, sleeping a random delay between 0 and backoff * 2**attempt
+    (capped at max_backoff) before each retry ("full jitter").
+
+    Attributes:
+        retries (int): Maximum number of retries of a request, 0 to disable retries.
+        backoff (float): Base delay in seconds.
+        max_backoff (float): Maximum delay in seconds.
+    """
+
+    def __init__(self, retries=RETRY_COUNT, backoff=RETRY_BACKOFF_SECONDS, max_backoff=RETRY_MAX_BACKOFF_SECONDS):
+        """
+        Args:
+            retries (int, optional): Maximum number of retries of a request.
+            backoff (float, optional): Base delay in seconds.
+            max_backoff (float, optional): Maximum delay in seconds.
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def should_retry(self, method, attempt, outcome):
+        """
+        Return True if a request should be sent again.
+
+        Args:
+            method (str): The HTTP method.
+            attempt (int): Number of the attempt that just completed, starting at 0.
+            outcome (requests.Response | Exception): The response, or the error raised instead.
+        """
+        if attempt >= self.retries or method.upper() not in IDEMPOTENT_METHODS:
+            return False
+        if isinstance(outcome, Exception):
+            return isinstance(outcome, TRANSIENT_ERRORS) and not isinstance(outcome, CircuitOpenError)
+        return outcome.status_code in RETRY_STATUS_CODES
+
+    def delay(self, attempt):
+        """
+        Return the jittered delay before a retry.
+
+        Args:
+            attempt (int): Number of the attempt that just failed, starting at 0.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+class CircuitBreaker:  # pylint: disable=too-many-instance-attributes
+    """
+    Stops sending requests to a backend after consecutive failures.
+
+    The breaker is "closed" while requests go through. After failure_threshold consecutive
+    failures it opens, and every request fails immediately with CircuitOpenError. Once
+    reset_timeout has passed, it lets one trial request through ("half-open"): the breaker
+    closes if that request succeeds and opens again if it fails. Safe to use from several threads.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures opening the breaker, 0 to never open it.
+        reset_timeout (float): Seconds the breaker stays open before a trial request.
+        state (str): "closed", "open" or "half-open".
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=CIRCUIT_BREAKER_THRESHOLD, reset_timeout=CIRCUIT_BREAKER_RESET_SECONDS,
+                 on_state_change=None):
+        """
+        Args:
+            failure_threshold (int, optional): Consecutive failures opening the breaker, 0 to never open it.
+            reset_timeout (float, optional): Seconds the breaker stays open before a trial request.
+            on_state_change (callable, optional): Called with the old state, the new state and
+                the reason of each state change.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._on_state_change = on_state_change
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """
+        Check that a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a trial request in flight.
+        """
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._change_state(self.HALF_OPEN, f"{self.reset_timeout:g}s elapsed, sending a trial request")
+            if self.state == self.OPEN or (self.state == self.HALF_OPEN and self._trial_in_flight):
+                raise CircuitOpenError(f"Circuit breaker is open after {self._failures} consecutive failures; "
+                                       "not sending the request")
+            if self.state == self.HALF_OPEN:
+                self._trial_in_flight = True
+
+    def record(self, outcome):
+        """
+        Record the outcome of a request.
+
+        Args:
+            outcome (requests.Response | Exception): The response, or the error raised instead.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+            if not is_failure(outcome):
+                self._failures = 0
+                if self.state != self.CLOSED:
+                    self._change_state(self.CLOSED, "trial request succeeded")
+                return
+            self._failures += 1
+            reason = repr(outcome) if isinstance(outcome, Exception) else f"HTTP {outcome.status_code}"
+            if self.state == self.HALF_OPEN:
+                self._open(f"trial request failed: {reason}")
+            elif self.state == self.CLOSED and 0 < self.failure_threshold <= self._failures:
+                self._open(f"{self._failures} consecutive failures, last: {reason}")
+
+    def _open(self, reason):
+        """
+        Open the breaker. Must be called with the lock held.
+
+        Args:
+            reason (str): Why the breaker opens.
+        """
+        self._opened_at = time.monotonic()
+        self._change_state(self.OPEN, reason)
+
+    def _change_state(self, state, reason):
+        """
+        Set the state and notify the listener. Must be called with the lock held.
+
+        Args:
+            state (str): The new state.
+            reason (str): Why the state changes.
+        """
+        old_state, self.state = self.state, state
+        if self._on_state_change is not None:
+            self._on_state_change(old_state, state, reason)
@@ -1,11 +1,246 @@
 """
 Scehma Validation Module
 
-Helpers to validate JSON responses against schemas.
+Helpers to validate JSON responses against schemas, backed by a cache of
+compiled validators.
 """
 
+import hashlib
 import json
-from jsonschema import validate
+import random
+import threading
+from collections import OrderedDict
+from jsonschema.exceptions import ValidationError, best_match
+from jsonschema.validators import validator_for
+
+DEFAULT_VALIDATOR_CACHE_SIZE = 64
+PLACEHOLDER = "{PLACEHOLDER}"
+VALIDATION_MODES = ("items", "array")
+_JSON_TYPES = {
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+}
+
+class _IdentityLRU:
+    """
+    Bounded LRU of values built from objects, looked up by object identity.
+
+    Each entry holds a reference to its object, so its id() cannot be reused by another
+    object while the entry is cached; at most maxsize objects are kept alive.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept.
+    """
+
+    def __init__(self, maxsize=DEFAULT_VALIDATOR_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries kept.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, obj, build, *extra_key):
+        """
+        Return the value cached for an object, building it on first use.
+
+        Args:
+            obj: The object the value is built from.
+            build (callable): Function without arguments returning the value.
+            *extra_key: Other parts of the key, e.g. a placeholder.
+
+        Returns:
+            The cached or newly built value.
+        """
+        key = (id(obj), *extra_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not obj:
+                entry = (obj, build())
+                self._entries[key] = entry
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            self._entries.move_to_end(key)
+            return entry[1]
+
+class ValidatorCache:
+    """
+    Bounded LRU cache of compiled JSON schema validators.
+
+    Each schema is checked and compiled once, with a FormatChecker so formats such as
+    'date-time' and 'uri' are enforced. Validators are looked up by schema identity first
+    and by a hash of the schema content otherwise, so equal schemas built separately share
+    one compiled validator. The identity lookups are an LRU of the same size as the
+    validators, so at most maxsize schemas are kept alive. Cached schemas must not be mutated.
+
+    Attributes:
+        maxsize (int): Maximum number of compiled validators kept.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that compiled a new validator.
+    """
+
+    def __init__(self, maxsize=DEFAULT_VALIDATOR_CACHE_SIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of compiled validators kept.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._validators = OrderedDict()
+        self._keys_by_identity = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, schema):
+        """
+        Return the compiled validator for a schema, compiling it on first use.
+
+        Args:
+            schema (dict): The JSON schema.
+
+        Returns:
+            jsonschema.protocols.Validator: Validator instance for the schema.
+
+        Raises:
+            jsonschema.exceptions.SchemaError: If the schema itself is invalid.
+        """
+        with self._lock:
+            identity = self._keys_by_identity.get(id(schema))
+            if identity is not None and identity[0] is schema:
+                key = identity[1]
+                self._keys_by_identity.move_to_end(id(schema))
+            else:
+                key = _schema_hash(schema)
+                self._keys_by_identity[id(schema)] = (schema, key)
+                self._keys_by_identity.move_to_end(id(schema))
+                if len(self._keys_by_identity) > self.maxsize:
+                    self._keys_by_identity.popitem(last=False)
+            validator = self._validators.get(key)
+            if validator is not None:
+                self.hits += 1
+                self._validators.move_to_end(key)
+                return validator
+            self.misses += 1
+            validator = _compile_schema(schema)
+            self._validators[key] = validator
+            if len(self._validators) > self.maxsize:
+                self._validators.popitem(last=False)
+            return validator
+
+    def clear(self):
+        """
+        Drop all compiled validators and reset the counters.
+        """
+        with self._lock:
+            self._validators.clear()
+            self._keys_by_identity.clear()
+            self.hits = 0
+            self.misses = 0
+
+def _schema_hash(schema):
+    """
+    Return a stable hash of the schema content.
+
+    Args:
+        schema (dict): The JSON schema.
+
+    Returns:
+        str: Hex digest of the canonical JSON form of the schema.
+    """
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+
+def _compile_schema(schema):
+    """
+    Check a schema and build a validator for it with format checking enabled.
+
+    Args:
+        schema (dict): The JSON schema.
+
+    Returns:
+        jsonschema.protocols.Validator: Validator instance for the schema.
+    """
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema, format_checker=validator_class.FORMAT_CHECKER)
+
+default_validator_cache = ValidatorCache()
+_array_schemas = _IdentityLRU()
+_templates = _IdentityLRU()
+
+def get_validator(schema):
+    """
+    Return the compiled validator for a schema from the default validator cache.
+
+    Args:
+        schema (dict): The JSON schema.
+
+    Returns:
+        jsonschema.protocols.Validator: Validator instance for the schema.
+    """
+    return default_validator_cache.get(schema)
+
+def _validate(instance, validator):
+    """
+    Validate an instance with a compiled validator, raising the most relevant error.
+
+    Args:
+        instance: The JSON value to validate.
+        validator (jsonschema.protocols.Validator): The compiled validator.
+
+    Raises:
+        jsonschema.exceptions.ValidationError: If the instance does not conform to the schema.
+    """
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+class Sampling:
+    """
+    Selects which items of a list validate_multiple_objects schema-validates.
+
+    Attributes:
+        every (int): Validate every Nth item.
+        size (int): Validate this many randomly chosen items (of those picked by every).
+        seed (int): Seed for the random pick, for reproducible samples.
+    """
+
+    def __init__(self, every=None, size=None, seed=None):
+        """
+        Initialize the sampling policy.
+
+        Args:
+            every (int, optional): Validate every Nth item. Defaults to every item.
+            size (int, optional): Validate this many randomly chosen items.
+            seed (int, optional): Seed for the random pick.
+        """
+        self.every = every or 1
+        self.size = size
+        self.seed = seed
+
+    def indices(self, length):
+        """
+        Choose the indices of the items to validate.
+
+        Args:
+            length (int): Length of the list.
+
+        Returns:
+            list: Sorted indices to validate.
+        """
+        indices = range(0, length, self.every)
+        if self.size is not None and self.size < len(indices):
+            return sorted(random.Random(self.seed).sample(indices, self.size))
+        return list(indices)
 
 def validate_single_object(response_json, schema_name, custom_validator=None):
     """
@@ -20,25 +255,234 @@ def validate_single_object(response_json, schema_name, custom_validator=None):
     Raises:
         jsonschema.exceptions.ValidationError: If the JSON does not conform to the schema.
     """
-    validate(instance=response_json, schema=schema_name)
+    _validate(response_json, get_validator(schema_name))
     if custom_validator:
         custom_validator(response_json)
 
-def validate_multiple_objects(response_json, schema_name):
+def validate_multiple_objects(response_json, schema_name, mode="items", precheck=False, sampling=None):
     """
     Validate a list of JSON objects against the provided JSON schema.
 
+    Errors always point at the offending item: the error path starts with its index
+    and the message is prefixed with "Item at index N".
+
     Args:
         response_json (list): The list of JSON objects to validate.
         schema_name (dict): The JSON schema to validate each object against.
+        mode (str, optional): "items" validates each object separately, "array" validates
+            the whole list in one pass against an array schema wrapping schema_name.
+        precheck (bool, optional): Run a single sweep over the list checking the type,
+            presence and minimum of each top-level property before full schema validation.
+        sampling (Sampling, optional): Only schema-validate a sample of the objects, for load
+            runs where validating huge listings in full is too expensive.
 
     Raises:
         AssertionError: If the input is not a list.
+        ValueError: If mode is unknown.
         jsonschema.exceptions.ValidationError: If any object does not conform to the schema.
     """
     assert isinstance(response_json, list), "Response JSON is not a list"
-    for book in response_json:
-        validate(instance=book, schema=schema_name)
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"Unknown validation mode '{mode}', expected one of {VALIDATION_MODES}")
+    if precheck:
+        _columnar_precheck(response_json, schema_name)
+    if sampling is not None:
+        indices = sampling.indices(len(response_json))
+    elif mode == "array":
+        error = best_match(get_validator(_array_schema(schema_name)).iter_errors(response_json))
+        if error is not None:
+            raise _point_at_index(error.path.popleft(), error)
+        return
+    else:
+        indices = range(len(response_json))
+    validator = get_validator(schema_name)
+    for index in indices:
+        try:
+            _validate(response_json[index], validator)
+        except ValidationError as error:
+            raise _point_at_index(index, error) from None
+
+def validate_items(items, schema_name):
+    """
+    Validate the items of a list against the provided JSON schema one at a time, as they are produced.
+
+    Args:
+        items (iterable): The JSON objects, e.g. parsed incrementally from a streamed response.
+        schema_name (dict): The JSON schema to validate each object against.
+
+    Yields:
+        Each object, once it has been validated.
+
+    Raises:
+        jsonschema.exceptions.ValidationError: For the first object not conforming to the schema,
+            pointing at its index; the remaining objects are not consumed.
+    """
+    validator = get_validator(schema_name)
+    for index, item in enumerate(items):
+        try:
+            _validate(item, validator)
+        except ValidationError as error:
+            raise _point_at_index(index, error) from None
+        yield item
+
+def _array_schema(schema):
+    """
+    Return an array schema whose items are the given schema, reusing it across calls
+    so the compiled validator is served from the cache by identity. The array schemas
+    of the last DEFAULT_VALIDATOR_CACHE_SIZE schemas are kept.
+
+    Args:
+        schema (dict): The JSON schema of a single item.
+
+    Returns:
+        dict: The wrapping array schema.
+    """
+    return _array_schemas.get(schema, lambda: {"type": "array", "items": schema})
+
+def _point_at_index(index, error):
+    """
+    Make a validation error of a list item point at the item's index.
+
+    Args:
+        index (int): Index of the offending item in the list.
+        error (jsonschema.exceptions.ValidationError): The error raised for the item.
+
+    Returns:
+        jsonschema.exceptions.ValidationError: The same error with the index in its path and message.
+    """
+    error.path.appendleft(index)
+    error.message = f"Item at index {index}: {error.message}"
+    return error
+
+def _columnar_precheck(items, schema):
+    """
+    Check the top-level properties of every item in a single sweep over the list.
+
+    Only the type, presence and minimum of each property declared in the schema are
+    checked, which catches the common failures without running full schema validation.
+
+    Args:
+        items (list): The list of JSON objects.
+        schema (dict): The JSON schema of a single item.
+
+    Raises:
+        jsonschema.exceptions.ValidationError: For the first item failing a check.
+    """
+    required = set(schema.get("required", ()))
+    columns = []
+    for name, property_schema in schema.get("properties", {}).items():
+        types = property_schema.get("type")
+        types = [types] if isinstance(types, str) else types or []
+        columns.append((name, [_JSON_TYPES[t] for t in types if t in _JSON_TYPES],
+                        property_schema.get("minimum"), name in required))
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise _point_at_index(index, ValidationError(f"{item!r} is not of type 'object'"))
+        for name, type_checks, minimum, is_required in columns:
+            if name not in item:
+                if is_required:
+                    raise _point_at_index(index, ValidationError(f"'{name}' is a required property"))
+                continue
+            value = item[name]
+            if type_checks and not any(check(value) for check in type_checks):
+                raise _point_at_index(index, ValidationError(f"{name}: {value!r} has an invalid type", path=[name]))
+            if minimum is not None and _JSON_TYPES["number"](value) and value < minimum:
+                raise _point_at_index(index, ValidationError(f"{name}: {value!r} is less than the minimum of {minimum}",
+                                                             path=[name]))
+
+class SchemaTemplate:
+    """
+    JSON schema containing a placeholder string that is substituted structurally.
+
+    The last rendered schemas are memoized per placeholder value, in an LRU of the validator
+    cache's default size, and their validators are compiled once through the validator cache,
+    so repeated renders cost a dictionary lookup.
+    Rendered schemas are shared between callers and must not be mutated.
+
+    Attributes:
+        schema (dict): The template schema containing the placeholder.
+        placeholder (str): The placeholder string to substitute.
+    """
+
+    def __init__(self, schema, placeholder=PLACEHOLDER):
+        """
+        Initialize the template.
+
+        Args:
+            schema (dict): The template schema containing the placeholder.
+            placeholder (str, optional): The placeholder string to substitute.
+        """
+        self.schema = schema
+        self.placeholder = placeholder
+        self._rendered = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, value):
+        """
+        Return the schema with every occurrence of the placeholder replaced by value.
+
+        Args:
+            value (str): The value to replace the placeholder with.
+
+        Returns:
+            dict: The memoized schema for value.
+        """
+        with self._lock:
+            rendered = self._rendered.get(value)
+            if rendered is None:
+                rendered = _substitute(self.schema, self.placeholder, value)
+                self._rendered[value] = rendered
+                if len(self._rendered) > DEFAULT_VALIDATOR_CACHE_SIZE:
+                    self._rendered.popitem(last=False)
+            self._rendered.move_to_end(value)
+            return rendered
+
+    def validator(self, value):
+        """
+        Return the compiled validator of the schema rendered for value.
+
+        Args:
+            value (str): The value to replace the placeholder with.
+
+        Returns:
+            jsonschema.protocols.Validator: Validator instance for the rendered schema.
+        """
+        return get_validator(self.render(value))
+
+def _substitute(node, placeholder, value):
+    """
+    Recursively copy a schema node, replacing the placeholder in keys and string values.
+
+    Args:
+        node: The schema node (dict, list or scalar).
+        placeholder (str): The placeholder string to substitute.
+        value (str): The value to replace the placeholder with.
+
+    Returns:
+        The copied node with the placeholder replaced.
+    """
+    if isinstance(node, dict):
+        return {_substitute(key, placeholder, value): _substitute(item, placeholder, value)
+                for key, item in node.items()}
+    if isinstance(node, list):
+        return [_substitute(item, placeholder, value) for item in node]
+    if isinstance(node, str):
+        return node.replace(placeholder, value)
+    return node
+
+def schema_template(schema, placeholder=PLACEHOLDER):
+    """
+    Return the shared SchemaTemplate for a schema, creating it on first use. The templates
+    of the last DEFAULT_VALIDATOR_CACHE_SIZE schemas are kept.
+
+    Args:
+        schema (dict): The template schema containing the placeholder.
+        placeholder (str, optional): The placeholder string to substitute.
+
+    Returns:
+        SchemaTemplate: The template for schema and placeholder.
+    """
+    return _templates.get(schema, lambda: SchemaTemplate(schema, placeholder), placeholder)
 
 def replace_placeholder(schema, value):
     """
@@ -49,8 +493,6 @@ def replace_placeholder(schema, value):
         value (str): The value to replace the placeholder with.
 
     Returns:
-        dict: The modified JSON schema with the placeholder replaced.
+        dict: The JSON schema with the placeholder replaced, memoized per schema and value.
     """
-    schema_str = json.dumps(schema)
-    schema_str = schema_str.replace("{PLACEHOLDER}", value)
-    return json.loads(schema_str)
+    return schema_template(schema).render(value)
@@ -0,0 +1,92 @@
+"""
+SLA Module
+
+Checks response-time budgets declared with @pytest.mark.sla by re-issuing a test's
+GET requests and computing latency percentiles.
+"""
+
+import statistics
+from config.config import SLA_SAMPLES
+
+SLA_PERCENTILES = {"p50_ms": 50, "p90_ms": 90, "p95_ms": 95, "p99_ms": 99}
+
+def sla_budgets(marker):
+    """
+    Read the budgets and sample count of an sla marker.
+
+    Args:
+        marker (pytest.Mark): The marker, e.g. from @pytest.mark.sla(p95_ms=300, samples=20).
+
+    Returns:
+        tuple: The budgets in milliseconds keyed by percentile name (e.g. "p95_ms"),
+        and the number of requests to sample per endpoint.
+
+    Raises:
+        ValueError: If the marker has positional arguments, an unknown keyword, no budget,
+            or fewer than two samples.
+    """
+    if marker.args:
+        raise ValueError("@pytest.mark.sla takes keyword arguments only, e.g. sla(p95_ms=300)")
+    budgets = dict(marker.kwargs)
+    samples = budgets.pop("samples", SLA_SAMPLES)
+    unknown = set(budgets) - set(SLA_PERCENTILES)
+    if unknown:
+        raise ValueError(f"Unknown SLA budgets {sorted(unknown)}, expected {sorted(SLA_PERCENTILES)}")
+    if not budgets:
+        raise ValueError("@pytest.mark.sla needs at least one budget, e.g. sla(p95_ms=300)")
+    if samples < 2:
+        raise ValueError("@pytest.mark.sla needs at least 2 samples")
+    return budgets, samples
+
+def sample_latencies(client, endpoints, samples):
+    """
+    Send GET requests to endpoints repeatedly and collect their latencies.
+
+    The samples bypass the read cache and are kept out of the client's timing recorder and
+    cassette, so they show up neither in the request timings of the test nor in recordings.
+
+    Args:
+        client (APIClient): Client sending the requests.
+        endpoints (iterable): Endpoints relative to the client's base URL.
+        samples (int): Number of requests per endpoint.
+
+    Returns:
+        dict: Latencies in seconds, by endpoint.
+
+    Raises:
+        ValueError: If a response has no timing, e.g. because it was replayed from a cassette.
+    """
+    latencies = {}
+    for endpoint in endpoints:
+        latencies[endpoint] = []
+        for _ in range(samples):
+            response = client.send("GET", endpoint, cache=False, capture=False)
+            if response.timing is None:
+                raise ValueError("SLA checks need responses received over the network")
+            latencies[endpoint].append(response.timing.elapsed)
+    return latencies
+
+def check_sla(latencies, budgets):
+    """
+    Compare the latency percentiles of each endpoint with the budgets.
+
+    Args:
+        latencies (dict): Latencies in seconds, by endpoint.
+        budgets (dict): Budgets in milliseconds, keyed by percentile name (e.g. "p95_ms").
+
+    Returns:
+        tuple: A description of each breached budget, and a per-endpoint latency breakdown.
+    """
+    breaches = []
+    breakdown = []
+    for endpoint, samples in latencies.items():
+        cut_points = statistics.quantiles(samples, n=100, method="inclusive")
+        percentiles = {name: cut_points[percent - 1] * 1000 for name, percent in SLA_PERCENTILES.items()}
+        breakdown.append(f"GET {endpoint}: " + ", ".join(f"{name[:-3]} {value:.1f} ms"
+                                                        for name, value in percentiles.items())
+                         + f", max {max(samples) * 1000:.1f} ms over {len(samples)} requests")
+        for name, budget in budgets.items():
+            if percentiles[name] > budget:
+                breaches.append(f"GET {endpoint} {name[:-3]} is {percentiles[name]:.1f} ms, "
+                                f"over the {budget} ms budget")
+    return breaches, "\n".join(breakdown)
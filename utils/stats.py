@@ -0,0 +1,321 @@
+"""
+Stats Module
+
+Defines LatencyHistogram, an HDR-style histogram recording latencies in fixed memory
+with a bounded relative error, and TimingRecorder, which aggregates the timings and
+transfer sizes of the API client's requests per endpoint template.
+"""
+
+import math
+import re
+import statistics
+import threading
+from collections import namedtuple
+
+DEFAULT_SUB_BUCKET_BITS = 7
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of latencies, in the spirit of HdrHistogram.
+
+    Latencies are counted in microsecond buckets: exact below 2**sub_bucket_bits microseconds,
+    then each power of two is split into 2**(sub_bucket_bits - 1) equal buckets, so a value
+    is reported within 1 / 2**(sub_bucket_bits - 1) of its recorded value (under 1.6% by
+    default) whatever the number of samples. Safe to record from several threads.
+
+    Attributes:
+        count (int): Number of recorded latencies.
+        min (float): Smallest recorded latency in seconds, exact.
+        max (float): Largest recorded latency in seconds, exact.
+        total (float): Sum of the recorded latencies in seconds.
+    """
+
+    def __init__(self, sub_bucket_bits=DEFAULT_SUB_BUCKET_BITS):
+        """
+        Args:
+            sub_bucket_bits (int, optional): Precision of the buckets, see the class description.
+        """
+        self._bits = sub_bucket_bits
+        self._counts = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.min = math.inf
+        self.max = 0.0
+        self.total = 0.0
+
+    def record(self, seconds):
+        """
+        Record a latency.
+
+        Args:
+            seconds (float): The latency in seconds.
+        """
+        index = self._index(max(int(seconds * 1_000_000), 0))
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total += seconds
+            self.min = min(self.min, seconds)
+            self.max = max(self.max, seconds)
+
+    def merge(self, other):
+        """
+        Add the latencies recorded by another histogram of the same precision.
+
+        Args:
+            other (LatencyHistogram): The histogram to add.
+
+        Raises:
+            ValueError: If the histograms have different precisions.
+        """
+        if other._bits != self._bits:  # pylint: disable=protected-access
+            raise ValueError("Cannot merge histograms with different sub_bucket_bits")
+        with self._lock:
+            for index, count in other._counts.items():  # pylint: disable=protected-access
+                self._counts[index] = self._counts.get(index, 0) + count
+            self.count += other.count
+            self.total += other.total
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+
+    def percentile(self, percent):
+        """
+        Return the latency below which a given percentage of the recorded latencies fall.
+
+        Args:
+            percent (float): Percentage between 0 and 100.
+
+        Returns:
+            float: The latency in seconds, 0.0 if nothing was recorded.
+        """
+        with self._lock:
+            if not self.count:
+                return 0.0
+            if percent >= 100:
+                return self.max
+            rank = max(math.ceil(percent / 100 * self.count), 1)
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= rank:
+                    return min(max(self._value(index), self.min), self.max)
+            return self.max
+
+    def mean(self):
+        """
+        Return the mean recorded latency.
+
+        Returns:
+            float: The mean latency in seconds, 0.0 if nothing was recorded.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def _index(self, micros):
+        """
+        Return the bucket index of a latency.
+
+        Args:
+            micros (int): The latency in microseconds.
+
+        Returns:
+            int: The bucket index.
+        """
+        if micros < 1 << self._bits:
+            return micros
+        shift = micros.bit_length() - self._bits
+        return (shift << (self._bits - 1)) + (micros >> shift)
+
+    def _value(self, index):
+        """
+        Return the latency a bucket stands for, the middle of its range.
+
+        Args:
+            index (int): The bucket index.
+
+        Returns:
+            float: The latency in seconds.
+        """
+        if index < 1 << self._bits:
+            return index / 1_000_000
+        shift = (index >> (self._bits - 1)) - 1
+        lowest = (index - (shift << (self._bits - 1))) << shift
+        return (lowest + (1 << shift) / 2) / 1_000_000
+
+def sample_statistics(samples):
+    """
+    Compute robust statistics of latency samples.
+
+    Args:
+        samples (list): At least two latencies in seconds.
+
+    Returns:
+        dict: Number of samples, and median, interquartile range, 95th percentile,
+        minimum and maximum in milliseconds.
+    """
+    ordered = sorted(samples)
+    first_quartile, median, third_quartile = statistics.quantiles(ordered, n=4, method="inclusive")
+    return {
+        "samples": len(ordered),
+        "median_ms": median * 1000,
+        "iqr_ms": (third_quartile - first_quartile) * 1000,
+        "p95_ms": statistics.quantiles(ordered, n=20, method="inclusive")[-1] * 1000,
+        "min_ms": ordered[0] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+RequestTiming = namedtuple("RequestTiming", "method endpoint status elapsed ttfb reused wire_bytes body_bytes",
+                           defaults=(0, 0))
+RequestTiming.__doc__ = """
+Timing and transfer size of one request.
+
+Attributes:
+    method (str): The HTTP method.
+    endpoint (str): The endpoint called, relative to the base URL.
+    status (int): The response status code.
+    elapsed (float): Seconds from sending the request to reading the whole response.
+    ttfb (float): Seconds from sending the request to receiving the response headers.
+    reused (bool): Whether the request was sent over a reused keep-alive connection.
+    wire_bytes (int): Response body bytes received over the network, compressed if the server compressed it.
+    body_bytes (int): Response body bytes once decompressed.
+"""
+
+ENDPOINT_TEMPLATES = ("/Books/{id}", "/Authors/{id}", "/Authors/authors/books/{idBook}")
+_ID_SEGMENT = re.compile(r"-?\d+(\.\d+)?")
+
+def endpoint_template(endpoint, templates=ENDPOINT_TEMPLATES):
+    """
+    Return the route template of an endpoint.
+
+    Args:
+        endpoint (str): The endpoint, e.g. "/Books/17?x=1" or "/Books/abc".
+        templates (tuple, optional): Route templates of the API, whose {placeholder}
+            segments match any segment.
+
+    Returns:
+        str: The first matching template, e.g. "/Books/{id}", or the endpoint's path with
+        numeric segments replaced by {id} if none matches.
+    """
+    segments = endpoint.split("?", 1)[0].split("/")
+    for template in templates:
+        template_segments = template.split("/")
+        if len(template_segments) == len(segments) and all(
+                expected.startswith("{") or expected == segment
+                for expected, segment in zip(template_segments, segments)):
+            return template
+    return "/".join("{id}" if _ID_SEGMENT.fullmatch(segment) else segment for segment in segments)
+
+class _EndpointTimings:
+    """
+    Aggregated timings of the requests to one endpoint template.
+    """
+
+    def __init__(self):
+        """
+        Initialize empty timings.
+        """
+        self.elapsed = LatencyHistogram()
+        self.ttfb = LatencyHistogram()
+        self.reused = 0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+
+class TimingRecorder:
+    """
+    Aggregates request timings per method and endpoint template.
+
+    A capture can also collect the individual timings recorded while it is active, e.g.
+    those of the test being run. Safe to record from several threads.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty recorder.
+        """
+        self._endpoints = {}
+        self._captured = None
+        self._lock = threading.Lock()
+
+    def record(self, timing):
+        """
+        Record the timing of a request.
+
+        Args:
+            timing (RequestTiming): The timing.
+        """
+        key = f"{timing.method} {endpoint_template(timing.endpoint)}"
+        with self._lock:
+            timings = self._endpoints.get(key)
+            if timings is None:
+                timings = self._endpoints[key] = _EndpointTimings()
+            if timing.reused:
+                timings.reused += 1
+            timings.wire_bytes += timing.wire_bytes
+            timings.body_bytes += timing.body_bytes
+            if self._captured is not None:
+                self._captured.append(timing)
+        timings.elapsed.record(timing.elapsed)
+        timings.ttfb.record(timing.ttfb)
+
+    def start_capture(self):
+        """
+        Start collecting the individual timings recorded from now on.
+        """
+        with self._lock:
+            self._captured = []
+
+    def captured(self):
+        """
+        Return the timings collected since the capture started or was last taken, keeping them.
+
+        Returns:
+            list: RequestTiming objects, in the order they were recorded.
+        """
+        with self._lock:
+            return list(self._captured or [])
+
+    def take_captured(self):
+        """
+        Return the timings collected since the capture started or was last taken.
+
+        Returns:
+            list: RequestTiming objects, in the order they were recorded.
+        """
+        with self._lock:
+            captured = self._captured or []
+            if self._captured is not None:
+                self._captured = []
+            return captured
+
+    def stop_capture(self):
+        """
+        Stop collecting individual timings.
+        """
+        with self._lock:
+            self._captured = None
+
+    def summary(self):
+        """
+        Summarize the timings of each endpoint template.
+
+        Returns:
+            list: One dict per "METHOD /template", with the number of requests, how many
+            reused a connection, elapsed/TTFB percentiles in milliseconds, and the response
+            bytes received over the network and once decompressed.
+        """
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+        return [{
+            "endpoint": endpoint,
+            "requests": timings.elapsed.count,
+            "reused": timings.reused,
+            "mean_ms": timings.elapsed.mean() * 1000,
+            "p50_ms": timings.elapsed.percentile(50) * 1000,
+            "p90_ms": timings.elapsed.percentile(90) * 1000,
+            "p99_ms": timings.elapsed.percentile(99) * 1000,
+            "max_ms": timings.elapsed.max * 1000,
+            "ttfb_p50_ms": timings.ttfb.percentile(50) * 1000,
+            "wire_bytes": timings.wire_bytes,
+            "body_bytes": timings.body_bytes,
+        } for endpoint, timings in endpoints]
+
+default_timing_recorder = TimingRecorder()
@@ -0,0 +1,185 @@
+"""
+Timeouts Module
+
+Defines TimeoutPolicy, which picks the connect/read timeouts of each request from the
+configuration and its per-endpoint overrides, and Deadline, a time budget shared by
+every request sent while it is active (e.g. during one test).
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from config.config import CONNECT_TIMEOUT, DEFAULT_TIMEOUT, ENDPOINT_TIMEOUTS
+from utils.stats import endpoint_template
+
+class DeadlineExceededError(Exception):
+    """
+    Raised instead of sending a request once the active deadline has run out.
+    """
+
+def parse_endpoint_timeouts(spec):
+    """
+    Parse per-endpoint timeout overrides.
+
+    Args:
+        spec (str): Comma-separated "[METHOD ]/template=read" or "[METHOD ]/template=connect:read"
+            entries, e.g. "GET /Books=30,/Authors/{id}=2:5". Templates are route templates as
+            reported in the request timings; without a method, the override applies to every method.
+
+    Returns:
+        dict: (connect, read) timeouts in seconds, connect None to keep the default, by
+        "METHOD /template" or "/template".
+
+    Raises:
+        ValueError: If an entry is malformed.
+    """
+    overrides = {}
+    for entry in filter(None, (entry.strip() for entry in spec.split(","))):
+        key, separator, value = entry.rpartition("=")
+        key = " ".join(key.split())
+        if not separator or not key:
+            raise ValueError(f"Invalid endpoint timeout {entry!r}, expected '[METHOD ]/template=seconds'")
+        connect, _, read = value.rpartition(":")
+        try:
+            overrides[key] = (float(connect) if connect else None, float(read))
+        except ValueError:
+            raise ValueError(f"Invalid endpoint timeout {entry!r}, expected seconds") from None
+    return overrides
+
+class TimeoutPolicy:
+    """
+    Picks the (connect, read) timeouts of a request.
+
+    An override for "METHOD /template" wins over one for "/template", which wins over the
+    defaults. While a deadline is active, both timeouts are capped by its remaining time.
+
+    Attributes:
+        connect (float): Default seconds to wait for a connection.
+        read (float): Default seconds to wait between bytes of the response.
+        overrides (dict): (connect, read) timeouts by "METHOD /template" or "/template".
+    """
+
+    def __init__(self, connect=CONNECT_TIMEOUT, read=DEFAULT_TIMEOUT, overrides=None):
+        """
+        Args:
+            connect (float, optional): Default connect timeout in seconds.
+            read (float, optional): Default read timeout in seconds.
+            overrides (dict, optional): Per-endpoint timeouts, see parse_endpoint_timeouts.
+                Defaults to the ones configured by ENDPOINT_TIMEOUTS.
+        """
+        self.connect = connect
+        self.read = read
+        self.overrides = parse_endpoint_timeouts(ENDPOINT_TIMEOUTS) if overrides is None else overrides
+
+    def timeout_for(self, method, endpoint, timeout=None):
+        """
+        Return the timeouts of a request.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint, relative to the base URL.
+            timeout (float | tuple, optional): Timeout given by the caller, used instead of the
+                configured ones (still capped by the active deadline).
+
+        Returns:
+            tuple: The (connect, read) timeouts in seconds.
+
+        Raises:
+            DeadlineExceededError: If the active deadline has run out.
+        """
+        if timeout is None:
+            template = endpoint_template(endpoint)
+            connect, read = self.overrides.get(f"{method.upper()} {template}",
+                                               self.overrides.get(template, (None, self.read)))
+            timeout = (self.connect if connect is None else connect, read)
+        elif not isinstance(timeout, tuple):
+            timeout = (timeout, timeout)
+        deadline = current_deadline()
+        if deadline is None:
+            return timeout
+        remaining = deadline.check()
+        return tuple(remaining if value is None else min(value, remaining) for value in timeout)
+
+class Deadline:
+    """
+    Time budget shared by the requests sent while it is active.
+
+    Attributes:
+        budget (float): Seconds the budget allows.
+        name (str): What the budget is for, used in error messages (e.g. a test ID).
+        started (float): time.monotonic() value the budget started at.
+    """
+
+    def __init__(self, budget, name="Request deadline"):
+        """
+        Args:
+            budget (float): Seconds the budget allows.
+            name (str, optional): What the budget is for, used in error messages.
+        """
+        self.budget = budget
+        self.name = name
+        self.started = time.monotonic()
+
+    def elapsed(self):
+        """
+        Return the seconds consumed since the budget started.
+
+        Returns:
+            float: The elapsed seconds.
+        """
+        return time.monotonic() - self.started
+
+    def remaining(self):
+        """
+        Return the seconds left in the budget.
+
+        Returns:
+            float: The remaining seconds, negative once the budget has run out.
+        """
+        return self.budget - self.elapsed()
+
+    def check(self):
+        """
+        Return the seconds left, failing if the budget has run out.
+
+        Returns:
+            float: The remaining seconds.
+
+        Raises:
+            DeadlineExceededError: If the budget has run out.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"{self.name} exceeded its {self.budget:g}s budget after {self.elapsed():.2f}s")
+        return remaining
+
+_current_deadline = contextvars.ContextVar("current_deadline", default=None)
+
+def current_deadline():
+    """
+    Return the active deadline.
+
+    Returns:
+        Deadline | None: The deadline of the current context, None if there is none.
+    """
+    return _current_deadline.get()
+
+@contextmanager
+def deadline_scope(deadline):
+    """
+    Make a deadline active for the requests sent in the current context.
+
+    The deadline follows the context into AsyncAPIClient's thread pool; threads started
+    otherwise do not inherit it.
+
+    Args:
+        deadline (Deadline | None): The deadline, None to run without one.
+
+    Yields:
+        Deadline | None: The deadline.
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)